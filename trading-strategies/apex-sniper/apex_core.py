@@ -0,0 +1,1866 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - NumPy Strategy Core
+Indicator math, signal logic and risk sizing without pandas
+
+Everything here works on NumPy arrays and imports only NumPy and the
+standard library, so worker processes and short-lived CLI runs start fast.
+The DataFrame entry points (analyze_market_data, generate_trading_signal,
+generate_signals, ...) live in the cl-futures-strategy.py adapter, which
+this module loads on first access to ``APEXSniperStrategy``.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import numpy as np
+from datetime import datetime
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass
+from enum import Enum
+
+import indicator_kernels as kernels
+from indicator_cache import IndicatorCache, SHARED_INDICATOR_CACHE
+from multi_timeframe import MultiTimeframeRollup
+from portfolio_risk import MonteCarloVaREngine
+from position_book import PositionBook
+from stage_timing import StageTimer, call_untimed
+from streaming_indicators import StreamingIndicatorEngine
+from trading_log import (EVENT_SIGNAL, EVENT_SIZING, TRADING_LOGGER, EventJournal,
+                         configure_trading_logging)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Trading logs go through a queue; handlers are attached by configure_trading_logging
+logger = logging.getLogger(TRADING_LOGGER)
+
+# Bars in the volume average that volume coherence is measured against
+VOLUME_COHERENCE_WINDOW = 10
+
+class SignalStrength(Enum):
+    """Signal strength classification for APEX Sniper entries"""
+    WEAK = 0.5
+    MODERATE = 0.65
+    STRONG = 0.75
+    APEX = 0.85
+
+class MarketRegime(Enum):
+    """Market regime classification for strategy adaptation"""
+    TRENDING_UP = "trending_up"
+    TRENDING_DOWN = "trending_down"
+    RANGE_BOUND = "range_bound"
+    HIGH_VOLATILITY = "high_volatility"
+    LOW_VOLATILITY = "low_volatility"
+
+# Integer codes used for regimes in columnar results
+REGIME_CODES = tuple(MarketRegime)
+
+@dataclass
+class TradingSignal:
+    """APEX Sniper trading signal structure"""
+    symbol: str
+    timestamp: datetime
+    signal_type: str  # 'BUY' or 'SELL'
+    signal_strength: float
+    quantum_probability: float
+    technical_confluence: int
+    entry_price: float
+    stop_loss: float
+    profit_targets: List[float]
+    position_size: int
+    risk_amount: float
+    confidence_level: float
+    market_regime: MarketRegime
+
+@dataclass
+class SignalFrame:
+    """
+    Columnar APEX Sniper signals for every bar of a history
+    
+    Each field is a NumPy array aligned with the input bars. ``signal_type``
+    holds +1 for BUY, -1 for SELL and 0 for HOLD; ``is_signal`` marks the bars
+    where generate_trading_signal would have emitted a TradingSignal.
+    """
+    timestamp: np.ndarray
+    signal_type: np.ndarray
+    technical_confluence: np.ndarray
+    quantum_probability: np.ndarray
+    entry_price: np.ndarray
+    stop_loss: np.ndarray
+    profit_targets: np.ndarray  # shape (bars, 3)
+    risk_reward_ratio: np.ndarray
+    is_signal: np.ndarray
+    market_regime: np.ndarray  # int8 index into REGIME_CODES
+    
+    def __len__(self) -> int:
+        return len(self.signal_type)
+    
+    def regime_at(self, index: int) -> MarketRegime:
+        """MarketRegime for one bar"""
+        return REGIME_CODES[self.market_regime[index]]
+    
+    @property
+    def signal_indices(self) -> np.ndarray:
+        """Bar positions where an entry signal fired"""
+        return np.flatnonzero(self.is_signal)
+    
+    def window(self, start: int, stop: int) -> 'SignalFrame':
+        """Bars [start, stop) as a SignalFrame of views, e.g. for one backtest fold"""
+        return SignalFrame(**{name: getattr(self, name)[start:stop]
+                              for name in self.__dataclass_fields__})
+    
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """Flatten into a DataFrame with one row per bar"""
+        import pandas as pd
+        
+        return pd.DataFrame({
+            'timestamp': self.timestamp,
+            'signal_type': np.select([self.signal_type > 0, self.signal_type < 0],
+                                     ['BUY', 'SELL'], 'HOLD'),
+            'technical_confluence': self.technical_confluence,
+            'quantum_probability': self.quantum_probability,
+            'entry_price': self.entry_price,
+            'stop_loss': self.stop_loss,
+            'target_1': self.profit_targets[:, 0],
+            'target_2': self.profit_targets[:, 1],
+            'target_3': self.profit_targets[:, 2],
+            'risk_reward_ratio': self.risk_reward_ratio,
+            'is_signal': self.is_signal,
+            'market_regime': np.array([r.value for r in REGIME_CODES])[self.market_regime]
+        })
+
+@dataclass(slots=True)
+class CompactTradingSignal:
+    """
+    TradingSignal without a per-instance __dict__
+    
+    Same fields as TradingSignal; profit targets are held as a tuple.
+    """
+    symbol: str
+    timestamp: datetime
+    signal_type: str
+    signal_strength: float
+    quantum_probability: float
+    technical_confluence: int
+    entry_price: float
+    stop_loss: float
+    profit_targets: Tuple[float, ...]
+    position_size: int
+    risk_amount: float
+    confidence_level: float
+    market_regime: MarketRegime
+    
+    @classmethod
+    def from_signal(cls, signal: TradingSignal) -> 'CompactTradingSignal':
+        return cls(signal.symbol, signal.timestamp, signal.signal_type, signal.signal_strength,
+                   signal.quantum_probability, signal.technical_confluence, signal.entry_price,
+                   signal.stop_loss, tuple(signal.profit_targets), signal.position_size,
+                   signal.risk_amount, signal.confidence_level, signal.market_regime)
+    
+    def to_signal(self) -> TradingSignal:
+        return TradingSignal(self.symbol, self.timestamp, self.signal_type, self.signal_strength,
+                             self.quantum_probability, self.technical_confluence, self.entry_price,
+                             self.stop_loss, list(self.profit_targets), self.position_size,
+                             self.risk_amount, self.confidence_level, self.market_regime)
+
+# Column name -> dtype for SignalBatch storage
+SIGNAL_BATCH_COLUMNS = {
+    'symbol': np.int16,           # index into SignalBatch.symbols
+    'timestamp': 'datetime64[ns]',
+    'signal_type': np.int8,       # +1 BUY / -1 SELL
+    'signal_strength': np.float64,
+    'quantum_probability': np.float64,
+    'technical_confluence': np.int16,
+    'entry_price': np.float64,
+    'stop_loss': np.float64,
+    'profit_targets': np.float64,  # shape (n, 3)
+    'position_size': np.int32,
+    'risk_amount': np.float64,
+    'confidence_level': np.float64,
+    'market_regime': np.int8      # index into REGIME_CODES
+}
+SIGNAL_BATCH_META = 'signals.json'
+
+@dataclass
+class SignalBatch:
+    """
+    Struct-of-arrays store for many TradingSignals
+    
+    One NumPy array per field, so a million signals cost ~100 bytes each
+    instead of a dataclass, a datetime, a list and an enum per signal.
+    ``save`` writes one .npy file per column and ``load`` memory-maps them
+    back without copying.
+    """
+    symbols: List[str]
+    symbol: np.ndarray
+    timestamp: np.ndarray
+    signal_type: np.ndarray
+    signal_strength: np.ndarray
+    quantum_probability: np.ndarray
+    technical_confluence: np.ndarray
+    entry_price: np.ndarray
+    stop_loss: np.ndarray
+    profit_targets: np.ndarray  # shape (n, 3)
+    position_size: np.ndarray
+    risk_amount: np.ndarray
+    confidence_level: np.ndarray
+    market_regime: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.signal_type)
+    
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, column).nbytes for column in SIGNAL_BATCH_COLUMNS)
+    
+    @classmethod
+    def from_signals(cls, signals: List[TradingSignal]) -> 'SignalBatch':
+        """Pack TradingSignal (or CompactTradingSignal) objects into columns"""
+        symbols: Dict[str, int] = {}
+        symbol_codes = [symbols.setdefault(signal.symbol, len(symbols)) for signal in signals]
+        regime_codes = {regime: code for code, regime in enumerate(REGIME_CODES)}
+        
+        def column(name: str, values) -> np.ndarray:
+            return np.array(values, dtype=SIGNAL_BATCH_COLUMNS[name])
+        
+        targets = np.full((len(signals), 3), np.nan)
+        for i, signal in enumerate(signals):
+            row = list(signal.profit_targets)[:3]
+            targets[i, :len(row)] = row
+        
+        return cls(
+            symbols=list(symbols),
+            symbol=column('symbol', symbol_codes),
+            timestamp=np.array([_datetime64(s.timestamp) for s in signals], dtype='datetime64[ns]'),
+            signal_type=column('signal_type', [1 if s.signal_type == 'BUY' else -1 for s in signals]),
+            signal_strength=column('signal_strength', [s.signal_strength for s in signals]),
+            quantum_probability=column('quantum_probability', [s.quantum_probability for s in signals]),
+            technical_confluence=column('technical_confluence', [s.technical_confluence for s in signals]),
+            entry_price=column('entry_price', [s.entry_price for s in signals]),
+            stop_loss=column('stop_loss', [s.stop_loss for s in signals]),
+            profit_targets=targets,
+            position_size=column('position_size', [s.position_size for s in signals]),
+            risk_amount=column('risk_amount', [s.risk_amount for s in signals]),
+            confidence_level=column('confidence_level', [s.confidence_level for s in signals]),
+            market_regime=column('market_regime', [regime_codes[s.market_regime] for s in signals])
+        )
+    
+    @classmethod
+    def from_signal_frame(cls, frame: SignalFrame, symbol: str = '/CL',
+                          rows: Optional[np.ndarray] = None) -> 'SignalBatch':
+        """Entry bars of a SignalFrame (or the bars at ``rows``); sizing fields are left at zero"""
+        rows = frame.signal_indices if rows is None else rows
+        count = len(rows)
+        confluence = frame.technical_confluence[rows]
+        return cls(
+            symbols=[symbol],
+            symbol=np.zeros(count, dtype=np.int16),
+            timestamp=np.asarray(frame.timestamp[rows]).astype('datetime64[ns]'),
+            signal_type=frame.signal_type[rows].astype(np.int8),
+            signal_strength=frame.quantum_probability[rows].astype(np.float64),
+            quantum_probability=frame.quantum_probability[rows].astype(np.float64),
+            technical_confluence=confluence.astype(np.int16),
+            entry_price=frame.entry_price[rows].astype(np.float64),
+            stop_loss=frame.stop_loss[rows].astype(np.float64),
+            profit_targets=frame.profit_targets[rows].astype(np.float64),
+            position_size=np.zeros(count, dtype=np.int32),
+            risk_amount=np.zeros(count),
+            confidence_level=frame.quantum_probability[rows].astype(np.float64),
+            market_regime=frame.market_regime[rows].astype(np.int8)
+        )
+    
+    def signal_at(self, index: int) -> TradingSignal:
+        """Materialize one row as a TradingSignal"""
+        targets = self.profit_targets[index]
+        return TradingSignal(
+            symbol=self.symbols[self.symbol[index]],
+            timestamp=_to_datetime(self.timestamp[index]),
+            signal_type='BUY' if self.signal_type[index] > 0 else 'SELL',
+            signal_strength=float(self.signal_strength[index]),
+            quantum_probability=float(self.quantum_probability[index]),
+            technical_confluence=int(self.technical_confluence[index]),
+            entry_price=float(self.entry_price[index]),
+            stop_loss=float(self.stop_loss[index]),
+            profit_targets=[float(t) for t in targets[~np.isnan(targets)]],
+            position_size=int(self.position_size[index]),
+            risk_amount=float(self.risk_amount[index]),
+            confidence_level=float(self.confidence_level[index]),
+            market_regime=REGIME_CODES[self.market_regime[index]]
+        )
+    
+    def to_signals(self) -> List[TradingSignal]:
+        return [self.signal_at(i) for i in range(len(self))]
+    
+    def save(self, path: str) -> None:
+        """Write one .npy file per column plus a small JSON header"""
+        os.makedirs(path, exist_ok=True)
+        for column in SIGNAL_BATCH_COLUMNS:
+            np.save(os.path.join(path, f"{column}.npy"), np.ascontiguousarray(getattr(self, column)))
+        with open(os.path.join(path, SIGNAL_BATCH_META), 'w') as handle:
+            json.dump({'symbols': self.symbols, 'count': len(self),
+                       'regimes': [regime.value for regime in REGIME_CODES]}, handle, indent=2)
+    
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'SignalBatch':
+        """Open a saved batch; with ``mmap`` the columns are read-only memory maps"""
+        with open(os.path.join(path, SIGNAL_BATCH_META)) as handle:
+            meta = json.load(handle)
+        if meta['regimes'] != [regime.value for regime in REGIME_CODES]:
+            raise ValueError(f"Signal batch at {path} was written with different regime codes")
+        mode = 'r' if mmap else None
+        columns = {column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode=mode)
+                   for column in SIGNAL_BATCH_COLUMNS}
+        return cls(symbols=meta['symbols'], **columns)
+
+@dataclass(frozen=True)
+class ContractSpec:
+    """Exchange contract specification used for position sizing"""
+    symbol: str
+    tick_size: float
+    tick_value: float
+    margin: float
+    
+    def risk_amount(self, contracts: int, stop_distance: float) -> float:
+        """Dollar loss of ``contracts`` stopped out ``stop_distance`` price points away"""
+        return contracts * stop_distance / self.tick_size * self.tick_value
+
+# Indicative specs; margins are approximate exchange initial margins
+CONTRACT_SPECS = {
+    '/CL': ContractSpec('/CL', 0.01, 10.0, 5000.0),
+    '/QM': ContractSpec('/QM', 0.025, 12.5, 2500.0),
+    '/BZ': ContractSpec('/BZ', 0.01, 10.0, 5000.0),
+    '/NG': ContractSpec('/NG', 0.001, 10.0, 4000.0),
+    '/RB': ContractSpec('/RB', 0.0001, 4.2, 6000.0),
+    '/HO': ContractSpec('/HO', 0.0001, 4.2, 6000.0),
+    '/ES': ContractSpec('/ES', 0.25, 12.5, 12000.0),
+    '/MES': ContractSpec('/MES', 0.25, 1.25, 1200.0),
+    '/NQ': ContractSpec('/NQ', 0.25, 5.0, 17000.0),
+    '/YM': ContractSpec('/YM', 1.0, 5.0, 8000.0),
+    '/RTY': ContractSpec('/RTY', 0.1, 5.0, 6000.0)
+}
+
+def get_contract_spec(symbol: str) -> ContractSpec:
+    """Contract specification for a symbol; unknown symbols raise KeyError"""
+    try:
+        return CONTRACT_SPECS[symbol]
+    except KeyError:
+        raise KeyError(f"No contract specification for {symbol}") from None
+
+@dataclass
+class MultiSymbolBars:
+    """
+    OHLCV for many instruments as aligned (bars x symbols) float64 arrays
+    
+    Column j of every price array belongs to ``symbols[j]``; rows share the
+    ``timestamp`` index.
+    """
+    symbols: List[str]
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    @classmethod
+    def from_frames(cls, frames: Dict[str, 'pd.DataFrame']) -> 'MultiSymbolBars':
+        """
+        Align per-symbol OHLCV DataFrames on their common timestamps
+        
+        Frames are indexed by their 'timestamp' column when present, otherwise
+        by their index; only timestamps present for every symbol are kept.
+        """
+        symbols = list(frames)
+        indexed = {
+            symbol: frame.set_index('timestamp') if 'timestamp' in frame else frame
+            for symbol, frame in frames.items()
+        }
+        common = None
+        for frame in indexed.values():
+            common = frame.index if common is None else common.intersection(frame.index)
+        common = common.sort_values()
+        
+        def stack(column: str) -> np.ndarray:
+            return np.column_stack([
+                indexed[symbol][column].reindex(common).to_numpy(dtype=np.float64)
+                for symbol in symbols
+            ])
+        
+        return cls(symbols=symbols, timestamp=common.to_numpy(),
+                   open=stack('open'), high=stack('high'), low=stack('low'),
+                   close=stack('close'), volume=stack('volume'))
+
+# Position size multiplier per market regime
+REGIME_SIZE_MULTIPLIERS = {
+    MarketRegime.TRENDING_UP: 1.2,
+    MarketRegime.TRENDING_DOWN: 1.2,
+    MarketRegime.RANGE_BOUND: 0.8,
+    MarketRegime.HIGH_VOLATILITY: 0.7,
+    MarketRegime.LOW_VOLATILITY: 1.1
+}
+# The same multipliers indexed by regime code (see REGIME_CODES)
+REGIME_SIZE_MULTIPLIER_CODES = np.array([REGIME_SIZE_MULTIPLIERS.get(regime, 1.0) for regime in REGIME_CODES])
+
+class QuantumRiskManager:
+    """
+    Quantum-enhanced risk management for family office operations
+    Implements APEX Sniper risk control protocols
+    """
+    
+    def __init__(self, family_office_capital: float, seed: Optional[int] = None):
+        self.total_capital = family_office_capital
+        self.max_risk_per_trade = 0.02  # 2% per trade
+        self.max_portfolio_risk = 0.10  # 10% total portfolio risk
+        self.max_daily_risk = 0.05      # 5% daily risk limit
+        
+        # Performance tracking
+        self.daily_pnl = 0.0
+        self.position_book = PositionBook()
+        self.risk_metrics = {
+            'current_portfolio_risk': 0.0,
+            'daily_risk_used': 0.0,
+            'correlation_risk': 0.0
+        }
+        
+        # Optional binary journal of sizing decisions
+        self.journal: Optional[EventJournal] = None
+        
+        # Monte Carlo VaR; pre-trade checks are skipped until a risk model is set
+        self.risk_engine = MonteCarloVaREngine(paths=100_000, confidence=0.99, horizon_days=1.0, seed=seed)
+    
+    def set_risk_model(self, volatilities: Dict[str, float],
+                       correlations: Optional['pd.DataFrame'] = None) -> None:
+        """
+        Install daily return volatilities and correlations per symbol
+        
+        Args:
+            volatilities: Daily return standard deviation per symbol
+            correlations: Symbol-labelled correlation matrix (identity if omitted)
+        """
+        self.risk_engine.set_model(volatilities, correlations)
+    
+    @property
+    def open_positions(self) -> Dict[str, Dict]:
+        """Net contracts (+ long / - short) and mark price per symbol"""
+        return self.position_book.net_positions()
+    
+    def record_fill(self, signal: TradingSignal, contracts: int,
+                    fill_price: Optional[float] = None, strategy: str = 'apex_sniper') -> int:
+        """
+        Book an executed entry for a signal
+        
+        Returns:
+            int: Position id for close_position
+        """
+        spec = get_contract_spec(signal.symbol)
+        direction = 1 if signal.signal_type == 'BUY' else -1
+        return self.position_book.fill(
+            signal.symbol, direction, contracts,
+            signal.entry_price if fill_price is None else fill_price,
+            signal.stop_loss, regime=signal.market_regime, strategy=strategy,
+            margin_per_contract=spec.margin, point_value=spec.tick_value / spec.tick_size
+        )
+    
+    def close_position(self, position_id: int, price: float, contracts: Optional[int] = None) -> float:
+        """Close all or part of a booked position; realized P&L feeds daily_pnl"""
+        pnl = self.position_book.close(position_id, price, contracts)
+        self.daily_pnl += pnl
+        return pnl
+    
+    def _position_exposures(self) -> Dict[str, float]:
+        """Signed dollar exposure per symbol of the open positions"""
+        return self.position_book.symbol_exposures()
+    
+    def calculate_portfolio_var(self) -> Dict:
+        """
+        Monte Carlo VaR/CVaR of the open positions over the engine horizon
+        
+        Updates risk_metrics['current_portfolio_risk'] (VaR as a fraction of
+        capital), 'daily_risk_used' (VaR plus today's realized loss) and
+        'correlation_risk'.
+        
+        Returns:
+            Dict: var, cvar, var_pct, cvar_pct, correlation_risk, unmodelled symbols
+        """
+        engine = self.risk_engine
+        exposures = self._position_exposures()
+        result = {'var': 0.0, 'cvar': 0.0, 'var_pct': 0.0, 'cvar_pct': 0.0,
+                  'correlation_risk': 0.0, 'paths': engine.paths,
+                  'confidence': engine.confidence,
+                  'unmodelled': engine.unmodelled(exposures)}
+        
+        if engine.has_model and exposures:
+            exposure = engine.exposure_vector(exposures)
+            var, cvar = engine.var_cvar(engine.pnl_scenarios(exposure))
+            result.update({
+                'var': float(var),
+                'cvar': float(cvar),
+                'var_pct': float(var) / self.total_capital,
+                'cvar_pct': float(cvar) / self.total_capital,
+                'correlation_risk': engine.correlation_risk(exposure)
+            })
+        
+        if result['unmodelled']:
+            logger.warning("APEX Sniper VaR excludes positions without a risk model: %s", result['unmodelled'])
+        self.risk_metrics['current_portfolio_risk'] = result['var_pct']
+        self.risk_metrics['daily_risk_used'] = result['var_pct'] + max(-self.daily_pnl, 0.0) / self.total_capital
+        self.risk_metrics['correlation_risk'] = result['correlation_risk']
+        return result
+    
+    def _pre_trade_limit(self, signal: TradingSignal, contracts: int) -> int:
+        """
+        Largest size up to ``contracts`` that keeps the portfolio inside its limits
+        
+        Booked risk-at-stop and post-trade CVaR must stay within
+        max_portfolio_risk, margin within capital, and post-trade VaR plus
+        today's realized loss within max_daily_risk.
+        """
+        spec = get_contract_spec(signal.symbol)
+        direction = 1.0 if signal.signal_type == 'BUY' else -1.0
+        
+        # O(1) book checks: margin and risk-at-stop against the portfolio limit
+        portfolio_limit = self.total_capital * self.max_portfolio_risk
+        headroom = self.position_book.headroom(
+            signal.symbol, int(direction), signal.entry_price, signal.stop_loss,
+            spec.margin, spec.tick_value / spec.tick_size,
+            max_margin=self.total_capital, max_risk_at_stop=portfolio_limit
+        )
+        if headroom < contracts:
+            logger.info("APEX Sniper pre-trade book check: %s size cut from %d to %d contracts "
+                        "by margin/risk-at-stop limits", signal.symbol, contracts, headroom)
+            contracts = headroom
+        
+        engine = self.risk_engine
+        if contracts == 0 or not engine.has_model or engine.unmodelled([signal.symbol]):
+            return contracts
+        
+        exposure_per_contract = direction * signal.entry_price * spec.tick_value / spec.tick_size
+        
+        realized_loss = max(-self.daily_pnl, 0.0)
+        var_limit = self.total_capital * self.max_daily_risk - realized_loss
+        cvar_limit = portfolio_limit
+        base_exposure = engine.exposure_vector(self._position_exposures())
+        allowed = engine.max_contracts_within(base_exposure, signal.symbol, exposure_per_contract,
+                                              contracts, var_limit, cvar_limit)
+        
+        if allowed < contracts:
+            logger.info("APEX Sniper pre-trade risk check: %s size cut from %d to %d contracts "
+                        "by portfolio VaR limits", signal.symbol, contracts, allowed)
+        return allowed
+    
+    def calculate_position_size(self, signal: TradingSignal) -> int:
+        """
+        Quantum-optimized position sizing based on signal strength and market conditions
+        
+        Args:
+            signal: TradingSignal object with entry criteria
+            
+        Returns:
+            int: Optimal number of contracts to trade
+        """
+        # Base risk calculation
+        base_risk = self.total_capital * self.max_risk_per_trade
+        
+        # Signal confidence adjustment
+        confidence_multiplier = min(signal.confidence_level / 0.75, 1.5)
+        
+        # Quantum probability enhancement
+        quantum_multiplier = signal.quantum_probability
+        
+        # Market regime adjustment
+        regime_multiplier = self._get_regime_multiplier(signal.market_regime)
+        
+        # Volatility adjustment
+        stop_distance = abs(signal.entry_price - signal.stop_loss)
+        volatility_adjustment = 1.0 / (stop_distance / signal.entry_price + 0.01)
+        
+        # Calculate optimal risk amount
+        optimal_risk = (base_risk * confidence_multiplier * 
+                       quantum_multiplier * regime_multiplier * 
+                       volatility_adjustment)
+        
+        # Convert risk to position size using the contract's tick value (/CL = $10 per tick)
+        spec = get_contract_spec(signal.symbol)
+        ticks_at_risk = stop_distance / spec.tick_size  # Convert to ticks
+        max_contracts = int(optimal_risk / (ticks_at_risk * spec.tick_value))
+        
+        # Ensure position size limits
+        max_allowed = int(self.total_capital * 0.05 / spec.margin)  # 5% max of margin
+        final_position_size = min(max_contracts, max_allowed, 10)  # Cap at 10 contracts
+        
+        contracts = self._pre_trade_limit(signal, max(1, final_position_size))
+        
+        logger.info("Position sizing: Risk=$%.2f, Contracts=%d, Stop Distance=%.2f",
+                    optimal_risk, contracts, stop_distance)
+        if self.journal is not None:
+            _journal_event(self.journal, EVENT_SIZING, signal, contracts, optimal_risk, stop_distance)
+        
+        return contracts
+    
+    def calculate_position_sizes(self, batch: Union[SignalBatch, List[TradingSignal]]) -> np.ndarray:
+        """
+        calculate_position_size for many candidate signals at once
+        
+        The confidence, regime and volatility multipliers, the contract caps
+        and the book margin/risk-at-stop headroom are computed over the
+        columns of a SignalBatch; only candidates that reach the Monte Carlo
+        VaR check are sized one at a time. Each candidate is sized against
+        the current book, exactly as calculate_position_size would size it,
+        but nothing is logged or journaled per candidate.
+        
+        Args:
+            batch: SignalBatch, or TradingSignals to pack into one
+            
+        Returns:
+            np.ndarray: Contracts per candidate (int64), in batch order
+        """
+        if not isinstance(batch, SignalBatch):
+            batch = SignalBatch.from_signals(batch)
+        specs = [get_contract_spec(symbol) for symbol in batch.symbols]
+        tick_size = np.array([spec.tick_size for spec in specs])[batch.symbol]
+        tick_value = np.array([spec.tick_value for spec in specs])[batch.symbol]
+        margin = np.array([spec.margin for spec in specs])[batch.symbol]
+        entry_price = np.asarray(batch.entry_price, dtype=np.float64)
+        stop_loss = np.asarray(batch.stop_loss, dtype=np.float64)
+        
+        # Same operations in the same order as the scalar path, so results match bit for bit
+        base_risk = self.total_capital * self.max_risk_per_trade
+        confidence_multiplier = np.minimum(batch.confidence_level / 0.75, 1.5)
+        regime_multiplier = REGIME_SIZE_MULTIPLIER_CODES[batch.market_regime]
+        stop_distance = np.abs(entry_price - stop_loss)
+        volatility_adjustment = 1.0 / (stop_distance / entry_price + 0.01)
+        optimal_risk = (base_risk * confidence_multiplier *
+                        batch.quantum_probability * regime_multiplier *
+                        volatility_adjustment)
+        
+        ticks_at_risk = stop_distance / tick_size
+        if np.any(ticks_at_risk == 0):
+            raise ZeroDivisionError(f"Zero stop distance for candidates {np.flatnonzero(ticks_at_risk == 0)}")
+        max_contracts = np.trunc(optimal_risk / (ticks_at_risk * tick_value))
+        max_allowed = np.trunc(self.total_capital * 0.05 / margin)
+        contracts = np.maximum(np.minimum(np.minimum(max_contracts, max_allowed), 10), 1).astype(np.int64)
+        
+        # Book headroom, as in _pre_trade_limit
+        portfolio_limit = self.total_capital * self.max_portfolio_risk
+        point_value = tick_value / tick_size
+        headroom = self.position_book.headrooms(entry_price, stop_loss, margin, point_value,
+                                                max_margin=self.total_capital,
+                                                max_risk_at_stop=portfolio_limit)
+        book_cuts = int(np.count_nonzero(headroom < contracts))
+        contracts = np.minimum(contracts, headroom)
+        
+        var_cuts = 0
+        engine = self.risk_engine
+        if engine.has_model:
+            modelled = np.array([not engine.unmodelled([symbol]) for symbol in batch.symbols], dtype=bool)
+            candidates = np.flatnonzero((contracts > 0) & modelled[batch.symbol])
+            if len(candidates):
+                realized_loss = max(-self.daily_pnl, 0.0)
+                var_limit = self.total_capital * self.max_daily_risk - realized_loss
+                base_exposure = engine.exposure_vector(self._position_exposures())
+                for index in candidates:
+                    direction = 1.0 if batch.signal_type[index] > 0 else -1.0
+                    exposure_per_contract = (direction * float(entry_price[index]) *
+                                             float(tick_value[index]) / float(tick_size[index]))
+                    allowed = engine.max_contracts_within(
+                        base_exposure, batch.symbols[batch.symbol[index]], exposure_per_contract,
+                        int(contracts[index]), var_limit, portfolio_limit)
+                    var_cuts += allowed < contracts[index]
+                    contracts[index] = allowed
+        
+        logger.info("APEX Sniper batch sizing: %d candidates, %d cut by margin/risk-at-stop limits, "
+                    "%d by portfolio VaR limits", len(contracts), book_cuts, var_cuts)
+        return contracts
+    
+    def _get_regime_multiplier(self, regime: MarketRegime) -> float:
+        """Adjust position sizing based on market regime"""
+        return REGIME_SIZE_MULTIPLIERS.get(regime, 1.0)
+
+class APEXSniperCore:
+    """
+    APEX Sniper Philosophy Implementation for /CL Crude Oil Futures
+    NumPy-only core; APEXSniperStrategy adds the DataFrame entry points
+    """
+    
+    def __init__(self, capital: float = 1000000, indicators: Optional[Dict] = None,
+                 entry_criteria: Optional[Dict] = None,
+                 indicator_cache: Optional[IndicatorCache] = None,
+                 random_seed: Optional[int] = None,
+                 journal: Optional[EventJournal] = None,
+                 lookback: Optional[Dict] = None):
+        configure_trading_logging()
+        # VaR paths get a stream of their own so they never shift the quantum draws
+        risk_seed = (int(np.random.SeedSequence(random_seed).spawn(1)[0].generate_state(1)[0])
+                     if random_seed is not None else None)
+        self.risk_manager = QuantumRiskManager(capital, seed=risk_seed)
+        # Signals and sizing decisions are journaled when a journal is given
+        self.journal = journal
+        self.risk_manager.journal = journal
+        # Seed for reproducible quantum probability draws
+        self.rng = np.random.default_rng(random_seed)
+        # Shared across instances by default so one feed is computed once
+        self.indicator_cache = indicator_cache if indicator_cache is not None else SHARED_INDICATOR_CACHE
+        # Scratch buffers for kernel intermediates, reused across same-sized windows
+        self.kernel_workspace = kernels.KernelWorkspace()
+        self.quantum_fidelity = 0.8677  # Current quantum system fidelity
+        # Live-path (on_bar) entropy/coherence weighting towards recent bars; 1.0 matches the batch path
+        self.quantum_statistics_decay = 1.0
+        
+        # Technical indicator parameters
+        self.indicators = {
+            'momentum': {
+                'rsi_period': 14,
+                'rsi_method': 'sma',  # rolling-mean gains/losses; 'wilder' for Wilder smoothing
+                'rsi_overbought': 70,
+                'rsi_oversold': 30,
+                'macd_fast': 12,
+                'macd_slow': 26,
+                'macd_signal': 9
+            },
+            'trend': {
+                'ema_fast': 9,
+                'ema_medium': 21,
+                'ema_slow': 50,
+                'trend_threshold': 0.02
+            },
+            'volume': {
+                'vwap_period': 20,
+                'volume_ma_period': 10,
+                'volume_surge_threshold': 1.5
+            },
+            'volatility': {
+                'atr_period': 14,
+                'bb_period': 20,
+                'bb_std': 2.0,
+                'high_volatility_threshold': 0.03,  # ATR as a fraction of price
+                'low_volatility_threshold': 0.005
+            }
+        }
+        
+        # APEX Sniper entry criteria
+        self.entry_criteria = {
+            'min_confluence_signals': 3,
+            'min_quantum_probability': 0.75,
+            'min_signal_strength': SignalStrength.STRONG.value,
+            'min_risk_reward_ratio': 2.0
+        }
+        
+        # Caller overrides, e.g. from the parameter optimizer
+        for group, params in (indicators or {}).items():
+            self.indicators[group].update(params)
+        self.entry_criteria.update(entry_criteria or {})
+        
+        # History trimming for latest-bar analysis. With 'trim' on, analyze_bars
+        # reads only the last required_lookback() bars: rolling windows are exact
+        # and EMA truncation stays within 'ema_tolerance'. Market entropy has no
+        # warm-up limit and stays on running sums over the whole history.
+        self.lookback = {
+            'trim': False,
+            'ema_tolerance': 1e-6
+        }
+        self.lookback.update(lookback or {})
+        self._required_lookback: Dict[Tuple, int] = {}
+        # Running return sums behind trimmed market entropy, see _history_market_entropy
+        self._history_returns: Optional[Dict] = None
+        
+        # Live-loop indicator state, created on the first streamed bar
+        self.streaming_engine: Optional[StreamingIndicatorEngine] = None
+        # Higher-timeframe rollups, set up by enable_multi_timeframe
+        self.timeframes: Optional[MultiTimeframeRollup] = None
+        # Per-stage analysis latency histograms, set up by enable_stage_timing
+        self.stage_timer: Optional[StageTimer] = None
+    
+    def on_bar(self, open: float, high: float, low: float, close: float, volume: float,
+               timestamp=None) -> Dict:
+        """
+        Stream one completed bar through the incremental indicator engine
+        
+        Each call costs O(1) regardless of how many bars have been seen, and
+        the returned signals match the batch DataFrame path for the same history.
+        With multi-timeframe mode on, a bar given with its ``timestamp`` is also
+        rolled into the higher timeframes.
+        
+        Returns:
+            Dict: Momentum, trend, volume, volatility and regime signals for the latest bar
+        """
+        if self.streaming_engine is None:
+            self.streaming_engine = StreamingIndicatorEngine(
+                self.indicators, rsi_method=self.indicators['momentum']['rsi_method'],
+                statistics_decay=self.quantum_statistics_decay,
+                coherence_window=VOLUME_COHERENCE_WINDOW)
+        engine = self.streaming_engine
+        engine.on_bar(open, high, low, close, volume)
+        
+        signals = {
+            'timestamp': datetime.now(),
+            'momentum_signals': self._analyze_momentum_streaming(engine),
+            'trend_signals': self._analyze_trend_streaming(engine),
+            'volume_signals': self._build_volume_signals(engine.close, engine.volume,
+                                                         engine.vwap, engine.volume_ma),
+            'volatility_signals': self._build_volatility_signals(
+                engine.close, engine.atr, engine.bb_middle, engine.bb_upper,
+                engine.bb_lower, engine.price_range
+            ),
+            'market_regime': self._classify_regime(engine.close, engine.ema_fast,
+                                                   engine.ema_slow, engine.atr),
+            'quantum_enhancement': self._quantum_probability_streaming(engine)
+        }
+        if self.timeframes is not None:
+            if timestamp is not None:
+                self.update_timeframes(np.array([_datetime64(timestamp)]), np.array([open]),
+                                       np.array([high]), np.array([low]), np.array([close]),
+                                       np.array([volume]))
+            signals['timeframe_signals'] = self._analyze_timeframes(signals['trend_signals'])
+        
+        return signals
+    
+    def analyze_bars(self, close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                     volume: np.ndarray, bars_available: Optional[int] = None,
+                     close_history: Optional[np.ndarray] = None) -> Dict:
+        """
+        Comprehensive market analysis of the latest bar using APEX Sniper methodology
+        
+        Args:
+            close, high, low, volume: float64 bar arrays, oldest first
+            bars_available: Full history length when the caller already trimmed the arrays
+            close_history: Full close history when the caller already trimmed the
+                arrays; market entropy is measured over it
+            
+        Returns:
+            Dict: Complete market analysis results
+        """
+        bars_available = len(close) if bars_available is None else bars_available
+        # Trimming leaves entropy on the whole history (see _history_market_entropy)
+        price_entropy = None
+        if self.lookback['trim']:
+            price_entropy = self._history_market_entropy(close if close_history is None else close_history)
+        bars_used = self.analysis_window(len(close))
+        if bars_used < len(close):
+            close, high, low, volume = (values[-bars_used:] for values in (close, high, low, volume))
+        
+        stage = self.stage_timer.call if self.stage_timer is not None else call_untimed
+        # Stages share the cached indicators of these arrays; hash each array once
+        with self.indicator_cache.call_scope():
+            analysis = {
+                'timestamp': datetime.now(),
+                'momentum_signals': stage('momentum', self._analyze_momentum, close),
+                'trend_signals': stage('trend', self._analyze_trend, close),
+                'volume_signals': stage('volume', self._analyze_volume, close, high, low, volume),
+                'volatility_signals': stage('volatility', self._analyze_volatility, close, high, low),
+                'market_regime': stage('regime', self._identify_market_regime, close, high, low),
+                'quantum_enhancement': stage('quantum', self._quantum_probability_calculation, close, volume,
+                                             price_entropy),
+                'lookback': {
+                    'bars_available': bars_available,
+                    'bars_used': len(close),
+                    'ema_truncation_error': self.ema_truncation_error(len(close), bars_available)
+                }
+            }
+        if self.timeframes is not None:
+            analysis['timeframe_signals'] = self._analyze_timeframes(analysis['trend_signals'])
+        
+        return analysis
+    
+    def enable_stage_timing(self, dump_interval: Optional[float] = None) -> StageTimer:
+        """
+        Record per-stage latencies of analyze_bars (and analyze_market_data)
+        
+        Args:
+            dump_interval: Seconds between logged timing summaries, None for on-demand only
+            
+        Returns:
+            StageTimer: The histograms; see StageTimer.snapshot and StageTimer.dump
+        """
+        self.stage_timer = StageTimer(dump_interval=dump_interval)
+        return self.stage_timer
+    
+    def disable_stage_timing(self) -> Optional[StageTimer]:
+        """Stop timing; returns the timer so its histograms can still be read"""
+        timer, self.stage_timer = self.stage_timer, None
+        return timer
+    
+    def enable_multi_timeframe(self, timeframes: Optional[Dict[str, float]] = None) -> MultiTimeframeRollup:
+        """
+        Confirm signals against higher timeframes rolled up from the base bars
+        
+        Once enabled, every analysis carries 'timeframe_signals', and each
+        higher timeframe whose trend direction (from its last completed bar)
+        agrees with the base trend adds one to the confluence score.
+        
+        Args:
+            timeframes: Timeframe name -> bar length in seconds (default 4h and 1d)
+            
+        Returns:
+            MultiTimeframeRollup: The rollup fed by update_timeframes
+        """
+        self.timeframes = MultiTimeframeRollup(self.indicators, timeframes,
+                                               rsi_method=self.indicators['momentum']['rsi_method'])
+        return self.timeframes
+    
+    def update_timeframes(self, timestamps: np.ndarray, open: np.ndarray, high: np.ndarray,
+                          low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> int:
+        """Roll base bars not seen before into the higher timeframes; returns how many"""
+        if self.timeframes is None:
+            return 0
+        return self.timeframes.update(timestamps, open, high, low, close, volume)
+    
+    def _analyze_timeframes(self, trend_signals: Dict) -> Dict:
+        """Higher-timeframe trend signals and their agreement with the base trend"""
+        timeframe_trends = {
+            name: self._build_trend_signals(engine.close, engine.ema_fast,
+                                            engine.ema_medium, engine.ema_slow)
+            for name, engine in self.timeframes.engines().items()
+        }
+        direction = trend_signals['trend_direction']
+        agreement = 0 if direction == 'neutral' else sum(
+            1 for trend in timeframe_trends.values() if trend['trend_direction'] == direction)
+        
+        return {
+            'timeframes': timeframe_trends,
+            'agreement': agreement,
+            'confluence_score': agreement
+        }
+    
+    def analysis_window(self, bars_available: int) -> int:
+        """Bars analyze_bars reads from the end of a history of ``bars_available`` bars"""
+        if not self.lookback['trim']:
+            return bars_available
+        return min(bars_available, self.required_lookback())
+    
+    def required_lookback(self, tolerance: Optional[float] = None) -> int:
+        """
+        Shortest history that reproduces the latest-bar analysis within tolerance
+        
+        Rolling windows need their own length, plus one bar where a diff or
+        the previous MACD histogram is read. Exponential indicators need enough
+        bars that ema_truncation_error is at most ``tolerance`` (default:
+        lookback['ema_tolerance']).
+        
+        Returns:
+            int: Bar count, derived from self.indicators
+        """
+        tolerance = self.lookback['ema_tolerance'] if tolerance is None else tolerance
+        momentum = self.indicators['momentum']
+        trend = self.indicators['trend']
+        volume = self.indicators['volume']
+        volatility = self.indicators['volatility']
+        key = (tolerance, tuple(sorted(momentum.items())), tuple(sorted(trend.items())),
+               volume['vwap_period'], volume['volume_ma_period'],
+               volatility['atr_period'], volatility['bb_period'])
+        if key in self._required_lookback:
+            return self._required_lookback[key]
+        
+        windows = max(momentum['rsi_period'] + 1, volume['vwap_period'], volume['volume_ma_period'],
+                      volatility['atr_period'] + 1, volatility['bb_period'],
+                      VOLUME_COHERENCE_WINDOW)  # volume coherence average
+        
+        # Dropped weight of each trend EMA alone is d**bars, a lower bound for the search
+        spans = (trend['ema_fast'], trend['ema_medium'], trend['ema_slow'])
+        low = max(int(np.ceil(np.log(tolerance) / np.log1p(-2 / (span + 1)))) for span in spans) - 1
+        high = max(low + 1, 2)
+        while self.ema_truncation_error(high) > tolerance:
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.ema_truncation_error(middle) > tolerance:
+                low = middle
+            else:
+                high = middle
+        
+        bars = max(windows, high)
+        self._required_lookback[key] = bars
+        return bars
+    
+    def ema_truncation_error(self, bars_used: int, bars_available: Optional[int] = None) -> float:
+        """
+        Bound on the EMA error from analyzing only the last ``bars_used`` bars
+        
+        The bound is the share of EMA weight that falls on dropped bars; for
+        the MACD histogram it is accumulated through the signal line, and for
+        a Wilder RSI it is the weight left on the seed average. The absolute
+        error of an indicator is at most this times the largest gap between a
+        dropped input and the retained average.
+        
+        Args:
+            bars_used: Bars kept from the end of the history
+            bars_available: Full history length; None for unbounded history
+            
+        Returns:
+            float: Worst bound over the trend EMAs, MACD histogram and RSI; 0 when nothing is dropped
+        """
+        available = np.inf if bars_available is None else bars_available
+        if bars_used >= available:
+            return 0.0
+        momentum = self.indicators['momentum']
+        trend = self.indicators['trend']
+        
+        bound = max(_dropped_ema_weight(span, bars_used, available)
+                    for span in (trend['ema_fast'], trend['ema_medium'], trend['ema_slow']))
+        for lag in (0, 1):  # latest and previous MACD histogram
+            bound = max(bound, _macd_dropped_weight(momentum['macd_fast'], momentum['macd_slow'],
+                                                    momentum['macd_signal'], bars_used - lag,
+                                                    available - lag))
+        if momentum['rsi_method'] == 'wilder':
+            period = momentum['rsi_period']
+            bound = max(bound, (1 - 1 / period) ** max(bars_used - period, 0))
+        return float(bound)
+    
+    def truncation_error(self, close: np.ndarray, bars_used: Optional[int] = None) -> Dict[str, float]:
+        """
+        Measured latest-bar error of trimmed against full-history indicators
+        
+        A diagnostic for choosing lookback['ema_tolerance']: it computes both
+        versions from scratch, so its cost grows with the history.
+        
+        Args:
+            close: Full close history, oldest first
+            bars_used: Trimmed length (default: required_lookback())
+            
+        Returns:
+            Dict: Absolute error per EMA-based indicator plus the bound
+        """
+        bars_used = min(len(close), self.required_lookback() if bars_used is None else bars_used)
+        momentum = self.indicators['momentum']
+        trend = self.indicators['trend']
+        
+        def latest(values: np.ndarray) -> Dict[str, float]:
+            indicators = {name: kernels.ema(values, trend[name])[-1]
+                          for name in ('ema_fast', 'ema_medium', 'ema_slow')}
+            indicators['macd_histogram'] = kernels.macd(values, momentum['macd_fast'], momentum['macd_slow'],
+                                                        momentum['macd_signal'])[2][-1]
+            indicators['rsi'] = kernels.rsi(values, momentum['rsi_period'], momentum['rsi_method'])[-1]
+            return indicators
+        
+        full = latest(close)
+        trimmed = latest(close[len(close) - bars_used:])
+        errors = {name: float(abs(trimmed[name] - full[name])) for name in full}
+        errors['bound'] = self.ema_truncation_error(bars_used, len(close))
+        return errors
+    
+    def _analyze_momentum(self, close: np.ndarray) -> Dict:
+        """Momentum indicator analysis for APEX Sniper signals"""
+        params = self.indicators['momentum']
+        
+        rsi = self._rsi(close, params['rsi_period'], params['rsi_method'])
+        macd_histogram = self._macd_histogram(close, params['macd_fast'],
+                                              params['macd_slow'], params['macd_signal'])
+        
+        return self._build_momentum_signals(rsi[-1], macd_histogram[-1], macd_histogram[-2])
+    
+    def _analyze_momentum_streaming(self, engine: StreamingIndicatorEngine) -> Dict:
+        """Momentum signals from the incremental indicator engine"""
+        return self._build_momentum_signals(engine.rsi, engine.macd_histogram,
+                                            engine.previous_macd_histogram)
+    
+    def _build_momentum_signals(self, current_rsi: float, current_macd: float,
+                                previous_macd: float) -> Dict:
+        """Classify RSI and MACD histogram readings into momentum signals"""
+        momentum_signals = {
+            'rsi': current_rsi,
+            'rsi_signal': 'oversold' if current_rsi < 30 else 'overbought' if current_rsi > 70 else 'neutral',
+            'macd': current_macd,
+            'macd_signal': 'bullish' if current_macd > 0 and previous_macd < 0 else 
+                          'bearish' if current_macd < 0 and previous_macd > 0 else 'neutral',
+            'confluence_score': 0
+        }
+        
+        # Calculate confluence score
+        if momentum_signals['rsi_signal'] in ['oversold', 'overbought']:
+            momentum_signals['confluence_score'] += 1
+        if momentum_signals['macd_signal'] in ['bullish', 'bearish']:
+            momentum_signals['confluence_score'] += 1
+            
+        return momentum_signals
+    
+    def _analyze_trend(self, close: np.ndarray) -> Dict:
+        """Trend analysis using multiple EMAs and slope calculations"""
+        # EMA calculations
+        ema_fast = self._ema(close, self.indicators['trend']['ema_fast'])
+        ema_medium = self._ema(close, self.indicators['trend']['ema_medium'])
+        ema_slow = self._ema(close, self.indicators['trend']['ema_slow'])
+        
+        return self._build_trend_signals(close[-1], ema_fast[-1], ema_medium[-1], ema_slow[-1])
+    
+    def _analyze_trend_streaming(self, engine: StreamingIndicatorEngine) -> Dict:
+        """Trend signals from the incremental indicator engine"""
+        return self._build_trend_signals(engine.close, engine.ema_fast,
+                                         engine.ema_medium, engine.ema_slow)
+    
+    def _build_trend_signals(self, current_close: float, ema_fast: float,
+                             ema_medium: float, ema_slow: float) -> Dict:
+        """Classify EMA stack and price position into trend signals"""
+        # Trend strength calculation
+        trend_alignment = (ema_fast > ema_medium > ema_slow or
+                          ema_fast < ema_medium < ema_slow)
+        
+        # Price position relative to EMAs
+        price_above_emas = current_close > ema_fast > ema_medium
+        price_below_emas = current_close < ema_fast < ema_medium
+        
+        trend_signals = {
+            'ema_fast': ema_fast,
+            'ema_medium': ema_medium,
+            'ema_slow': ema_slow,
+            'trend_alignment': trend_alignment,
+            'trend_direction': 'bullish' if price_above_emas else 'bearish' if price_below_emas else 'neutral',
+            'trend_strength': abs(ema_fast - ema_slow) / current_close,
+            'confluence_score': 1 if trend_alignment else 0
+        }
+        
+        return trend_signals
+    
+    def _analyze_volume(self, close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                        volume: np.ndarray) -> Dict:
+        """Volume analysis: rolling VWAP and volume surge detection"""
+        columns = self._volume_arrays(close, high, low, volume)
+        return self._build_volume_signals(close[-1], volume[-1], columns['vwap'][-1],
+                                          columns['volume_ma'][-1])
+    
+    def _build_volume_signals(self, current_close: float, current_volume: float,
+                              vwap: float, volume_ma: float) -> Dict:
+        """Classify VWAP position and volume against its average"""
+        volume_ratio = current_volume / volume_ma if volume_ma > 0 else float('nan')
+        volume_surge = bool(volume_ratio > self.indicators['volume']['volume_surge_threshold'])
+        
+        return {
+            'vwap': vwap,
+            'price_vs_vwap': 'above' if current_close > vwap else 'below' if current_close < vwap else 'at',
+            'volume_ma': volume_ma,
+            'volume_ratio': volume_ratio,
+            'volume_surge': volume_surge,
+            'confluence_score': 1 if volume_surge else 0
+        }
+    
+    def _analyze_volatility(self, close: np.ndarray, high: np.ndarray, low: np.ndarray) -> Dict:
+        """Volatility analysis: ATR, Bollinger bands and band breakouts"""
+        columns = self._volatility_arrays(close, high, low)
+        return self._build_volatility_signals(
+            close[-1], columns['atr'][-1], columns['bb_middle'][-1], columns['bb_upper'][-1],
+            columns['bb_lower'][-1], columns['price_range'][-1]
+        )
+    
+    def _build_volatility_signals(self, current_close: float, atr: float, bb_middle: float,
+                                  bb_upper: float, bb_lower: float, price_range: float) -> Dict:
+        """Classify close against the Bollinger bands"""
+        bullish_breakout = bool(current_close > bb_upper)
+        bearish_breakout = bool(current_close < bb_lower)
+        
+        return {
+            'atr': atr,
+            'atr_percent': atr / current_close,
+            'bb_upper': bb_upper,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_lower,
+            'bb_width': (bb_upper - bb_lower) / bb_middle,
+            'price_range': price_range,
+            'breakout_signal': bullish_breakout or bearish_breakout,
+            'breakout_direction': 'bullish' if bullish_breakout else 'bearish' if bearish_breakout else 'none',
+            'confluence_score': 1 if bullish_breakout or bearish_breakout else 0
+        }
+    
+    def _identify_market_regime(self, close: np.ndarray, high: np.ndarray,
+                                low: np.ndarray) -> MarketRegime:
+        """Classify the latest bar's market regime from trend strength and ATR"""
+        atr = self._volatility_arrays(close, high, low)['atr']
+        return self._classify_regime(close[-1], self._ema(close, self.indicators['trend']['ema_fast'])[-1],
+                                     self._ema(close, self.indicators['trend']['ema_slow'])[-1], atr[-1])
+    
+    def _classify_regime(self, current_close: float, ema_fast: float, ema_slow: float,
+                         atr: float) -> MarketRegime:
+        """High volatility takes precedence, then trend, then quiet markets"""
+        volatility = self.indicators['volatility']
+        atr_percent = atr / current_close
+        trend_strength = (ema_fast - ema_slow) / current_close
+        
+        if atr_percent > volatility['high_volatility_threshold']:
+            return MarketRegime.HIGH_VOLATILITY
+        if trend_strength > self.indicators['trend']['trend_threshold']:
+            return MarketRegime.TRENDING_UP
+        if trend_strength < -self.indicators['trend']['trend_threshold']:
+            return MarketRegime.TRENDING_DOWN
+        if atr_percent < volatility['low_volatility_threshold']:
+            return MarketRegime.LOW_VOLATILITY
+        return MarketRegime.RANGE_BOUND
+    
+    def _quantum_probability_calculation(self, close: np.ndarray, volume: np.ndarray,
+                                         price_entropy: Optional[float] = None) -> Dict:
+        """
+        Quantum-enhanced probability calculation for APEX Sniper signals
+        Simulates quantum processing for market pattern recognition
+        """
+        # Quantum-inspired calculations (simulation of quantum processing)
+        if price_entropy is None:
+            price_entropy = self._calculate_market_entropy(close)
+        return self._build_quantum_metrics(price_entropy, self._calculate_volume_coherence(volume))
+    
+    def _quantum_probability_streaming(self, engine: StreamingIndicatorEngine) -> Dict:
+        """_quantum_probability_calculation from the engine's online return and volume statistics"""
+        return self._build_quantum_metrics(
+            self._build_market_entropy(engine.return_std, engine.return_count),
+            self._build_volume_coherence(engine.volume, engine.coherence_volume_ma)
+        )
+    
+    def _build_quantum_metrics(self, price_entropy: float, volume_coherence: float) -> Dict:
+        """Pattern fidelity and the quantum probability draw from entropy and coherence"""
+        pattern_fidelity = self.quantum_fidelity * (price_entropy + volume_coherence) / 2
+        
+        # Quantum probability enhancement
+        base_probability = self.rng.beta(2, 2)  # Base probability distribution
+        quantum_enhancement = pattern_fidelity * 0.3  # Quantum boost factor
+        final_probability = min(base_probability + quantum_enhancement, 0.95)
+        
+        quantum_metrics = {
+            'price_entropy': price_entropy,
+            'volume_coherence': volume_coherence,
+            'pattern_fidelity': pattern_fidelity,
+            'quantum_probability': final_probability,
+            'quantum_confidence': pattern_fidelity > 0.8,
+            'coherence_time': 14.2  # milliseconds
+        }
+        
+        return quantum_metrics
+    
+    def _calculate_market_entropy(self, prices: np.ndarray) -> float:
+        """Calculate market entropy for quantum analysis"""
+        returns = prices[1:] / prices[:-1] - 1
+        returns = returns[~np.isnan(returns)]
+        if len(returns) < 2:
+            return float('nan')
+        return self._build_market_entropy(float(returns.std(ddof=1)), len(returns))
+    
+    def _history_market_entropy(self, close_history: np.ndarray) -> float:
+        """
+        _calculate_market_entropy over a whole history from running return sums
+        
+        The sums carry over between calls: when the history extends the one
+        seen last time (same first close, same close at the last bar seen)
+        only the new bars are read, otherwise they are rebuilt from scratch.
+        """
+        state = self._history_returns
+        bars = len(close_history)
+        if (state is None or bars < state['bars'] or close_history[0] != state['first_close'] or
+                close_history[state['bars'] - 1] != state['last_close']):
+            state = self._history_returns = {'bars': 0, 'first_close': close_history[0], 'last_close': np.nan,
+                                             'count': 0, 'sum': 0.0, 'sum_squares': 0.0}
+        if bars > state['bars']:
+            prices = close_history[max(state['bars'] - 1, 0):]
+            returns = prices[1:] / prices[:-1] - 1
+            returns = returns[~np.isnan(returns)]
+            state['count'] += len(returns)
+            state['sum'] += float(returns.sum())
+            state['sum_squares'] += float(np.dot(returns, returns))
+            state['bars'] = bars
+            state['last_close'] = close_history[-1]
+        
+        count = state['count']
+        if count < 2:
+            return float('nan')
+        variance = (state['sum_squares'] - state['sum'] * state['sum'] / count) / (count - 1)
+        return self._build_market_entropy(float(np.sqrt(max(variance, 0.0))), count)
+    
+    def _build_market_entropy(self, return_std: float, return_count: float) -> float:
+        """Simplified entropy: return volatility scaled by sqrt(count), capped at 1"""
+        return min(abs(return_std * np.sqrt(return_count)), 1.0)
+    
+    def _calculate_volume_coherence(self, volume: np.ndarray) -> float:
+        """Calculate volume coherence for quantum analysis"""
+        window = VOLUME_COHERENCE_WINDOW
+        volume_ma = float(volume[-window:].mean()) if len(volume) >= window else float('nan')
+        return self._build_volume_coherence(volume[-1], volume_ma)
+    
+    def _build_volume_coherence(self, current_volume: float, volume_ma: float) -> float:
+        """1 minus the latest volume's relative distance from its average, clipped to [0, 1]"""
+        coherence = 1 - abs(current_volume - volume_ma) / volume_ma
+        return max(min(coherence, 1.0), 0.0)
+    
+    def generate_trading_signal_from_bars(self, close: np.ndarray, high: np.ndarray,
+                                          low: np.ndarray,
+                                          volume: np.ndarray) -> Optional[TradingSignal]:
+        """NumPy form of generate_trading_signal for the latest of the given bars"""
+        return self.evaluate_signal(self.analyze_bars(close, high, low, volume), close[-1])
+    
+    def evaluate_signal(self, analysis: Dict, current_price: float) -> Optional[TradingSignal]:
+        """
+        Apply the APEX Sniper entry criteria to a completed analysis
+        
+        Args:
+            analysis: Output of analyze_bars / analyze_market_data
+            current_price: Latest close
+            
+        Returns:
+            TradingSignal object if criteria met and the risk limits allow at
+            least one contract, None otherwise
+        """
+        # Calculate total confluence score
+        total_confluence = (analysis['momentum_signals']['confluence_score'] +
+                          analysis['trend_signals']['confluence_score'] +
+                          (1 if analysis['volume_signals'].get('volume_surge', False) else 0) +
+                          (1 if analysis['volatility_signals'].get('breakout_signal', False) else 0) +
+                          analysis.get('timeframe_signals', {}).get('confluence_score', 0))
+        
+        # Check APEX Sniper entry criteria
+        quantum_prob = analysis['quantum_enhancement']['quantum_probability']
+        
+        if (total_confluence >= self.entry_criteria['min_confluence_signals'] and
+            quantum_prob >= self.entry_criteria['min_quantum_probability']):
+            
+            current_atr = analysis['volatility_signals']['price_range']
+            
+            # Determine signal direction
+            signal_type = self._determine_signal_direction(analysis)
+            
+            if signal_type != 'HOLD':
+                # Calculate stop loss and profit targets
+                stop_loss, profit_targets = self._calculate_stops_and_targets(
+                    current_price, current_atr, signal_type
+                )
+                
+                # Risk/reward validation
+                risk_amount = abs(current_price - stop_loss)
+                reward_amount = abs(profit_targets[0] - current_price)
+                risk_reward_ratio = reward_amount / risk_amount if risk_amount > 0 else 0
+                
+                if risk_reward_ratio >= self.entry_criteria['min_risk_reward_ratio']:
+                    signal = TradingSignal(
+                        symbol='/CL',
+                        timestamp=datetime.now(),
+                        signal_type=signal_type,
+                        signal_strength=quantum_prob,
+                        quantum_probability=quantum_prob,
+                        technical_confluence=total_confluence,
+                        entry_price=current_price,
+                        stop_loss=stop_loss,
+                        profit_targets=profit_targets,
+                        position_size=0,  # Will be calculated by risk manager
+                        risk_amount=0,    # Will be calculated by risk manager
+                        confidence_level=quantum_prob,
+                        market_regime=analysis['market_regime']
+                    )
+                    
+                    # Calculate position size
+                    signal.position_size = self.risk_manager.calculate_position_size(signal)
+                    if signal.position_size == 0:
+                        # Risk limits leave no room for this trade: nothing to signal
+                        logger.info("APEX Sniper %s /CL at %.2f blocked by pre-trade risk limits",
+                                    signal_type, current_price)
+                        return None
+                    signal.risk_amount = get_contract_spec(signal.symbol).risk_amount(
+                        signal.position_size, risk_amount)
+                    
+                    logger.info("APEX Sniper Signal Generated: %s /CL at %.2f with %.3f quantum probability",
+                                signal_type, current_price, quantum_prob)
+                    if self.journal is not None:
+                        _journal_event(self.journal, EVENT_SIGNAL, signal, signal.position_size,
+                                       signal.risk_amount, abs(current_price - stop_loss))
+                    
+                    return signal
+        
+        return None
+    
+    def _determine_signal_direction(self, analysis: Dict) -> str:
+        """Determine BUY/SELL signal direction based on analysis"""
+        bullish_signals = 0
+        bearish_signals = 0
+        
+        # Momentum signals
+        if analysis['momentum_signals']['rsi_signal'] == 'oversold':
+            bullish_signals += 1
+        elif analysis['momentum_signals']['rsi_signal'] == 'overbought':
+            bearish_signals += 1
+            
+        if analysis['momentum_signals']['macd_signal'] == 'bullish':
+            bullish_signals += 1
+        elif analysis['momentum_signals']['macd_signal'] == 'bearish':
+            bearish_signals += 1
+        
+        # Trend signals
+        if analysis['trend_signals']['trend_direction'] == 'bullish':
+            bullish_signals += 2  # Weight trend more heavily
+        elif analysis['trend_signals']['trend_direction'] == 'bearish':
+            bearish_signals += 2
+        
+        # Quantum enhancement bias
+        if analysis['quantum_enhancement']['quantum_confidence']:
+            if bullish_signals > bearish_signals:
+                bullish_signals += 1
+            elif bearish_signals > bullish_signals:
+                bearish_signals += 1
+        
+        if bullish_signals > bearish_signals + 1:
+            return 'BUY'
+        elif bearish_signals > bullish_signals + 1:
+            return 'SELL'
+        else:
+            return 'HOLD'
+    
+    def _calculate_stops_and_targets(self, entry_price: float, atr: float, 
+                                   signal_type: str) -> Tuple[float, List[float]]:
+        """Calculate stop loss and profit target levels"""
+        atr_multiplier_stop = 1.5
+        atr_multiplier_target = [2.0, 3.0, 4.0]  # Multiple targets
+        
+        if signal_type == 'BUY':
+            stop_loss = entry_price - (atr * atr_multiplier_stop)
+            profit_targets = [entry_price + (atr * mult) for mult in atr_multiplier_target]
+        else:  # SELL
+            stop_loss = entry_price + (atr * atr_multiplier_stop)
+            profit_targets = [entry_price - (atr * mult) for mult in atr_multiplier_target]
+        
+        return stop_loss, profit_targets
+    
+    def generate_signal_frame(self, close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                              volume: np.ndarray,
+                              timestamps: Optional[np.ndarray] = None) -> SignalFrame:
+        """
+        Evaluate the entry logic for every bar of a history at once
+        
+        Indicator series are computed once over the full history and the
+        entry logic runs as NumPy array operations, replacing one call per prefix.
+        
+        Args:
+            close, high, low, volume: float64 bar arrays, oldest first
+            timestamps: Bar timestamps; bar positions if omitted
+            
+        Returns:
+            SignalFrame: Columnar signal results aligned with the bars
+        """
+        columns = self._signal_arrays(close, high, low, volume)
+        if timestamps is None:
+            timestamps = np.arange(len(close))
+        return SignalFrame(timestamp=timestamps, **columns)
+    
+    def quantum_probability_distribution(self, close: np.ndarray, volume: np.ndarray,
+                                         samples: int = 10000,
+                                         quantiles: Tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95),
+                                         seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Monte Carlo distribution of _quantum_probability_calculation for every bar
+        
+        The quantum probability is min(B + 0.3 * pattern_fidelity, 0.95) with
+        B ~ Beta(2, 2) independent of the bar. One sorted sample of B is
+        therefore shared by all bars (common random numbers): the mean and
+        the clearing probability are prefix-sum/binary-search lookups and the
+        quantiles shift the sample quantiles, so per-bar cost is O(log N).
+        
+        Args:
+            close, volume: float64 bar arrays, oldest first
+            samples: Monte Carlo draws of the Beta(2, 2) base probability
+            quantiles: Quantile levels to report
+            seed: Seed for a dedicated Generator; the strategy's RNG if omitted
+            
+        Returns:
+            Dict: Per-bar 'mean', 'quantiles' (bars x levels) and
+            'prob_clears_threshold' against min_quantum_probability
+        """
+        pattern_fidelity = self._pattern_fidelity_arrays(close, volume)['pattern_fidelity']
+        enhancement = pattern_fidelity * 0.3
+        cap = 0.95
+        
+        rng = np.random.default_rng(seed) if seed is not None else self.rng
+        base = np.sort(rng.beta(2, 2, size=samples))
+        prefix_sums = np.concatenate(([0.0], np.cumsum(base)))
+        
+        # Draws below cap - enhancement stay uncapped; the rest clip to the cap
+        uncapped = np.searchsorted(base, cap - enhancement, side='left')
+        mean = (prefix_sums[uncapped] + uncapped * enhancement + (samples - uncapped) * cap) / samples
+        
+        levels = np.asarray(quantiles, dtype=np.float64)
+        quantile_values = np.minimum(np.quantile(base, levels)[None, :] + enhancement[:, None], cap)
+        
+        threshold = self.entry_criteria['min_quantum_probability']
+        if threshold > cap:
+            prob_clears = np.zeros(len(close))
+        else:
+            prob_clears = (samples - np.searchsorted(base, threshold - enhancement, side='left')) / samples
+        
+        return {
+            'pattern_fidelity': pattern_fidelity,
+            'mean': mean,
+            'quantile_levels': levels,
+            'quantiles': quantile_values,
+            'prob_clears_threshold': prob_clears
+        }
+    
+    def generate_multi_symbol_signals(self, bars: MultiSymbolBars) -> List[TradingSignal]:
+        """
+        Run the APEX Sniper entry logic for every instrument in one pass
+        
+        Indicators are computed column-wise over the (bars x symbols) arrays;
+        signals are emitted for the latest bar of each symbol that meets the
+        entry criteria, sized with that symbol's contract specification.
+        Symbols the pre-trade risk limits size to zero are left out.
+        
+        Args:
+            bars: Aligned multi-instrument OHLCV arrays
+            
+        Returns:
+            List[TradingSignal]: Signals for the latest bar, one per qualifying symbol
+        """
+        columns = self._signal_arrays(bars.close, bars.high, bars.low, bars.volume)
+        latest = {name: values[-1] for name, values in columns.items()}
+        timestamp = _to_datetime(bars.timestamp[-1]) if len(bars.timestamp) else datetime.now()
+        
+        signals = []
+        for col in np.flatnonzero(latest['is_signal']):
+            symbol = bars.symbols[col]
+            quantum_prob = float(latest['quantum_probability'][col])
+            entry_price = float(latest['entry_price'][col])
+            stop_loss = float(latest['stop_loss'][col])
+            signal = TradingSignal(
+                symbol=symbol,
+                timestamp=timestamp,
+                signal_type='BUY' if latest['signal_type'][col] > 0 else 'SELL',
+                signal_strength=quantum_prob,
+                quantum_probability=quantum_prob,
+                technical_confluence=int(latest['technical_confluence'][col]),
+                entry_price=entry_price,
+                stop_loss=stop_loss,
+                profit_targets=latest['profit_targets'][col].tolist(),
+                position_size=0,
+                risk_amount=0,
+                confidence_level=quantum_prob,
+                market_regime=REGIME_CODES[latest['market_regime'][col]]
+            )
+            signal.position_size = self.risk_manager.calculate_position_size(signal)
+            if signal.position_size == 0:
+                logger.info("APEX Sniper %s %s at %.2f blocked by pre-trade risk limits",
+                            signal.signal_type, symbol, entry_price)
+                continue
+            signal.risk_amount = get_contract_spec(symbol).risk_amount(signal.position_size,
+                                                                      abs(entry_price - stop_loss))
+            signals.append(signal)
+        
+        return signals
+    
+    def _signal_arrays(self, close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                       volume: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Entry logic over bar-major arrays: 1-D for one symbol, 2-D (bars x symbols) for many
+        """
+        with self.indicator_cache.call_scope():
+            return self._entry_arrays(close, self._momentum_arrays(close), self._trend_arrays(close),
+                                      self._volume_arrays(close, high, low, volume),
+                                      self._volatility_arrays(close, high, low),
+                                      self._quantum_probability_arrays(close, volume))
+    
+    def _entry_arrays(self, close: np.ndarray, momentum: Dict[str, np.ndarray],
+                      trend: Dict[str, np.ndarray], volume_columns: Dict[str, np.ndarray],
+                      volatility_columns: Dict[str, np.ndarray],
+                      quantum: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """SignalFrame columns from the per-stage arrays: confluence, direction, levels, entry filter"""
+        total_confluence = (momentum['confluence_score'] + trend['confluence_score'] +
+                            volume_columns['volume_surge'] + volatility_columns['breakout_signal'])
+        quantum_prob = quantum['quantum_probability']
+        
+        direction = self._determine_signal_directions(momentum, trend, quantum)
+        stop_loss, profit_targets = self._calculate_stops_and_targets_arrays(
+            close, volatility_columns['price_range'], direction
+        )
+        
+        # Risk/reward validation
+        risk_amount = np.abs(close - stop_loss)
+        reward_amount = np.abs(profit_targets[..., 0] - close)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            risk_reward_ratio = np.where(risk_amount > 0, reward_amount / risk_amount, 0.0)
+        
+        is_signal = ((total_confluence >= self.entry_criteria['min_confluence_signals']) &
+                     (quantum_prob >= self.entry_criteria['min_quantum_probability']) &
+                     (direction != 0) &
+                     (risk_reward_ratio >= self.entry_criteria['min_risk_reward_ratio']))
+        
+        return {
+            'signal_type': direction,
+            'technical_confluence': total_confluence,
+            'quantum_probability': quantum_prob,
+            'entry_price': close,
+            'stop_loss': stop_loss,
+            'profit_targets': profit_targets,
+            'risk_reward_ratio': risk_reward_ratio,
+            'is_signal': is_signal,
+            'market_regime': self._regime_arrays(close, trend['ema_fast'], trend['ema_slow'],
+                                                 volatility_columns['atr'])
+        }
+    
+    def _momentum_arrays(self, close: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-bar RSI/MACD classifications matching _analyze_momentum"""
+        params = self.indicators['momentum']
+        
+        rsi = self._rsi(close, params['rsi_period'], params['rsi_method'])
+        histogram = self._macd_histogram(close, params['macd_fast'],
+                                         params['macd_slow'], params['macd_signal'])
+        previous = np.full_like(histogram, np.nan)
+        previous[1:] = histogram[:-1]
+        return self._momentum_columns(rsi, histogram, previous)
+    
+    def _momentum_columns(self, rsi: np.ndarray, histogram: np.ndarray,
+                          previous: np.ndarray) -> Dict[str, np.ndarray]:
+        """Momentum classifications from RSI and the latest/previous MACD histogram"""
+        oversold = rsi < 30
+        overbought = rsi > 70
+        macd_bullish = (histogram > 0) & (previous < 0)
+        macd_bearish = (histogram < 0) & (previous > 0)
+        
+        return {
+            'rsi': rsi,
+            'macd': histogram,
+            'oversold': oversold,
+            'overbought': overbought,
+            'macd_bullish': macd_bullish,
+            'macd_bearish': macd_bearish,
+            'confluence_score': ((oversold | overbought).astype(np.int64) +
+                                 (macd_bullish | macd_bearish))
+        }
+    
+    def _trend_arrays(self, close: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-bar EMA stack classifications matching _analyze_trend"""
+        params = self.indicators['trend']
+        ema_fast = self._ema(close, params['ema_fast'])
+        ema_medium = self._ema(close, params['ema_medium'])
+        ema_slow = self._ema(close, params['ema_slow'])
+        return self._trend_columns(close, ema_fast, ema_medium, ema_slow)
+    
+    def _trend_columns(self, close: np.ndarray, ema_fast: np.ndarray, ema_medium: np.ndarray,
+                       ema_slow: np.ndarray) -> Dict[str, np.ndarray]:
+        """EMA stack classifications"""
+        trend_alignment = (((ema_fast > ema_medium) & (ema_medium > ema_slow)) |
+                           ((ema_fast < ema_medium) & (ema_medium < ema_slow)))
+        
+        return {
+            'ema_fast': ema_fast,
+            'ema_medium': ema_medium,
+            'ema_slow': ema_slow,
+            'trend_alignment': trend_alignment,
+            'bullish': (close > ema_fast) & (ema_fast > ema_medium),
+            'bearish': (close < ema_fast) & (ema_fast < ema_medium),
+            'confluence_score': trend_alignment.astype(np.int64)
+        }
+    
+    def _quantum_probability_arrays(self, close: np.ndarray,
+                                    volume: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-bar _quantum_probability_calculation over expanding history"""
+        quantum = self._pattern_fidelity_arrays(close, volume)
+        base_probability = self.rng.beta(2, 2, size=close.shape)
+        quantum['quantum_probability'] = np.minimum(base_probability + quantum['pattern_fidelity'] * 0.3, 0.95)
+        return quantum
+    
+    def _quantum_columns(self, price_entropy: np.ndarray,
+                         volume_coherence: np.ndarray) -> Dict[str, np.ndarray]:
+        """Pattern fidelity from entropy and coherence"""
+        pattern_fidelity = self.quantum_fidelity * (price_entropy + volume_coherence) / 2
+        
+        return {
+            'price_entropy': price_entropy,
+            'volume_coherence': volume_coherence,
+            'pattern_fidelity': pattern_fidelity,
+            'quantum_confidence': pattern_fidelity > 0.8
+        }
+    
+    def _pattern_fidelity_arrays(self, close: np.ndarray,
+                                 volume: np.ndarray) -> Dict[str, np.ndarray]:
+        """Deterministic part of the quantum calculation: entropy, coherence, fidelity"""
+        # Market entropy: std of all returns so far, scaled by sqrt(count)
+        returns = np.zeros_like(close)
+        returns[1:] = close[1:] / close[:-1] - 1
+        count = np.arange(len(close), dtype=np.float64).reshape((-1,) + (1,) * (close.ndim - 1))
+        sum_returns = np.cumsum(returns, axis=0)
+        sum_squares = np.cumsum(returns * returns, axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = (sum_squares - sum_returns * sum_returns / count) / (count - 1)
+            price_entropy = np.minimum(np.abs(np.sqrt(np.maximum(variance, 0.0)) * np.sqrt(count)), 1.0)
+        price_entropy[:2] = np.nan
+        
+        # Volume coherence against the VOLUME_COHERENCE_WINDOW-bar average
+        volume_ma = kernels.rolling_mean(volume, VOLUME_COHERENCE_WINDOW, workspace=self.kernel_workspace)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_coherence = np.clip(1 - np.abs(volume - volume_ma) / volume_ma, 0.0, 1.0)
+        
+        return self._quantum_columns(price_entropy, volume_coherence)
+    
+    def _volume_arrays(self, close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                       volume: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-bar VWAP, volume average and surge flags matching _analyze_volume"""
+        params = self.indicators['volume']
+        workspace = self.kernel_workspace
+        typical_price = (high + low + close) / 3
+        volume_ma = kernels.rolling_mean(volume, params['volume_ma_period'], workspace=workspace)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vwap = (kernels.rolling_sum(typical_price * volume, params['vwap_period'], workspace=workspace) /
+                    kernels.rolling_sum(volume, params['vwap_period'], workspace=workspace))
+        return self._volume_columns(volume, vwap, volume_ma)
+    
+    def _volume_columns(self, volume: np.ndarray, vwap: np.ndarray,
+                        volume_ma: np.ndarray) -> Dict[str, np.ndarray]:
+        """Volume ratio and surge flags against the volume average"""
+        params = self.indicators['volume']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = np.where(volume_ma > 0, volume / volume_ma, np.nan)
+        
+        return {
+            'vwap': vwap,
+            'volume_ma': volume_ma,
+            'volume_ratio': volume_ratio,
+            'volume_surge': volume_ratio > params['volume_surge_threshold']
+        }
+    
+    def _volatility_arrays(self, close: np.ndarray, high: np.ndarray,
+                           low: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-bar ATR, Bollinger bands, price range and breakouts matching _analyze_volatility"""
+        params = self.indicators['volatility']
+        workspace = self.kernel_workspace
+        
+        previous_close = np.full_like(close, np.nan)
+        previous_close[1:] = close[:-1]
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous_close),
+                                                 np.abs(low - previous_close)))
+        atr = kernels.rolling_mean(true_range, params['atr_period'], workspace=workspace)
+        
+        bb_middle = kernels.rolling_mean(close, params['bb_period'], workspace=workspace)
+        bb_std = kernels.rolling_std(close, params['bb_period'], workspace=workspace)
+        return self._volatility_columns(close, atr, bb_middle, bb_std,
+                                        self._atr_range(high, low, params['atr_period']))
+    
+    def _volatility_columns(self, close: np.ndarray, atr: np.ndarray, bb_middle: np.ndarray,
+                            bb_std: np.ndarray, price_range: np.ndarray) -> Dict[str, np.ndarray]:
+        """Bollinger bands and breakout flags"""
+        params = self.indicators['volatility']
+        bb_upper = bb_middle + params['bb_std'] * bb_std
+        bb_lower = bb_middle - params['bb_std'] * bb_std
+        
+        return {
+            'atr': atr,
+            'bb_middle': bb_middle,
+            'bb_upper': bb_upper,
+            'bb_lower': bb_lower,
+            'price_range': price_range,
+            'breakout_signal': (close > bb_upper) | (close < bb_lower)
+        }
+    
+    def _regime_arrays(self, close: np.ndarray, ema_fast: np.ndarray, ema_slow: np.ndarray,
+                       atr: np.ndarray) -> np.ndarray:
+        """Vectorized _classify_regime as int8 indices into REGIME_CODES"""
+        volatility = self.indicators['volatility']
+        threshold = self.indicators['trend']['trend_threshold']
+        atr_percent = atr / close
+        trend_strength = (ema_fast - ema_slow) / close
+        
+        regimes = np.select(
+            [atr_percent > volatility['high_volatility_threshold'],
+             trend_strength > threshold,
+             trend_strength < -threshold,
+             atr_percent < volatility['low_volatility_threshold']],
+            [REGIME_CODES.index(MarketRegime.HIGH_VOLATILITY),
+             REGIME_CODES.index(MarketRegime.TRENDING_UP),
+             REGIME_CODES.index(MarketRegime.TRENDING_DOWN),
+             REGIME_CODES.index(MarketRegime.LOW_VOLATILITY)],
+            REGIME_CODES.index(MarketRegime.RANGE_BOUND)
+        )
+        return regimes.astype(np.int8)
+    
+    def _ema(self, close: np.ndarray, span: int) -> np.ndarray:
+        """Cached EMA of close, shared by the momentum and trend stages"""
+        return self.indicator_cache.get_or_compute(
+            close, 'ema', (span,), lambda: kernels.ema(close, span, workspace=self.kernel_workspace))
+    
+    def _rsi(self, close: np.ndarray, period: int, method: str = 'sma') -> np.ndarray:
+        """Cached RSI of close (see indicator_kernels.rsi); the leading diff counts as zero"""
+        return self.indicator_cache.get_or_compute(
+            close, 'rsi', (period, method),
+            lambda: kernels.rsi(close, period, method, workspace=self.kernel_workspace))
+    
+    def _macd_histogram(self, close: np.ndarray, fast: int, slow: int, signal: int) -> np.ndarray:
+        """Cached MACD histogram built on the cached fast/slow EMAs"""
+        def compute() -> np.ndarray:
+            macd_line = self._ema(close, fast) - self._ema(close, slow)
+            signal_line = kernels.ema(macd_line, signal,
+                                      out=self.kernel_workspace.buffer('macd_signal', macd_line.shape),
+                                      workspace=self.kernel_workspace)
+            return np.subtract(macd_line, signal_line, out=macd_line)
+        return self.indicator_cache.get_or_compute(close, 'macd_histogram',
+                                                   (fast, slow, signal), compute)
+    
+    def _atr_range(self, high: np.ndarray, low: np.ndarray, window: int) -> np.ndarray:
+        """Cached rolling high-low range used as ATR for stops and targets"""
+        rolling_high = self.indicator_cache.get_or_compute(high, 'rolling_max', (window,),
+                                                           lambda: kernels.rolling_max(high, window))
+        rolling_low = self.indicator_cache.get_or_compute(low, 'rolling_min', (window,),
+                                                          lambda: kernels.rolling_min(low, window))
+        return rolling_high - rolling_low
+    
+    def _determine_signal_directions(self, momentum: Dict[str, np.ndarray],
+                                     trend: Dict[str, np.ndarray],
+                                     quantum: Dict[str, np.ndarray]) -> np.ndarray:
+        """Vectorized _determine_signal_direction: +1 BUY, -1 SELL, 0 HOLD"""
+        bullish_signals = (momentum['oversold'].astype(np.int64) + momentum['macd_bullish'] +
+                           2 * trend['bullish'])
+        bearish_signals = (momentum['overbought'].astype(np.int64) + momentum['macd_bearish'] +
+                           2 * trend['bearish'])
+        
+        # Quantum enhancement bias toward the leading side
+        confident = quantum['quantum_confidence']
+        bullish_signals = bullish_signals + (confident & (bullish_signals > bearish_signals))
+        bearish_signals = bearish_signals + (confident & (bearish_signals > bullish_signals))
+        
+        return np.select([bullish_signals > bearish_signals + 1,
+                          bearish_signals > bullish_signals + 1],
+                         [1, -1], 0).astype(np.int8)
+    
+    def _calculate_stops_and_targets_arrays(self, entry_price: np.ndarray, atr: np.ndarray,
+                                            direction: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized _calculate_stops_and_targets; HOLD bars get NaN levels"""
+        atr_multiplier_stop = 1.5
+        atr_multiplier_target = np.array([2.0, 3.0, 4.0])
+        
+        side = np.where(direction != 0, direction, np.nan)
+        stop_loss = entry_price - side * atr * atr_multiplier_stop
+        profit_targets = entry_price[..., None] + (side * atr)[..., None] * atr_multiplier_target
+        
+        return stop_loss, profit_targets
+
+def _datetime64(value) -> np.datetime64:
+    """datetime / pandas Timestamp / None to datetime64[ns]"""
+    if value is None:
+        return np.datetime64('NaT', 'ns')
+    if hasattr(value, 'to_datetime64'):
+        return value.to_datetime64().astype('datetime64[ns]')
+    return np.datetime64(value, 'ns')
+
+def _to_datetime(value: np.datetime64) -> Optional[datetime]:
+    """datetime64 to a datetime (microsecond precision); NaT becomes None"""
+    value = np.datetime64(value, 'us')
+    return None if np.isnat(value) else value.item()
+
+def _journal_event(journal: EventJournal, event: int, signal: TradingSignal, contracts: int,
+                   risk_amount: float, stop_distance: float) -> None:
+    journal.record(event, signal.symbol, 1 if signal.signal_type == 'BUY' else -1,
+                   REGIME_CODES.index(signal.market_regime), signal.technical_confluence,
+                   signal.quantum_probability, signal.entry_price, signal.stop_loss,
+                   signal.profit_targets, contracts, risk_amount, stop_distance)
+
+def _dropped_ema_weight(span: int, bars_used, bars_available) -> np.ndarray:
+    """Share of an adjust=True EMA's weight on bars before the last ``bars_used`` of ``bars_available``"""
+    decay = 1 - 2 / (span + 1)
+    bars_used = np.asarray(bars_used, dtype=np.float64)
+    return np.maximum(decay ** bars_used - decay ** bars_available, 0.0) / (1 - decay ** bars_available)
+
+def _macd_dropped_weight(fast: int, slow: int, signal: int, bars_used: int, bars_available) -> float:
+    """Dropped-weight bound for the MACD histogram: line error, signal-weighted line error, signal truncation"""
+    if bars_used <= 0:
+        return 1.0
+    lags = np.arange(bars_used)
+    line = (_dropped_ema_weight(fast, bars_used - lags, bars_available - lags) +
+            _dropped_ema_weight(slow, bars_used - lags, bars_available - lags))
+    weights = (1 - 2 / (signal + 1)) ** lags
+    return float(line[0] + weights @ line / weights.sum() +
+                 _dropped_ema_weight(signal, bars_used, bars_available))
+
+def __getattr__(name: str):
+    """Load the DataFrame adapter on first access to APEXSniperStrategy"""
+    if name == 'APEXSniperStrategy':
+        from strategy_loader import load_strategy_module
+        return load_strategy_module().APEXSniperStrategy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Vectorized /CL Backtesting Engine
+Intrabar stop/target resolution over the high/low columns
+
+Trades come from APEXSniperStrategy.generate_signals(). For every trade the
+first stop or target touch is located with array operations over a window of
+future bars, the 3-target scale-out from _calculate_stops_and_targets is
+applied leg by leg, and contracts are sized by QuantumRiskManager.
+run_chunked does the same over a history streamed from disk in chunks.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from chunked_signals import ChunkedSignalGenerator, chunk_arrays
+from strategy_loader import load_strategy_module
+from trading_log import TRADING_LOGGER
+
+logger = logging.getLogger(TRADING_LOGGER)
+
+_strategy = load_strategy_module()
+APEXSniperStrategy = _strategy.APEXSniperStrategy
+QuantumRiskManager = _strategy.QuantumRiskManager
+SignalBatch = _strategy.SignalBatch
+SignalFrame = _strategy.SignalFrame
+
+# /CL: $10 per 0.01 tick, i.e. $1,000 per full point
+CL_POINT_VALUE = 1000.0
+
+EXIT_STOP = 0
+EXIT_TARGET = 1
+EXIT_TIME = 2
+
+
+@dataclass
+class BacktestResult:
+    """Trade list and performance summary for one backtest run"""
+    trades: pd.DataFrame
+    equity_curve: np.ndarray
+    total_pnl: float
+    max_drawdown: float
+    max_drawdown_pct: float
+    win_rate: float
+    bars_processed: int
+    elapsed_seconds: float
+
+    @property
+    def num_trades(self) -> int:
+        return len(self.trades)
+
+    @property
+    def trades_per_second(self) -> float:
+        return self.num_trades / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def bars_per_second(self) -> float:
+        return self.bars_processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> Dict:
+        return {
+            'num_trades': self.num_trades,
+            'total_pnl': self.total_pnl,
+            'max_drawdown': self.max_drawdown,
+            'max_drawdown_pct': self.max_drawdown_pct,
+            'win_rate': self.win_rate,
+            'bars_processed': self.bars_processed,
+            'elapsed_seconds': self.elapsed_seconds,
+            'trades_per_second': self.trades_per_second,
+            'bars_per_second': self.bars_per_second
+        }
+
+
+def _first_true(mask: np.ndarray, default: int) -> np.ndarray:
+    """Column offset of the first True per row, ``default`` where none"""
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), default)
+
+
+def _concatenate_pending(pending, chunk):
+    """Append a chunk's high, low, close and SignalFrame to the unresolved bars"""
+    *bars, signals = pending
+    *chunk_bars, chunk_signals = chunk
+    frame = SignalFrame(**{name: np.concatenate((getattr(signals, name), getattr(chunk_signals, name)))
+                           for name in SignalFrame.__dataclass_fields__})
+    return (*(np.concatenate(pair) for pair in zip(bars, chunk_bars)), frame)
+
+
+def _flat_after(columns: Dict[str, np.ndarray], flat_after: int) -> int:
+    """Bar by which every trade so far has exited"""
+    exits = columns['exit_index']
+    return max(flat_after, int(exits.max())) if len(exits) else flat_after
+
+
+def _split_contracts(contracts: np.ndarray, legs: int = 3) -> np.ndarray:
+    """Split each position into near-equal scale-out legs, front-loaded"""
+    base = contracts[:, None] // legs
+    remainder = contracts[:, None] % legs
+    return base + (np.arange(legs)[None, :] < remainder)
+
+
+class VectorizedBacktester:
+    """
+    Vectorized APEX Sniper backtester for /CL futures
+
+    Each trade enters at the signal bar's close and is tracked for at most
+    ``max_holding_bars`` following bars. Every scale-out leg exits at the
+    first touch of either the stop or its own target; legs still open at the
+    horizon (or end of data) exit at that bar's close. When one bar touches
+    both stop and target, the stop is assumed first unless
+    ``stop_first_on_ambiguous`` is False.
+    """
+
+    def __init__(self, strategy: Optional[APEXSniperStrategy] = None,
+                 max_holding_bars: int = 1440,
+                 stop_first_on_ambiguous: bool = True,
+                 allow_overlapping_trades: bool = False,
+                 commission_per_contract: float = 0.0,
+                 point_value: float = CL_POINT_VALUE,
+                 chunk_size: int = 4096):
+        self.strategy = strategy or APEXSniperStrategy()
+        self.risk_manager: QuantumRiskManager = self.strategy.risk_manager
+        self.max_holding_bars = max_holding_bars
+        self.stop_first_on_ambiguous = stop_first_on_ambiguous
+        self.allow_overlapping_trades = allow_overlapping_trades
+        self.commission_per_contract = commission_per_contract
+        self.point_value = point_value
+        self.chunk_size = chunk_size
+
+    def run(self, ohlcv_data: pd.DataFrame, signals: Optional[SignalFrame] = None) -> BacktestResult:
+        """
+        Backtest APEX Sniper signals over an OHLCV history
+
+        Args:
+            ohlcv_data: DataFrame with OHLCV data for /CL futures
+            signals: Precomputed SignalFrame; generated from ohlcv_data if omitted
+
+        Returns:
+            BacktestResult: Trades, equity curve and throughput statistics
+        """
+        started = time.perf_counter()
+        if signals is None:
+            signals = self.strategy.generate_signals(ohlcv_data)
+
+        high = ohlcv_data['high'].to_numpy(dtype=np.float64)
+        low = ohlcv_data['low'].to_numpy(dtype=np.float64)
+        close = ohlcv_data['close'].to_numpy(dtype=np.float64)
+        n = len(close)
+
+        # A signal on the final bar has no future bars to trade against
+        entries = signals.signal_indices
+        entries = entries[entries < n - 1]
+
+        columns = self._trade_columns(high, low, close, signals, entries)
+        if signals.timestamp is not None and len(signals.timestamp) == n:
+            columns['entry_time'] = signals.timestamp[columns['entry_index']]
+            columns['exit_time'] = signals.timestamp[columns['exit_index']]
+        return self._result(columns, n, started)
+
+    def run_chunked(self, chunks: Iterable) -> BacktestResult:
+        """
+        Backtest a history streamed in chunks, without holding it in memory
+
+        Signals come from ChunkedSignalGenerator. Only bars from the oldest
+        unresolved entry onward are kept: an entry is resolved once
+        ``max_holding_bars`` later bars have arrived (or at the end of data),
+        so memory is bounded by chunk size plus horizon and the trades match
+        run() on the whole history.
+
+        Args:
+            chunks: Consecutive pieces of the history, oldest first: OHLCV
+                DataFrames or BarStore.iter_chunks() slices
+
+        Returns:
+            BacktestResult: Trades with positions into the whole history
+        """
+        started = time.perf_counter()
+        generator = ChunkedSignalGenerator(self.strategy)
+        pending = None  # high, low, close and SignalFrame from bar ``offset`` onward
+        offset = 0
+        flat_after = -1
+        trades: List[Dict[str, np.ndarray]] = []
+
+        for chunk in chunks:
+            timestamps, close, high, low, volume = chunk_arrays(chunk)
+            chunk_signals = generator.process(close, high, low, volume, timestamps=timestamps)
+            if pending is None:
+                pending = (high, low, close, chunk_signals)
+            else:
+                pending = _concatenate_pending(pending, (high, low, close, chunk_signals))
+
+            # Entries with a full horizon of later bars cannot change any more
+            resolved = len(pending[2]) - self.max_holding_bars
+            if resolved > 0:
+                trades.append(self._pending_trades(pending, resolved, offset, flat_after))
+                flat_after = _flat_after(trades[-1], flat_after)
+                pending = (pending[0][resolved:], pending[1][resolved:], pending[2][resolved:],
+                           pending[3].window(resolved, len(pending[3])))
+                offset += resolved
+
+        if pending is None:
+            raise ValueError("No bars to backtest")
+        # As in run(), a signal on the last bar has no bar to trade in
+        trades.append(self._pending_trades(pending, len(pending[2]) - 1, offset, flat_after))
+        columns = {name: np.concatenate([batch[name] for batch in trades]) for name in trades[-1]}
+        return self._result(columns, generator.bars_processed, started)
+
+    def _pending_trades(self, pending, stop: int, offset: int, flat_after: int) -> Dict[str, np.ndarray]:
+        """Trade columns for entries before buffer row ``stop``, positioned in the whole history"""
+        high, low, close, signals = pending
+        entries = signals.signal_indices
+        columns = self._trade_columns(high, low, close, signals, entries[entries < stop],
+                                      flat_after - offset)
+        columns['entry_time'] = signals.timestamp[columns['entry_index']]
+        columns['exit_time'] = signals.timestamp[columns['exit_index']]
+        columns['entry_index'] = columns['entry_index'] + offset
+        columns['exit_index'] = columns['exit_index'] + offset
+        return columns
+
+    def _trade_columns(self, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       signals: SignalFrame, entries: np.ndarray,
+                       flat_after: int = -1) -> Dict[str, np.ndarray]:
+        """
+        Resolve, select and size the trades entered at ``entries``
+
+        Bar positions are relative to the arrays given; ``flat_after`` is the
+        bar by which an earlier position is flat (see _select_trades).
+        """
+        direction = signals.signal_type[entries].astype(np.float64)
+        entry_price = signals.entry_price[entries]
+        stop_loss = signals.stop_loss[entries]
+        targets = signals.profit_targets[entries]
+
+        exit_offset, exit_price, exit_reason = self._resolve_exits(
+            high, low, close, entries, direction, stop_loss, targets
+        )
+
+        taken = self._select_trades(entries, exit_offset.max(axis=1), flat_after)
+        entries = entries[taken]
+        direction, entry_price, stop_loss, targets = (
+            direction[taken], entry_price[taken], stop_loss[taken], targets[taken]
+        )
+        exit_offset, exit_price, exit_reason = exit_offset[taken], exit_price[taken], exit_reason[taken]
+
+        contracts = self._size_positions(signals, entries)
+        leg_contracts = _split_contracts(contracts)
+
+        leg_pnl = ((exit_price - entry_price[:, None]) * direction[:, None] *
+                   leg_contracts * self.point_value)
+        pnl = leg_pnl.sum(axis=1) - contracts * self.commission_per_contract * 2
+
+        return {
+            'entry_index': entries,
+            'exit_index': entries + 1 + exit_offset.max(axis=1),
+            'signal_type': np.where(direction > 0, 'BUY', 'SELL'),
+            'contracts': contracts,
+            'entry_price': entry_price,
+            'stop_loss': stop_loss,
+            'target_1': targets[:, 0],
+            'target_2': targets[:, 1],
+            'target_3': targets[:, 2],
+            'exit_price_1': exit_price[:, 0],
+            'exit_price_2': exit_price[:, 1],
+            'exit_price_3': exit_price[:, 2],
+            'exit_reason_1': exit_reason[:, 0],
+            'exit_reason_2': exit_reason[:, 1],
+            'exit_reason_3': exit_reason[:, 2],
+            'pnl': pnl
+        }
+
+    def _result(self, columns: Dict[str, np.ndarray], bars: int, started: float) -> BacktestResult:
+        """Equity curve, drawdown and summary from the trade columns"""
+        pnl = columns['pnl']
+
+        # Equity is realized in exit order
+        order = np.argsort(columns['exit_index'], kind='stable')
+        equity_curve = self.risk_manager.total_capital + np.cumsum(pnl[order])
+        peaks = np.maximum.accumulate(np.concatenate(([self.risk_manager.total_capital], equity_curve)))[1:]
+        drawdowns = peaks - equity_curve
+        max_drawdown = float(drawdowns.max()) if len(drawdowns) else 0.0
+        max_drawdown_pct = float((drawdowns / peaks).max()) if len(drawdowns) else 0.0
+
+        trades = pd.DataFrame({name: values for name, values in columns.items()
+                               if name not in ('entry_time', 'exit_time')})
+        if 'entry_time' in columns:
+            trades.insert(0, 'entry_time', columns['entry_time'])
+            trades.insert(1, 'exit_time', columns['exit_time'])
+
+        elapsed = time.perf_counter() - started
+        result = BacktestResult(
+            trades=trades,
+            equity_curve=equity_curve,
+            total_pnl=float(pnl.sum()),
+            max_drawdown=max_drawdown,
+            max_drawdown_pct=max_drawdown_pct,
+            win_rate=float((pnl > 0).mean()) if len(pnl) else 0.0,
+            bars_processed=bars,
+            elapsed_seconds=elapsed
+        )
+
+        logger.info("APEX Sniper backtest: %d trades over %d bars, P&L=$%.2f, Max DD=$%.2f, "
+                    "%.0f trades/sec", result.num_trades, bars, result.total_pnl,
+                    result.max_drawdown, result.trades_per_second)
+        return result
+
+    def _resolve_exits(self, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                       entries: np.ndarray, direction: np.ndarray, stop_loss: np.ndarray,
+                       targets: np.ndarray):
+        """
+        Locate each leg's exit bar offset, price and reason
+
+        Future bars are viewed as a (trades x horizon) window without copying
+        the source columns; trades are processed in chunks to bound memory.
+        """
+        n = len(close)
+        horizon = self.max_holding_bars
+        trades = len(entries)
+
+        exit_offset = np.zeros((trades, 3), dtype=np.int64)
+        exit_price = np.zeros((trades, 3))
+        exit_reason = np.zeros((trades, 3), dtype=np.int8)
+        if trades == 0:
+            return exit_offset, exit_price, exit_reason
+
+        # NaN padding makes windows past the end of data never touch a level
+        pad = np.full(horizon, np.nan)
+        high_windows = np.lib.stride_tricks.sliding_window_view(np.concatenate((high, pad)), horizon)
+        low_windows = np.lib.stride_tricks.sliding_window_view(np.concatenate((low, pad)), horizon)
+
+        for start in range(0, trades, self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            first_bar = entries[chunk] + 1
+            highs = high_windows[first_bar]
+            lows = low_windows[first_bar]
+            long_side = (direction[chunk] > 0)[:, None]
+
+            stop = stop_loss[chunk][:, None]
+            stop_hit = np.where(long_side, lows <= stop, highs >= stop)
+            first_stop = _first_true(stop_hit, horizon)
+
+            # Legs still open at the horizon or the last bar exit at its close
+            last_offset = np.minimum(horizon, n - first_bar) - 1
+            time_exit = close[first_bar + last_offset]
+
+            for leg in range(3):
+                target = targets[chunk, leg][:, None]
+                target_hit = np.where(long_side, highs >= target, lows <= target)
+                first_target = _first_true(target_hit, horizon)
+
+                if self.stop_first_on_ambiguous:
+                    target_first = first_target < first_stop
+                else:
+                    target_first = first_target <= first_stop
+                target_first &= first_target < horizon
+                stopped = ~target_first & (first_stop < horizon)
+
+                exit_offset[chunk, leg] = np.select([target_first, stopped],
+                                                    [first_target, first_stop], last_offset)
+                exit_price[chunk, leg] = np.select([target_first, stopped],
+                                                   [targets[chunk, leg], stop_loss[chunk]], time_exit)
+                exit_reason[chunk, leg] = np.select([target_first, stopped],
+                                                    [EXIT_TARGET, EXIT_STOP], EXIT_TIME)
+
+        return exit_offset, exit_price, exit_reason
+
+    def _select_trades(self, entries: np.ndarray, exit_offsets: np.ndarray,
+                       flat_after: int = -1) -> np.ndarray:
+        """Keep one position at a time (none before ``flat_after``) unless overlapping trades are allowed"""
+        if self.allow_overlapping_trades:
+            return np.ones(len(entries), dtype=bool)
+
+        # Walks trades, not bars: exits are already resolved above
+        taken = np.zeros(len(entries), dtype=bool)
+        for i, (entry, offset) in enumerate(zip(entries.tolist(), exit_offsets.tolist())):
+            if entry > flat_after:
+                taken[i] = True
+                flat_after = entry + 1 + offset
+        return taken
+
+    def _size_positions(self, signals: SignalFrame, entries: np.ndarray) -> np.ndarray:
+        """Contracts per trade from QuantumRiskManager.calculate_position_sizes"""
+        return self.risk_manager.calculate_position_sizes(SignalBatch.from_signal_frame(signals, rows=entries))
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    bars = 500_000
+    rng = np.random.default_rng(42)
+    close = 70 + np.cumsum(rng.standard_normal(bars) * 0.02)
+    sample_data = pd.DataFrame({
+        'timestamp': pd.date_range(start='2020-01-01', periods=bars, freq='1min'),
+        'open': close + rng.standard_normal(bars) * 0.005,
+        'high': close + np.abs(rng.standard_normal(bars)) * 0.03,
+        'low': close - np.abs(rng.standard_normal(bars)) * 0.03,
+        'close': close,
+        'volume': rng.integers(1000, 10000, bars)
+    })
+
+    strategy = APEXSniperStrategy(capital=1000000)
+    # The default 2.0 R:R filter rejects the fixed 2.0/1.5 ATR target/stop ratio
+    strategy.entry_criteria['min_risk_reward_ratio'] = 1.3
+    strategy.entry_criteria['min_confluence_signals'] = 2
+
+    result = VectorizedBacktester(strategy).run(sample_data)
+    for key, value in result.summary().items():
+        print(f"{key}: {value:,.4f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Memory-Mapped Columnar Bar Store
+On-disk OHLCV history for /CL with zero-copy reads and append-only writes
+
+Layout of a store directory:
+    meta.json        column names, dtypes and committed bar count
+    timestamp.i8     int64 nanoseconds since the epoch (UTC), ascending
+    open.f8 ... volume.f8
+                     one raw little-endian float64 array per column
+
+Readers memory-map the column files, so opening a decade of minute bars is
+near-instant and the data stays in the OS page cache, not the Python heap.
+Appends write to the end of each file and then atomically publish the new
+bar count in meta.json; bytes beyond the committed count are ignored.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+TIMESTAMP_COLUMN = 'timestamp'
+META_FILE = 'meta.json'
+STORE_VERSION = 1
+
+TimeLike = Union[str, pd.Timestamp, np.datetime64, int]
+
+
+def _to_ns(value: TimeLike) -> int:
+    """Normalize a timestamp-like value to int64 nanoseconds (naive = UTC)"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    stamp = pd.Timestamp(value)
+    if stamp.tzinfo is not None:
+        stamp = stamp.tz_convert('UTC').tz_localize(None)
+    return stamp.as_unit('ns').value
+
+
+@dataclass
+class BarSlice:
+    """Zero-copy view of a contiguous range of stored bars"""
+    timestamp: np.ndarray  # int64 ns
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """OHLCV DataFrame in the shape APEXSniperStrategy expects"""
+        return pd.DataFrame({
+            TIMESTAMP_COLUMN: self.timestamp.view('datetime64[ns]'),
+            **{column: getattr(self, column) for column in PRICE_COLUMNS}
+        }, copy=False)
+
+
+class BarStore:
+    """
+    Columnar OHLCV bar store backed by one memory-mapped file per column
+
+    Use ``BarStore.create`` for a new store and ``BarStore(path)`` to open an
+    existing one. ``slice`` binary-searches the timestamp column and returns
+    views; ``append`` adds bars without rewriting existing data.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, META_FILE)) as handle:
+            self.meta = json.load(handle)
+        if self.meta.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported bar store version in {path}: {self.meta.get('version')}")
+        self._maps: Dict[str, np.ndarray] = {}
+        self._mapped_count = -1
+
+    @classmethod
+    def create(cls, path: str, ohlcv_data: Optional[pd.DataFrame] = None,
+               symbol: str = '/CL') -> 'BarStore':
+        """Create an empty store at ``path``, optionally seeded with bars"""
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(os.path.join(path, META_FILE)):
+            raise FileExistsError(f"Bar store already exists at {path}")
+
+        for column in (TIMESTAMP_COLUMN,) + PRICE_COLUMNS:
+            open(cls._column_path(path, column), 'wb').close()
+        cls._write_meta(path, {
+            'version': STORE_VERSION,
+            'symbol': symbol,
+            'columns': list(PRICE_COLUMNS),
+            'count': 0
+        })
+
+        store = cls(path)
+        if ohlcv_data is not None and len(ohlcv_data):
+            store.append(ohlcv_data)
+        return store
+
+    @staticmethod
+    def _column_path(path: str, column: str) -> str:
+        suffix = 'i8' if column == TIMESTAMP_COLUMN else 'f8'
+        return os.path.join(path, f"{column}.{suffix}")
+
+    @staticmethod
+    def _write_meta(path: str, meta: Dict) -> None:
+        temp_path = os.path.join(path, META_FILE + '.tmp')
+        with open(temp_path, 'w') as handle:
+            json.dump(meta, handle, indent=2)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, os.path.join(path, META_FILE))
+
+    def __len__(self) -> int:
+        return self.meta['count']
+
+    @property
+    def symbol(self) -> str:
+        return self.meta['symbol']
+
+    def _column(self, column: str) -> np.ndarray:
+        """Read-only memory map of one column's committed bars"""
+        count = len(self)
+        if self._mapped_count != count:
+            self._maps = {}
+            self._mapped_count = count
+        if column not in self._maps:
+            dtype = np.int64 if column == TIMESTAMP_COLUMN else np.float64
+            if count == 0:
+                self._maps[column] = np.empty(0, dtype=dtype)
+            else:
+                self._maps[column] = np.memmap(self._column_path(self.path, column),
+                                               dtype=dtype, mode='r', shape=(count,))
+        return self._maps[column]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._column(TIMESTAMP_COLUMN)
+
+    def time_range(self):
+        """First and last stored timestamps, or None when empty"""
+        if not len(self):
+            return None
+        stamps = self.timestamps
+        return pd.Timestamp(stamps[0]), pd.Timestamp(stamps[-1])
+
+    def slice(self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None) -> BarSlice:
+        """
+        Bars with ``start <= timestamp < end`` as zero-copy views
+
+        Either bound may be omitted; both are located by binary search.
+        """
+        stamps = self.timestamps
+        lo = 0 if start is None else int(np.searchsorted(stamps, _to_ns(start), side='left'))
+        hi = len(stamps) if end is None else int(np.searchsorted(stamps, _to_ns(end), side='left'))
+        return self.slice_index(lo, max(lo, hi))
+
+    def slice_index(self, start: int, stop: int) -> BarSlice:
+        """Bars by position as zero-copy views"""
+        return BarSlice(
+            timestamp=self.timestamps[start:stop],
+            **{column: self._column(column)[start:stop] for column in PRICE_COLUMNS}
+        )
+
+    def iter_chunks(self, chunk_size: int, start: int = 0,
+                    stop: Optional[int] = None) -> Iterator[BarSlice]:
+        """
+        Bars [start, stop) as consecutive chunks of ``chunk_size`` bars read from disk
+
+        Each chunk is read into fresh arrays rather than mapped, so only one
+        chunk's bars are resident at a time however long the history is.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        stop = len(self) if stop is None else min(stop, len(self))
+        for first in range(start, stop, chunk_size):
+            count = min(chunk_size, stop - first)
+            columns = {}
+            for column in (TIMESTAMP_COLUMN,) + PRICE_COLUMNS:
+                dtype = np.dtype(np.int64 if column == TIMESTAMP_COLUMN else np.float64)
+                columns[column] = np.fromfile(self._column_path(self.path, column), dtype=dtype,
+                                              count=count, offset=first * dtype.itemsize)
+            yield BarSlice(**columns)
+
+    def read(self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None) -> pd.DataFrame:
+        """Time-range slice as an OHLCV DataFrame over the mapped columns"""
+        return self.slice(start, end).to_dataframe()
+
+    def refresh(self) -> None:
+        """Pick up bars appended by another writer"""
+        with open(os.path.join(self.path, META_FILE)) as handle:
+            self.meta = json.load(handle)
+
+    def append(self, ohlcv_data: pd.DataFrame) -> int:
+        """
+        Append bars at the end of the store without rewriting existing data
+
+        Timestamps must be strictly increasing and later than the last
+        stored bar. Returns the new bar count.
+        """
+        if not len(ohlcv_data):
+            return len(self)
+
+        stamps = pd.to_datetime(ohlcv_data[TIMESTAMP_COLUMN])
+        if stamps.dt.tz is not None:
+            stamps = stamps.dt.tz_convert('UTC').dt.tz_localize(None)
+        stamps = stamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        if np.any(np.diff(stamps) <= 0):
+            raise ValueError("Bar timestamps must be strictly increasing")
+
+        count = len(self)
+        if count and stamps[0] <= self.timestamps[-1]:
+            raise ValueError("Appended bars must start after the last stored bar")
+
+        columns = {TIMESTAMP_COLUMN: stamps}
+        for column in PRICE_COLUMNS:
+            columns[column] = ohlcv_data[column].to_numpy(dtype=np.float64)
+
+        for column, values in columns.items():
+            with open(self._column_path(self.path, column), 'r+b') as handle:
+                # Drop any uncommitted tail left by an interrupted append
+                handle.truncate(count * 8)
+                handle.seek(count * 8)
+                handle.write(np.ascontiguousarray(values, dtype='<' + values.dtype.str[1:]).tobytes())
+                handle.flush()
+                os.fsync(handle.fileno())
+
+        self.meta['count'] = count + len(stamps)
+        self._write_meta(self.path, self.meta)
+        return self.meta['count']
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    bars = 2_000_000
+    rng = np.random.default_rng(11)
+    close = 70 + np.cumsum(rng.standard_normal(bars) * 0.02)
+    history = pd.DataFrame({
+        'timestamp': pd.date_range(start='2016-01-01', periods=bars, freq='1min'),
+        'open': close + rng.standard_normal(bars) * 0.005,
+        'high': close + np.abs(rng.standard_normal(bars)) * 0.03,
+        'low': close - np.abs(rng.standard_normal(bars)) * 0.03,
+        'close': close,
+        'volume': rng.integers(1000, 10000, bars)
+    })
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cl_1min')
+        store = BarStore.create(path, history.iloc[:-1000])
+        store.append(history.iloc[-1000:])
+
+        started = time.perf_counter()
+        reopened = BarStore(path)
+        window = reopened.read('2017-03-01', '2017-04-01')
+        elapsed = time.perf_counter() - started
+
+        print(f"Stored bars: {len(reopened):,} covering {reopened.time_range()}")
+        print(f"Opened and sliced {len(window):,} bars in {elapsed * 1000:.2f} ms")
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Out-of-Core Chunked Signal Generation
+generate_signal_frame over a history streamed in fixed-size chunks
+
+A decade of /CL minute bars need not be in memory at once: chunks are
+read from disk one after another (BarStore.iter_chunks, or DataFrames
+from a chunked CSV reader) and each is turned into its SignalFrame rows
+before the next is read. What a bar's indicators need from before its
+chunk is carried over:
+
+- exponential state: the weighted sum and weight total of every EMA
+  (trend EMAs, MACD fast/slow/signal) and Wilder's RSI averages
+- the last MACD histogram value, for crossovers at the chunk start
+- running sums of returns and squared returns for the market entropy
+- the last few bars, enough to fill every rolling window (SMA RSI, VWAP,
+  volume average, ATR, Bollinger bands, price range, volume coherence)
+
+so the rows match one in-memory generate_signal_frame run up to float
+rounding, with the discrete columns identical, and memory is bounded by
+the chunk size. The quantum probability draws come from the strategy RNG
+in bar order, the same sequence as a single run.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+import indicator_kernels as kernels
+from apex_core import VOLUME_COHERENCE_WINDOW, APEXSniperCore, SignalFrame
+
+
+def chunk_arrays(chunk) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Timestamps (datetime64[ns]), close, high, low and volume of one chunk
+
+    Accepts an OHLCV DataFrame (a 'timestamp' column or the index) or a
+    bar_store.BarSlice (int64 ns timestamps).
+    """
+    if hasattr(chunk, 'columns'):
+        timestamps = (chunk['timestamp'] if 'timestamp' in chunk else chunk.index).to_numpy()
+        close, high, low, volume = (chunk[column].to_numpy(dtype=np.float64)
+                                    for column in ('close', 'high', 'low', 'volume'))
+    else:
+        timestamps = np.asarray(chunk.timestamp)
+        close, high, low, volume = (np.asarray(values, dtype=np.float64)
+                                    for values in (chunk.close, chunk.high, chunk.low, chunk.volume))
+    if timestamps.dtype.kind in 'iu':
+        timestamps = timestamps.astype(np.int64).view('datetime64[ns]')
+    return timestamps, close, high, low, volume
+
+
+def _resume_ema(values: np.ndarray, span: int, state: np.ndarray) -> np.ndarray:
+    """
+    Continue an adjust=True EMA (kernels.ema) from ``state``
+
+    ``state`` holds the weighted sum and the weight total after the
+    previous bar (zeros before the first) and is advanced in place.
+    """
+    decay = 1 - 2 / (span + 1)
+    observed = ~np.isnan(values)
+    numerator = kernels._linear_recurrence(np.where(observed, values, 0.0), decay, initial=state[0])
+    weights = kernels._linear_recurrence(observed.astype(np.float64), decay, initial=state[1])
+    state[0], state[1] = numerator[-1], weights[-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.divide(numerator, weights, out=numerator)
+
+
+class ChunkedSignalGenerator:
+    """
+    SignalFrame rows for consecutive chunks of one bar history
+
+    Args:
+        strategy: Supplies the indicator parameters, entry criteria and the
+            RNG for quantum probability draws
+
+    Feed every chunk, oldest first, through ``process``.
+    """
+
+    def __init__(self, strategy: APEXSniperCore):
+        self.strategy = strategy
+        momentum = strategy.indicators['momentum']
+        volume = strategy.indicators['volume']
+        volatility = strategy.indicators['volatility']
+        # Bars kept from earlier chunks: every rolling window plus the bar before it
+        self.context_bars = max(momentum['rsi_period'], volume['vwap_period'], volume['volume_ma_period'],
+                                volatility['atr_period'], volatility['bb_period'],
+                                VOLUME_COHERENCE_WINDOW) + 1
+
+        self.bars_processed = 0
+        self._context: Optional[Tuple[np.ndarray, ...]] = None  # close, high, low, volume
+        self._ema_state: Dict[str, np.ndarray] = {}
+        self._previous_histogram = np.nan
+        self._wilder_state: Optional[np.ndarray] = None  # average gain, average loss once seeded
+        self._return_sums = np.zeros(2)  # sum of returns, sum of squared returns
+
+    def process(self, close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray,
+                timestamps: Optional[np.ndarray] = None) -> SignalFrame:
+        """
+        Signal rows for the next chunk of bars
+
+        Args:
+            close, high, low, volume: float64 bar arrays of this chunk, oldest first
+            timestamps: Bar timestamps; global bar positions if omitted
+
+        Returns:
+            SignalFrame: Rows for this chunk's bars only
+        """
+        strategy = self.strategy
+        workspace = strategy.kernel_workspace
+        momentum_params = strategy.indicators['momentum']
+        trend_params = strategy.indicators['trend']
+        volume_params = strategy.indicators['volume']
+        volatility_params = strategy.indicators['volatility']
+        bars = len(close)
+        if bars == 0:
+            raise ValueError("Chunks must hold at least one bar")
+        start = self.bars_processed
+
+        # Rolling windows run over the carried bars followed by this chunk
+        if self._context is None:
+            context = 0
+            extended = (close, high, low, volume)
+        else:
+            context = len(self._context[0])
+            extended = tuple(np.concatenate((previous, current))
+                             for previous, current in zip(self._context, (close, high, low, volume)))
+        ext_close, ext_high, ext_low, ext_volume = extended
+
+        def rolling(values: np.ndarray) -> np.ndarray:
+            return values[context:]
+
+        # Momentum: RSI, then MACD from carried EMA state
+        rsi = self._rsi(ext_close, context)
+        macd_line = self._ema('macd_fast', close, momentum_params['macd_fast'])
+        macd_line -= self._ema('macd_slow', close, momentum_params['macd_slow'])
+        histogram = macd_line - self._ema('macd_signal', macd_line, momentum_params['macd_signal'])
+        previous = np.empty_like(histogram)
+        previous[0] = self._previous_histogram
+        previous[1:] = histogram[:-1]
+        momentum = strategy._momentum_columns(rsi, histogram, previous)
+
+        ema_fast = self._ema('ema_fast', close, trend_params['ema_fast'])
+        ema_medium = self._ema('ema_medium', close, trend_params['ema_medium'])
+        ema_slow = self._ema('ema_slow', close, trend_params['ema_slow'])
+        trend = strategy._trend_columns(close, ema_fast, ema_medium, ema_slow)
+
+        typical_price = (ext_high + ext_low + ext_close) / 3
+        volume_ma = rolling(kernels.rolling_mean(ext_volume, volume_params['volume_ma_period'],
+                                                 workspace=workspace))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vwap = rolling(kernels.rolling_sum(typical_price * ext_volume, volume_params['vwap_period'],
+                                               workspace=workspace) /
+                           kernels.rolling_sum(ext_volume, volume_params['vwap_period'], workspace=workspace))
+        volume_columns = strategy._volume_columns(volume, vwap, volume_ma)
+
+        previous_close = np.full_like(ext_close, np.nan)
+        previous_close[1:] = ext_close[:-1]
+        true_range = np.fmax(ext_high - ext_low, np.fmax(np.abs(ext_high - previous_close),
+                                                         np.abs(ext_low - previous_close)))
+        atr = rolling(kernels.rolling_mean(true_range, volatility_params['atr_period'], workspace=workspace))
+        bb_middle = rolling(kernels.rolling_mean(ext_close, volatility_params['bb_period'], workspace=workspace))
+        bb_std = rolling(kernels.rolling_std(ext_close, volatility_params['bb_period'], workspace=workspace))
+        price_range = rolling(kernels.rolling_max(ext_high, volatility_params['atr_period']) -
+                              kernels.rolling_min(ext_low, volatility_params['atr_period']))
+        volatility_columns = strategy._volatility_columns(close, atr, bb_middle, bb_std, price_range)
+
+        quantum = strategy._quantum_columns(self._market_entropy(ext_close, context),
+                                            self._volume_coherence(ext_volume, context))
+        base_probability = strategy.rng.beta(2, 2, size=bars)
+        quantum['quantum_probability'] = np.minimum(base_probability + quantum['pattern_fidelity'] * 0.3, 0.95)
+
+        columns = strategy._entry_arrays(close, momentum, trend, volume_columns, volatility_columns, quantum)
+
+        self._previous_histogram = histogram[-1]
+        self._context = tuple(values[-self.context_bars:].copy() for values in extended)
+        self.bars_processed += bars
+        if timestamps is None:
+            timestamps = np.arange(start, start + bars)
+        return SignalFrame(timestamp=timestamps, **columns)
+
+    def _ema(self, name: str, values: np.ndarray, span: int) -> np.ndarray:
+        state = self._ema_state.setdefault(name, np.zeros(2))
+        return _resume_ema(values, span, state)
+
+    def _rsi(self, ext_close: np.ndarray, context: int) -> np.ndarray:
+        """RSI for the chunk rows; Wilder averages continue from carried state once seeded"""
+        momentum = self.strategy.indicators['momentum']
+        period = momentum['rsi_period']
+        if momentum['rsi_method'] == 'sma':
+            return kernels.rsi(ext_close, period, 'sma', workspace=self.strategy.kernel_workspace)[context:]
+
+        delta = np.zeros_like(ext_close)
+        delta[1:] = ext_close[1:] - ext_close[:-1]
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        if self._wilder_state is None:
+            # Not seeded yet, so the carried bars are the whole history so far
+            kernels._wilder_average(gain, period)
+            kernels._wilder_average(loss, period)
+            gain, loss = gain[context:], loss[context:]
+            if self.bars_processed + len(gain) >= period:
+                self._wilder_state = np.array([gain[-1], loss[-1]])
+        else:
+            decay = 1 - 1 / period
+            gain = kernels._linear_recurrence(gain[context:] / period, decay, initial=self._wilder_state[0])
+            loss = kernels._linear_recurrence(loss[context:] / period, decay, initial=self._wilder_state[1])
+            self._wilder_state[:] = gain[-1], loss[-1]
+
+        # Same operations as kernels.rsi
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out = np.divide(gain, loss)
+            out += 1
+            np.divide(100, out, out=out)
+            return np.subtract(100, out, out=out)
+
+    def _market_entropy(self, ext_close: np.ndarray, context: int) -> np.ndarray:
+        """APEXSniperCore._pattern_fidelity_arrays entropy from running return sums"""
+        start = self.bars_processed
+        close = ext_close[context:]
+        returns = np.zeros_like(close)
+        if context:
+            returns[0] = close[0] / ext_close[context - 1] - 1
+        returns[1:] = close[1:] / close[:-1] - 1
+        # Accumulating after the carried sums reproduces the single-pass cumulative sums
+        sum_returns = np.cumsum(np.concatenate(([self._return_sums[0]], returns)))[1:]
+        sum_squares = np.cumsum(np.concatenate(([self._return_sums[1]], returns * returns)))[1:]
+        self._return_sums[:] = sum_returns[-1], sum_squares[-1]
+
+        count = np.arange(start, start + len(close), dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = (sum_squares - sum_returns * sum_returns / count) / (count - 1)
+            price_entropy = np.minimum(np.abs(np.sqrt(np.maximum(variance, 0.0)) * np.sqrt(count)), 1.0)
+        price_entropy[:max(2 - start, 0)] = np.nan
+        return price_entropy
+
+    def _volume_coherence(self, ext_volume: np.ndarray, context: int) -> np.ndarray:
+        volume_ma = kernels.rolling_mean(ext_volume, VOLUME_COHERENCE_WINDOW,
+                                         workspace=self.strategy.kernel_workspace)[context:]
+        volume = ext_volume[context:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.clip(1 - np.abs(volume - volume_ma) / volume_ma, 0.0, 1.0)
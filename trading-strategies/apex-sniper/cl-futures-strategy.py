@@ -3,186 +3,50 @@
 PSYBERHERD™ APEX Sniper - /CL Crude Oil Futures Trading Strategy
 Quantum-Enhanced Family Office Trading Implementation
 
+DataFrame adapter over the NumPy core in apex_core.py: the entry points
+here take OHLCV DataFrames and hand their columns to the core. pandas is
+never imported by this module; callers bring their own DataFrames.
+
 Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
 Version: 1.0.0
 Classification: Family Office Proprietary Trading Algorithm
 """
 
 import numpy as np
-import pandas as pd
-from datetime import datetime, timedelta
-import json
-import logging
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
-from enum import Enum
-
-# Configure logging for trading operations
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - APEX_SNIPER - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('apex_sniper_trading.log'),
-        logging.StreamHandler()
-    ]
-)
+import os
+import sys
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Tuple
 
-class SignalStrength(Enum):
-    """Signal strength classification for APEX Sniper entries"""
-    WEAK = 0.5
-    MODERATE = 0.65
-    STRONG = 0.75
-    APEX = 0.85
+# Sibling modules live next to this script, which is not an importable package
+_STRATEGY_DIR = os.path.dirname(os.path.abspath(__file__))
+if _STRATEGY_DIR not in sys.path:
+    sys.path.insert(0, _STRATEGY_DIR)
 
-class MarketRegime(Enum):
-    """Market regime classification for strategy adaptation"""
-    TRENDING_UP = "trending_up"
-    TRENDING_DOWN = "trending_down"
-    RANGE_BOUND = "range_bound"
-    HIGH_VOLATILITY = "high_volatility"
-    LOW_VOLATILITY = "low_volatility"
+from apex_core import (
+    APEXSniperCore, CONTRACT_SPECS, REGIME_CODES, SIGNAL_BATCH_COLUMNS, CompactTradingSignal,
+    ContractSpec, MarketRegime, MultiSymbolBars, QuantumRiskManager, SignalBatch, SignalFrame,
+    SignalStrength, TradingSignal, get_contract_spec
+)
+from chunked_signals import ChunkedSignalGenerator, chunk_arrays
 
-@dataclass
-class TradingSignal:
-    """APEX Sniper trading signal structure"""
-    symbol: str
-    timestamp: datetime
-    signal_type: str  # 'BUY' or 'SELL'
-    signal_strength: float
-    quantum_probability: float
-    technical_confluence: int
-    entry_price: float
-    stop_loss: float
-    profit_targets: List[float]
-    position_size: int
-    risk_amount: float
-    confidence_level: float
-    market_regime: MarketRegime
+if TYPE_CHECKING:
+    import pandas as pd
 
-class QuantumRiskManager:
-    """
-    Quantum-enhanced risk management for family office operations
-    Implements APEX Sniper risk control protocols
-    """
-    
-    def __init__(self, family_office_capital: float):
-        self.total_capital = family_office_capital
-        self.max_risk_per_trade = 0.02  # 2% per trade
-        self.max_portfolio_risk = 0.10  # 10% total portfolio risk
-        self.max_daily_risk = 0.05      # 5% daily risk limit
-        
-        # Performance tracking
-        self.daily_pnl = 0.0
-        self.open_positions = {}
-        self.risk_metrics = {
-            'current_portfolio_risk': 0.0,
-            'daily_risk_used': 0.0,
-            'correlation_risk': 0.0
-        }
-    
-    def calculate_position_size(self, signal: TradingSignal) -> int:
-        """
-        Quantum-optimized position sizing based on signal strength and market conditions
-        
-        Args:
-            signal: TradingSignal object with entry criteria
-            
-        Returns:
-            int: Optimal number of contracts to trade
-        """
-        # Base risk calculation
-        base_risk = self.total_capital * self.max_risk_per_trade
-        
-        # Signal confidence adjustment
-        confidence_multiplier = min(signal.confidence_level / 0.75, 1.5)
-        
-        # Quantum probability enhancement
-        quantum_multiplier = signal.quantum_probability
-        
-        # Market regime adjustment
-        regime_multiplier = self._get_regime_multiplier(signal.market_regime)
-        
-        # Volatility adjustment
-        stop_distance = abs(signal.entry_price - signal.stop_loss)
-        volatility_adjustment = 1.0 / (stop_distance / signal.entry_price + 0.01)
-        
-        # Calculate optimal risk amount
-        optimal_risk = (base_risk * confidence_multiplier * 
-                       quantum_multiplier * regime_multiplier * 
-                       volatility_adjustment)
-        
-        # Convert risk to position size (/CL contract = $10 per tick)
-        tick_value = 10.0  # $10 per tick for /CL
-        ticks_at_risk = stop_distance * 100  # Convert to ticks
-        max_contracts = int(optimal_risk / (ticks_at_risk * tick_value))
-        
-        # Ensure position size limits
-        max_allowed = int(self.total_capital * 0.05 / 5000)  # 5% max, $5K margin per contract
-        final_position_size = min(max_contracts, max_allowed, 10)  # Cap at 10 contracts
-        
-        logging.info(f"Position sizing: Risk=${optimal_risk:.2f}, "
-                    f"Contracts={final_position_size}, Stop Distance={stop_distance:.2f}")
-        
-        return max(1, final_position_size)
-    
-    def _get_regime_multiplier(self, regime: MarketRegime) -> float:
-        """Adjust position sizing based on market regime"""
-        regime_multipliers = {
-            MarketRegime.TRENDING_UP: 1.2,
-            MarketRegime.TRENDING_DOWN: 1.2,
-            MarketRegime.RANGE_BOUND: 0.8,
-            MarketRegime.HIGH_VOLATILITY: 0.7,
-            MarketRegime.LOW_VOLATILITY: 1.1
-        }
-        return regime_multipliers.get(regime, 1.0)
+# Callers load this file through strategy_loader and use it as the strategy's
+# public namespace, so the core types are re-exported alongside the adapter
+__all__ = [
+    'APEXSniperStrategy', 'APEXSniperCore', 'CONTRACT_SPECS', 'REGIME_CODES', 'SIGNAL_BATCH_COLUMNS',
+    'CompactTradingSignal', 'ContractSpec', 'MarketRegime', 'MultiSymbolBars', 'QuantumRiskManager',
+    'SignalBatch', 'SignalFrame', 'SignalStrength', 'TradingSignal', 'get_contract_spec'
+]
 
-class APEXSniperStrategy:
+class APEXSniperStrategy(APEXSniperCore):
     """
     APEX Sniper Philosophy Implementation for /CL Crude Oil Futures
     Quantum-enhanced precision trading for family office operations
     """
     
-    def __init__(self, capital: float = 1000000):
-        self.risk_manager = QuantumRiskManager(capital)
-        self.quantum_fidelity = 0.8677  # Current quantum system fidelity
-        
-        # Technical indicator parameters
-        self.indicators = {
-            'momentum': {
-                'rsi_period': 14,
-                'rsi_overbought': 70,
-                'rsi_oversold': 30,
-                'macd_fast': 12,
-                'macd_slow': 26,
-                'macd_signal': 9
-            },
-            'trend': {
-                'ema_fast': 9,
-                'ema_medium': 21,
-                'ema_slow': 50,
-                'trend_threshold': 0.02
-            },
-            'volume': {
-                'vwap_period': 20,
-                'volume_ma_period': 10,
-                'volume_surge_threshold': 1.5
-            },
-            'volatility': {
-                'atr_period': 14,
-                'bb_period': 20,
-                'bb_std': 2.0
-            }
-        }
-        
-        # APEX Sniper entry criteria
-        self.entry_criteria = {
-            'min_confluence_signals': 3,
-            'min_quantum_probability': 0.75,
-            'min_signal_strength': SignalStrength.STRONG.value,
-            'min_risk_reward_ratio': 2.0
-        }
-    
-    def analyze_market_data(self, ohlcv_data: pd.DataFrame) -> Dict:
+    def analyze_market_data(self, ohlcv_data: 'pd.DataFrame') -> Dict:
         """
         Comprehensive market analysis using APEX Sniper methodology
         
@@ -192,128 +56,17 @@ class APEXSniperStrategy:
         Returns:
             Dict: Complete market analysis results
         """
-        analysis = {
-            'timestamp': datetime.now(),
-            'momentum_signals': self._analyze_momentum(ohlcv_data),
-            'trend_signals': self._analyze_trend(ohlcv_data),
-            'volume_signals': self._analyze_volume(ohlcv_data),
-            'volatility_signals': self._analyze_volatility(ohlcv_data),
-            'market_regime': self._identify_market_regime(ohlcv_data),
-            'quantum_enhancement': self._quantum_probability_calculation(ohlcv_data)
-        }
-        
-        return analysis
-    
-    def _analyze_momentum(self, data: pd.DataFrame) -> Dict:
-        """Momentum indicator analysis for APEX Sniper signals"""
-        close = data['close']
-        
-        # RSI calculation
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.indicators['momentum']['rsi_period']).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.indicators['momentum']['rsi_period']).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        # MACD calculation
-        ema_fast = close.ewm(span=self.indicators['momentum']['macd_fast']).mean()
-        ema_slow = close.ewm(span=self.indicators['momentum']['macd_slow']).mean()
-        macd_line = ema_fast - ema_slow
-        macd_signal = macd_line.ewm(span=self.indicators['momentum']['macd_signal']).mean()
-        macd_histogram = macd_line - macd_signal
-        
-        current_rsi = rsi.iloc[-1]
-        current_macd = macd_histogram.iloc[-1]
-        
-        # Signal generation
-        momentum_signals = {
-            'rsi': current_rsi,
-            'rsi_signal': 'oversold' if current_rsi < 30 else 'overbought' if current_rsi > 70 else 'neutral',
-            'macd': current_macd,
-            'macd_signal': 'bullish' if current_macd > 0 and macd_histogram.iloc[-2] < 0 else 
-                          'bearish' if current_macd < 0 and macd_histogram.iloc[-2] > 0 else 'neutral',
-            'confluence_score': 0
-        }
-        
-        # Calculate confluence score
-        if momentum_signals['rsi_signal'] in ['oversold', 'overbought']:
-            momentum_signals['confluence_score'] += 1
-        if momentum_signals['macd_signal'] in ['bullish', 'bearish']:
-            momentum_signals['confluence_score'] += 1
-            
-        return momentum_signals
-    
-    def _analyze_trend(self, data: pd.DataFrame) -> Dict:
-        """Trend analysis using multiple EMAs and slope calculations"""
-        close = data['close']
-        
-        # EMA calculations
-        ema_fast = close.ewm(span=self.indicators['trend']['ema_fast']).mean()
-        ema_medium = close.ewm(span=self.indicators['trend']['ema_medium']).mean()
-        ema_slow = close.ewm(span=self.indicators['trend']['ema_slow']).mean()
-        
-        # Trend strength calculation
-        trend_alignment = (ema_fast.iloc[-1] > ema_medium.iloc[-1] > ema_slow.iloc[-1] or
-                          ema_fast.iloc[-1] < ema_medium.iloc[-1] < ema_slow.iloc[-1])
-        
-        # Price position relative to EMAs
-        price_above_emas = close.iloc[-1] > ema_fast.iloc[-1] > ema_medium.iloc[-1]
-        price_below_emas = close.iloc[-1] < ema_fast.iloc[-1] < ema_medium.iloc[-1]
-        
-        trend_signals = {
-            'ema_fast': ema_fast.iloc[-1],
-            'ema_medium': ema_medium.iloc[-1],
-            'ema_slow': ema_slow.iloc[-1],
-            'trend_alignment': trend_alignment,
-            'trend_direction': 'bullish' if price_above_emas else 'bearish' if price_below_emas else 'neutral',
-            'trend_strength': abs(ema_fast.iloc[-1] - ema_slow.iloc[-1]) / close.iloc[-1],
-            'confluence_score': 1 if trend_alignment else 0
-        }
-        
-        return trend_signals
-    
-    def _quantum_probability_calculation(self, data: pd.DataFrame) -> Dict:
-        """
-        Quantum-enhanced probability calculation for APEX Sniper signals
-        Simulates quantum processing for market pattern recognition
-        """
-        close = data['close']
-        volume = data['volume']
-        
-        # Quantum-inspired calculations (simulation of quantum processing)
-        price_entropy = self._calculate_market_entropy(close)
-        volume_coherence = self._calculate_volume_coherence(volume)
-        pattern_fidelity = self.quantum_fidelity * (price_entropy + volume_coherence) / 2
-        
-        # Quantum probability enhancement
-        base_probability = np.random.beta(2, 2)  # Base probability distribution
-        quantum_enhancement = pattern_fidelity * 0.3  # Quantum boost factor
-        final_probability = min(base_probability + quantum_enhancement, 0.95)
-        
-        quantum_metrics = {
-            'price_entropy': price_entropy,
-            'volume_coherence': volume_coherence,
-            'pattern_fidelity': pattern_fidelity,
-            'quantum_probability': final_probability,
-            'quantum_confidence': pattern_fidelity > 0.8,
-            'coherence_time': 14.2  # milliseconds
-        }
-        
-        return quantum_metrics
-    
-    def _calculate_market_entropy(self, prices: pd.Series) -> float:
-        """Calculate market entropy for quantum analysis"""
-        returns = prices.pct_change().dropna()
-        # Simplified entropy calculation
-        return min(abs(returns.std() * np.sqrt(len(returns))), 1.0)
-    
-    def _calculate_volume_coherence(self, volume: pd.Series) -> float:
-        """Calculate volume coherence for quantum analysis"""
-        volume_ma = volume.rolling(window=10).mean()
-        coherence = 1 - abs(volume.iloc[-1] - volume_ma.iloc[-1]) / volume_ma.iloc[-1]
-        return max(min(coherence, 1.0), 0.0)
-    
-    def generate_trading_signal(self, market_data: pd.DataFrame) -> Optional[TradingSignal]:
+        # With lookback trimming on, only the needed tail is converted
+        bars_available = len(ohlcv_data)
+        tail = ohlcv_data.iloc[bars_available - self.analysis_window(bars_available):]
+        arrays = _ohlcv_arrays(tail)
+        if self.timeframes is not None:
+            self._roll_up_timeframes(ohlcv_data, tail, arrays)
+        # Trimmed analysis still measures market entropy over the whole close column
+        close_history = ohlcv_data['close'].to_numpy(dtype=np.float64) if self.lookback['trim'] else None
+        return self.analyze_bars(*arrays, bars_available=bars_available, close_history=close_history)
+    
+    def generate_trading_signal(self, market_data: 'pd.DataFrame') -> Optional[TradingSignal]:
         """
         Generate APEX Sniper trading signal based on comprehensive analysis
         
@@ -324,118 +77,76 @@ class APEXSniperStrategy:
             TradingSignal object if criteria met, None otherwise
         """
         analysis = self.analyze_market_data(market_data)
-        
-        # Calculate total confluence score
-        total_confluence = (analysis['momentum_signals']['confluence_score'] +
-                          analysis['trend_signals']['confluence_score'] +
-                          (1 if analysis['volume_signals'].get('volume_surge', False) else 0) +
-                          (1 if analysis['volatility_signals'].get('breakout_signal', False) else 0))
-        
-        # Check APEX Sniper entry criteria
-        quantum_prob = analysis['quantum_enhancement']['quantum_probability']
-        
-        if (total_confluence >= self.entry_criteria['min_confluence_signals'] and
-            quantum_prob >= self.entry_criteria['min_quantum_probability']):
-            
-            current_price = market_data['close'].iloc[-1]
-            atr = market_data['high'].rolling(14).max() - market_data['low'].rolling(14).min()
-            current_atr = atr.iloc[-1]
-            
-            # Determine signal direction
-            signal_type = self._determine_signal_direction(analysis)
-            
-            if signal_type != 'HOLD':
-                # Calculate stop loss and profit targets
-                stop_loss, profit_targets = self._calculate_stops_and_targets(
-                    current_price, current_atr, signal_type
-                )
-                
-                # Risk/reward validation
-                risk_amount = abs(current_price - stop_loss)
-                reward_amount = abs(profit_targets[0] - current_price)
-                risk_reward_ratio = reward_amount / risk_amount if risk_amount > 0 else 0
-                
-                if risk_reward_ratio >= self.entry_criteria['min_risk_reward_ratio']:
-                    signal = TradingSignal(
-                        symbol='/CL',
-                        timestamp=datetime.now(),
-                        signal_type=signal_type,
-                        signal_strength=quantum_prob,
-                        quantum_probability=quantum_prob,
-                        technical_confluence=total_confluence,
-                        entry_price=current_price,
-                        stop_loss=stop_loss,
-                        profit_targets=profit_targets,
-                        position_size=0,  # Will be calculated by risk manager
-                        risk_amount=0,    # Will be calculated by risk manager
-                        confidence_level=quantum_prob,
-                        market_regime=analysis['market_regime']
-                    )
-                    
-                    # Calculate position size
-                    signal.position_size = self.risk_manager.calculate_position_size(signal)
-                    signal.risk_amount = signal.position_size * risk_amount * 10  # $10 per tick
-                    
-                    logging.info(f"APEX Sniper Signal Generated: {signal_type} /CL at {current_price:.2f} "
-                               f"with {quantum_prob:.3f} quantum probability")
-                    
-                    return signal
-        
-        return None
+        return self.evaluate_signal(analysis, market_data['close'].iloc[-1])
     
-    def _determine_signal_direction(self, analysis: Dict) -> str:
-        """Determine BUY/SELL signal direction based on analysis"""
-        bullish_signals = 0
-        bearish_signals = 0
+    def generate_signals(self, ohlcv_data: 'pd.DataFrame') -> SignalFrame:
+        """
+        Evaluate generate_trading_signal for every bar of a history at once
         
-        # Momentum signals
-        if analysis['momentum_signals']['rsi_signal'] == 'oversold':
-            bullish_signals += 1
-        elif analysis['momentum_signals']['rsi_signal'] == 'overbought':
-            bearish_signals += 1
+        Args:
+            ohlcv_data: DataFrame with OHLCV data for /CL futures
             
-        if analysis['momentum_signals']['macd_signal'] == 'bullish':
-            bullish_signals += 1
-        elif analysis['momentum_signals']['macd_signal'] == 'bearish':
-            bearish_signals += 1
-        
-        # Trend signals
-        if analysis['trend_signals']['trend_direction'] == 'bullish':
-            bullish_signals += 2  # Weight trend more heavily
-        elif analysis['trend_signals']['trend_direction'] == 'bearish':
-            bearish_signals += 2
-        
-        # Quantum enhancement bias
-        if analysis['quantum_enhancement']['quantum_confidence']:
-            if bullish_signals > bearish_signals:
-                bullish_signals += 1
-            elif bearish_signals > bullish_signals:
-                bearish_signals += 1
-        
-        if bullish_signals > bearish_signals + 1:
-            return 'BUY'
-        elif bearish_signals > bullish_signals + 1:
-            return 'SELL'
-        else:
-            return 'HOLD'
+        Returns:
+            SignalFrame: Columnar signal results aligned with ohlcv_data rows
+        """
+        return self.generate_signal_frame(*_ohlcv_arrays(ohlcv_data), timestamps=_timestamps(ohlcv_data))
     
-    def _calculate_stops_and_targets(self, entry_price: float, atr: float, 
-                                   signal_type: str) -> Tuple[float, List[float]]:
-        """Calculate stop loss and profit target levels"""
-        atr_multiplier_stop = 1.5
-        atr_multiplier_target = [2.0, 3.0, 4.0]  # Multiple targets
-        
-        if signal_type == 'BUY':
-            stop_loss = entry_price - (atr * atr_multiplier_stop)
-            profit_targets = [entry_price + (atr * mult) for mult in atr_multiplier_target]
-        else:  # SELL
-            stop_loss = entry_price + (atr * atr_multiplier_stop)
-            profit_targets = [entry_price - (atr * mult) for mult in atr_multiplier_target]
+    def generate_signals_chunked(self, chunks: Iterable) -> Iterator[SignalFrame]:
+        """
+        generate_signals over a history too long to hold in memory
         
-        return stop_loss, profit_targets
+        Args:
+            chunks: Consecutive pieces of the history, oldest first: OHLCV
+                DataFrames (e.g. pd.read_csv(..., chunksize=...)) or
+                BarStore.iter_chunks() slices
+            
+        Yields:
+            SignalFrame: Rows for each chunk's bars, matching generate_signals
+            on the whole history (see chunked_signals)
+        """
+        generator = ChunkedSignalGenerator(self)
+        for chunk in chunks:
+            timestamps, close, high, low, volume = chunk_arrays(chunk)
+            yield generator.process(close, high, low, volume, timestamps=timestamps)
+    
+    def _roll_up_timeframes(self, ohlcv_data: 'pd.DataFrame', tail: 'pd.DataFrame',
+                            tail_arrays: Tuple[np.ndarray, ...]) -> int:
+        """Feed the bars newer than the last rolled-up one into the higher timeframes"""
+        timestamps = _timestamps(ohlcv_data)
+        start = self.timeframes.new_bars_start(timestamps)
+        offset = len(ohlcv_data) - len(tail)
+        if start < offset:
+            # More new bars than the analysis tail holds, e.g. on the first call
+            tail, tail_arrays, offset = ohlcv_data, _ohlcv_arrays(ohlcv_data), 0
+        close, high, low, volume = (values[start - offset:] for values in tail_arrays)
+        open_prices = tail['open'] if 'open' in tail else tail['close']
+        return self.update_timeframes(timestamps[start:],
+                                      open_prices.to_numpy(dtype=np.float64)[start - offset:],
+                                      high, low, close, volume)
+    
+    def estimate_quantum_probability(self, ohlcv_data: 'pd.DataFrame', samples: int = 10000,
+                                     quantiles: Tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95),
+                                     seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Per-bar Monte Carlo quantum probability distribution (see quantum_probability_distribution)"""
+        close, high, low, volume = _ohlcv_arrays(ohlcv_data)
+        return self.quantum_probability_distribution(close, volume, samples=samples,
+                                                     quantiles=quantiles, seed=seed)
+
+def _ohlcv_arrays(data: 'pd.DataFrame') -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Close, high, low and volume columns as float64 arrays"""
+    return tuple(data[column].to_numpy(dtype=np.float64)
+                 for column in ('close', 'high', 'low', 'volume'))
+
+def _timestamps(data: 'pd.DataFrame') -> np.ndarray:
+    """The 'timestamp' column, or the index when there is none"""
+    if 'timestamp' in data:
+        return data['timestamp'].to_numpy()
+    return data.index.to_numpy()
 
 # Example usage and testing
 if __name__ == "__main__":
+    import pandas as pd
+    
     # Initialize APEX Sniper strategy
     strategy = APEXSniperStrategy(capital=1000000)  # $1M family office capital
     
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Startup Import Benchmark
+Guards the cold-start cost of the NumPy strategy core
+
+Each sample runs a fresh interpreter that imports NumPy, then the target
+module, and reports both times plus whether pandas was pulled in. The core
+import is measured on top of NumPy, which every caller pays anyway. Exits
+non-zero when the median core import exceeds the budget or the core
+imports pandas, so it can run as a CI gate.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+STRATEGY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_PROBE = '''
+import json, sys, time
+sys.path.insert(0, {directory!r})
+started = time.perf_counter()
+import numpy
+numpy_done = time.perf_counter()
+{statement}
+finished = time.perf_counter()
+print(json.dumps({{'numpy_ms': (numpy_done - started) * 1000,
+                   'import_ms': (finished - numpy_done) * 1000,
+                   'pandas_loaded': 'pandas' in sys.modules}}))
+'''
+
+TARGETS = {
+    'core': 'import apex_core',
+    'adapter': 'import strategy_loader; strategy_loader.load_strategy_module()'
+}
+
+
+def measure(statement: str, runs: int) -> Dict:
+    """Median import timings over ``runs`` fresh interpreters"""
+    samples: List[Dict] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(directory=STRATEGY_DIR, statement=statement)],
+            check=True, capture_output=True, text=True, cwd=STRATEGY_DIR
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        'runs': runs,
+        'numpy_ms': statistics.median(s['numpy_ms'] for s in samples),
+        'import_ms': statistics.median(s['import_ms'] for s in samples),
+        'max_import_ms': max(s['import_ms'] for s in samples),
+        'pandas_loaded': any(s['pandas_loaded'] for s in samples)
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--budget-ms', type=float, default=60.0,
+                        help='Median core import budget on top of NumPy')
+    args = parser.parse_args()
+
+    results = {name: measure(statement, args.runs) for name, statement in TARGETS.items()}
+    for name, result in results.items():
+        print(f"{name:>8}: {result['import_ms']:6.1f} ms median (max {result['max_import_ms']:.1f}) "
+              f"after numpy {result['numpy_ms']:.1f} ms, pandas loaded: {result['pandas_loaded']}")
+
+    core = results['core']
+    failures = []
+    if core['pandas_loaded']:
+        failures.append('apex_core imports pandas')
+    if core['import_ms'] > args.budget_ms:
+        failures.append(f"apex_core import {core['import_ms']:.1f} ms exceeds {args.budget_ms:.0f} ms budget")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Shared Indicator Cache
+Memoized indicator arrays reused across analysis stages and strategy instances
+
+Entries are keyed by (series fingerprint, indicator name, parameters). The
+fingerprint is a digest of the input values, so two DataFrames carrying the
+same feed hit the same entry while any changed or appended bar misses.
+Inside ``call_scope`` each input array is hashed once however many
+indicators read it; with ``maxsize=0`` nothing is hashed at all.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, Tuple
+
+import numpy as np
+
+
+def series_fingerprint(values: np.ndarray) -> Tuple:
+    """Content-derived identity/version of an input array"""
+    values = np.ascontiguousarray(values)
+    digest = hashlib.blake2b(memoryview(values).cast('B'), digest_size=16).digest()
+    return (values.dtype.str, values.shape, digest)
+
+
+class IndicatorCache:
+    """
+    Thread-safe LRU cache of computed indicator arrays
+
+    Bounded both by entry count (``maxsize``) and by total array bytes
+    (``max_bytes``); ``maxsize=0`` disables storage while keeping the
+    counters. Cached arrays are returned read-only so no caller can corrupt
+    another caller's result.
+    """
+
+    def __init__(self, maxsize: int = 256, max_bytes: int = 512 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Per-thread fingerprint memo of the active call_scope
+        self._scope = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, values: np.ndarray, indicator: str, params: Tuple,
+                       compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return the cached indicator for ``values`` or compute and store it"""
+        if self.maxsize == 0:
+            # Storage is off, so a lookup could never hit: skip hashing the input
+            with self._lock:
+                self.misses += 1
+            result = compute()
+            result.setflags(write=False)
+            return result
+
+        key = (self._fingerprint(values), indicator, params)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        result = compute()
+        result.setflags(write=False)
+        if self.maxsize > 0 and result.nbytes <= self.max_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = result
+                    self._bytes += result.nbytes
+                    self._evict()
+        return result
+
+    @contextmanager
+    def call_scope(self) -> Iterator[None]:
+        """
+        Hash each input array at most once until the scope exits
+
+        One analysis call feeds the same arrays to several indicators; their
+        fingerprints are memoized by identity, holding the arrays so ids are
+        not reused. Scopes nest, and the memo is dropped when the outermost
+        exits since arrays may be changed in place between calls.
+        """
+        if getattr(self._scope, 'fingerprints', None) is not None:
+            yield
+            return
+        self._scope.fingerprints = {}
+        try:
+            yield
+        finally:
+            self._scope.fingerprints = None
+
+    def _fingerprint(self, values: np.ndarray) -> Tuple:
+        fingerprints = getattr(self._scope, 'fingerprints', None)
+        if fingerprints is None:
+            return series_fingerprint(values)
+        entry = fingerprints.get(id(values))
+        if entry is None:
+            entry = fingerprints[id(values)] = (values, series_fingerprint(values))
+        return entry[1]
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.maxsize or self._bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+# Process-wide cache shared by every strategy instance unless one is supplied
+SHARED_INDICATOR_CACHE = IndicatorCache()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - NumPy Indicator Kernels
+EMA, RSI, MACD and rolling window statistics on contiguous float64 arrays
+
+Every kernel works along axis 0 (bars) for 1-D and 2-D (bars x symbols)
+input, leaves leading bars NaN until its window fills, and writes into an
+optional preallocated ``out`` array. Intermediates come from a
+KernelWorkspace when one is given, so a live loop re-analyzing the same
+window size reuses its scratch memory instead of reallocating it.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class KernelWorkspace:
+    """
+    Reusable scratch arrays for kernel intermediates
+
+    Buffers are keyed by name and grow to the largest shape requested, so
+    repeated calls on same-sized windows reuse the same memory. Each thread
+    gets its own buffers.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def buffer(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """Uninitialized float64 array of ``shape`` backed by the named buffer"""
+        buffers: Dict[str, np.ndarray] = self._local.__dict__.setdefault('buffers', {})
+        size = int(np.prod(shape))
+        storage = buffers.get(name)
+        if storage is None or storage.size < size:
+            storage = buffers[name] = np.empty(size)
+        return storage[:size].reshape(shape)
+
+
+def _scratch(workspace: Optional[KernelWorkspace], name: str, shape: Tuple[int, ...]) -> np.ndarray:
+    return workspace.buffer(name, shape) if workspace is not None else np.empty(shape)
+
+
+def _output(out: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+    if out is None:
+        return np.empty(shape)
+    if out.shape != shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {shape}, got {out.dtype} {out.shape}")
+    return out
+
+
+def ema(values: np.ndarray, span: int, out: Optional[np.ndarray] = None,
+        workspace: Optional[KernelWorkspace] = None) -> np.ndarray:
+    """
+    pandas ewm(span=n).mean() (adjust=True) applied per column
+
+    The weighted sum and weight total both follow y[t] = d * y[t-1] + u[t].
+    Within a block of k bars that is a cumulative sum of u scaled by d**-j,
+    rescaled by d**j; blocks are short enough that d**-k cannot overflow.
+    NaN inputs add no weight, so the mean carries forward like pandas.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = _output(out, values.shape)
+    decay = 1 - 2 / (span + 1)
+    observed = ~np.isnan(values)
+    if observed.all():
+        _linear_recurrence(values, decay, out=out)
+        # Without gaps the weight total is the geometric series 1 + d + ... + d**t,
+        # which settles at 1 / (1 - d) once d**t underflows
+        head = _geometric_weights(len(values), decay)
+        out[:len(head)] /= head.reshape((-1,) + (1,) * (values.ndim - 1))
+        out[len(head):] *= 1 - decay
+        return out
+    masked = _scratch(workspace, 'ema_masked', values.shape)
+    np.copyto(masked, values)
+    masked[~observed] = 0.0
+    _linear_recurrence(masked, decay, out=out)
+    denominator = _scratch(workspace, 'ema_weights', values.shape)
+    np.copyto(denominator, observed)
+    _linear_recurrence(denominator, decay, out=denominator)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.divide(out, denominator, out=out)
+
+
+def rsi(close: np.ndarray, period: int, method: str = 'sma', out: Optional[np.ndarray] = None,
+        workspace: Optional[KernelWorkspace] = None) -> np.ndarray:
+    """
+    Relative strength index of close; the leading diff counts as zero
+
+    ``method='sma'`` averages gains and losses over a rolling window;
+    ``'wilder'`` seeds with that same window average at bar ``period - 1``
+    and then smooths with alpha = 1/period, matching the streaming
+    WilderAverage. 100 when there are no losses, NaN when flat.
+    """
+    if method not in ('sma', 'wilder'):
+        raise ValueError(f"Unknown RSI method: {method}")
+    close = np.asarray(close, dtype=np.float64)
+    out = _output(out, close.shape)
+
+    delta = _scratch(workspace, 'rsi_delta', close.shape)
+    delta[:1] = 0.0
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+    gain = _scratch(workspace, 'rsi_gain', close.shape)
+    loss = _scratch(workspace, 'rsi_loss', close.shape)
+    gain.fill(0.0)
+    loss.fill(0.0)
+    np.copyto(gain, delta, where=delta > 0)
+    np.negative(delta, out=delta)
+    np.copyto(loss, delta, where=delta > 0)
+
+    if method == 'sma':
+        rolling_mean(gain, period, out=gain, workspace=workspace)
+        rolling_mean(loss, period, out=loss, workspace=workspace)
+    else:
+        _wilder_average(gain, period)
+        _wilder_average(loss, period)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(gain, loss, out=out)
+        out += 1
+        np.divide(100, out, out=out)
+        return np.subtract(100, out, out=out)
+
+
+def _wilder_average(values: np.ndarray, period: int) -> None:
+    """Wilder-smooth ``values`` in place, NaN before the seed bar"""
+    if len(values) < period:
+        values[...] = np.nan
+        return
+    seed = values[:period].mean(axis=0)
+    values[:period - 1] = np.nan
+    values[period - 1] = seed
+    tail = values[period:]
+    if len(tail):
+        tail /= period
+        _linear_recurrence(tail, 1 - 1 / period, out=tail, initial=seed)
+
+
+def macd(close: np.ndarray, fast: int, slow: int, signal: int,
+         out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+         workspace: Optional[KernelWorkspace] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line, signal line and histogram
+
+    Args:
+        out: Optional (line, signal, histogram) arrays shaped like close
+    """
+    close = np.asarray(close, dtype=np.float64)
+    line, signal_line, histogram = out if out is not None else (None, None, None)
+    line = ema(close, fast, out=line, workspace=workspace)
+    slow_ema = ema(close, slow, out=_scratch(workspace, 'macd_slow', close.shape), workspace=workspace)
+    np.subtract(line, slow_ema, out=line)
+    signal_line = ema(line, signal, out=signal_line, workspace=workspace)
+    histogram = np.subtract(line, signal_line, out=_output(histogram, close.shape))
+    return line, signal_line, histogram
+
+
+def rolling_sum(values: np.ndarray, window: int, out: Optional[np.ndarray] = None,
+                workspace: Optional[KernelWorkspace] = None) -> np.ndarray:
+    """Trailing rolling sum, NaN until the window fills; ``out`` may alias ``values``"""
+    values = np.asarray(values, dtype=np.float64)
+    out = _output(out, values.shape)
+    if len(values) < window:
+        out[...] = np.nan
+        return out
+    sums = _scratch(workspace, 'rolling_cumsum', values.shape)
+    np.cumsum(values, axis=0, out=sums)
+    out[:window - 1] = np.nan
+    out[window - 1] = sums[window - 1]
+    np.subtract(sums[window:], sums[:-window], out=out[window:])
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int, out: Optional[np.ndarray] = None,
+                 workspace: Optional[KernelWorkspace] = None) -> np.ndarray:
+    """Trailing simple moving average, NaN until the window fills"""
+    out = rolling_sum(values, window, out=out, workspace=workspace)
+    out /= window
+    return out
+
+
+def rolling_std(values: np.ndarray, window: int, out: Optional[np.ndarray] = None,
+                workspace: Optional[KernelWorkspace] = None) -> np.ndarray:
+    """Trailing rolling sample standard deviation (ddof=1), NaN until the window fills"""
+    values = np.asarray(values, dtype=np.float64)
+    out = _output(out, values.shape)
+    if len(values) < window or window < 2:
+        out[...] = np.nan
+        return out
+    # Two-pass variance: squared deviations from each window's mean, one lag at a time
+    count = len(values) - window + 1
+    mean = rolling_mean(values, window, out=_scratch(workspace, 'std_mean', values.shape),
+                        workspace=workspace)[window - 1:]
+    deviation = _scratch(workspace, 'std_deviation', mean.shape)
+    total = out[window - 1:]
+    total[...] = 0.0
+    for lag in range(window):
+        np.subtract(values[lag:lag + count], mean, out=deviation)
+        deviation *= deviation
+        total += deviation
+    total /= window - 1
+    np.sqrt(total, out=total)
+    out[:window - 1] = np.nan
+    return out
+
+
+def rolling_max(values: np.ndarray, window: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Trailing rolling maximum, NaN until the window fills (or over any NaN)"""
+    return _rolling_extreme(values, window, out, np.maximum, -np.inf)
+
+
+def rolling_min(values: np.ndarray, window: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Trailing rolling minimum, NaN until the window fills (or over any NaN)"""
+    return _rolling_extreme(values, window, out, np.minimum, np.inf)
+
+
+def _rolling_extreme(values: np.ndarray, window: int, out: Optional[np.ndarray],
+                     combine: np.ufunc, pad: float) -> np.ndarray:
+    """
+    van Herk/Gil-Werman running extreme: O(n) whatever the window
+
+    Bars are cut into blocks of ``window``; every window spans the suffix
+    of one block and the prefix of the next, so its extreme combines one
+    backward and one forward block-wise accumulation.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = _output(out, values.shape)
+    length = len(values)
+    if length < window:
+        out[...] = np.nan
+        return out
+    blocks = -(-length // window)
+    padded = np.full((blocks * window,) + values.shape[1:], pad)
+    padded[:length] = values
+    padded = padded.reshape((blocks, window) + values.shape[1:])
+    prefix = combine.accumulate(padded, axis=1).reshape((-1,) + values.shape[1:])
+    suffix = combine.accumulate(padded[:, ::-1], axis=1)[:, ::-1].reshape((-1,) + values.shape[1:])
+    out[:window - 1] = np.nan
+    combine(suffix[:length - window + 1], prefix[window - 1:length], out=out[window - 1:])
+    return out
+
+
+def _geometric_weights(length: int, decay: float) -> np.ndarray:
+    """Partial sums (1 - d**(t+1)) / (1 - d) up to where d**t underflows (at most ``length``)"""
+    terms = 1 if decay <= 0 else int(np.ceil(40 / -np.log(decay))) + 1
+    return _geometric_head(min(length, terms), decay)
+
+
+@lru_cache(maxsize=64)
+def _geometric_head(terms: int, decay: float) -> np.ndarray:
+    weights = (1 - decay ** np.arange(1, terms + 1)) / (1 - decay)
+    weights.setflags(write=False)
+    return weights
+
+
+@lru_cache(maxsize=64)
+def _block_factors(decay: float, block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """d**-j and d**j for j < block"""
+    steps = np.arange(block, dtype=np.float64)
+    growth = decay ** -steps
+    shrink = decay ** steps
+    growth.setflags(write=False)
+    shrink.setflags(write=False)
+    return growth, shrink
+
+
+def _linear_recurrence(u: np.ndarray, decay: float, out: Optional[np.ndarray] = None,
+                       initial=0.0) -> np.ndarray:
+    """y[t] = decay * y[t-1] + u[t] along axis 0, with y[-1] = initial; ``out`` may alias ``u``"""
+    if out is None:
+        out = np.empty_like(u)
+    if decay <= 0:
+        np.copyto(out, u)
+        return out
+    # d**-block stays below ~1e260, far from float64 overflow
+    block = int(min(8192, len(u), max(1, 600 / -np.log(decay))))
+    growth, shrink = _block_factors(decay, max(block, 1))
+    shape = (-1,) + (1,) * (u.ndim - 1)
+    growth = growth.reshape(shape)
+    shrink = shrink.reshape(shape)
+    carry = np.array(initial, dtype=np.float64)
+    for start in range(0, len(u), block):
+        size = min(block, len(u) - start)
+        target = out[start:start + size]
+        np.multiply(u[start:start + size], growth[:size], out=target)
+        np.cumsum(target, axis=0, out=target)
+        target += decay * carry
+        target *= shrink[:size]
+        carry = target[-1].copy()
+    return out
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Indicator Kernel Micro-Benchmark
+NumPy kernels against the pandas indicator implementation
+
+The live path re-analyzes a short trailing window on every bar. The first
+table replays that loop over a synthetic /CL series and times, per bar, the
+pandas momentum/trend/volume-coherence calculations (Series construction,
+``where``, ``rolling``, ``ewm``) against the same indicators from
+indicator_kernels with preallocated outputs and a shared workspace. The
+second table times each kernel against its pandas counterpart on longer
+series. Every comparison first checks that both sides agree.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import indicator_kernels as kernels
+
+RSI_PERIOD = 14
+MACD = (12, 26, 9)
+EMAS = (9, 21, 50)
+VOLUME_WINDOW = 10
+BB_PERIOD = 20
+
+
+def synthetic_bars(length: int, seed: int = 7) -> Tuple[np.ndarray, np.ndarray]:
+    """Random-walk /CL closes around $70 and hourly contract volumes"""
+    rng = np.random.default_rng(seed)
+    close = 70 + np.cumsum(rng.standard_normal(length) * 0.15)
+    volume = rng.integers(1000, 10000, length).astype(np.float64)
+    return close, volume
+
+
+def pandas_window(close: np.ndarray, volume: np.ndarray) -> List[float]:
+    """Latest RSI, MACD histogram, EMAs and volume average, the pandas way"""
+    prices = pd.Series(close)
+    delta = prices.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=RSI_PERIOD).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=RSI_PERIOD).mean()
+    rsi = 100 - (100 / (1 + gain / loss))
+    fast, slow, signal = MACD
+    macd_line = prices.ewm(span=fast).mean() - prices.ewm(span=slow).mean()
+    histogram = macd_line - macd_line.ewm(span=signal).mean()
+    emas = [prices.ewm(span=span).mean().iloc[-1] for span in EMAS]
+    volume_ma = pd.Series(volume).rolling(window=VOLUME_WINDOW).mean()
+    return [rsi.iloc[-1], histogram.iloc[-1], *emas, volume_ma.iloc[-1]]
+
+
+class KernelWindow:
+    """The same latest-bar indicators from the NumPy kernels with reused buffers"""
+
+    def __init__(self, window: int):
+        self.workspace = kernels.KernelWorkspace()
+        self.rsi = np.empty(window)
+        self.macd = (np.empty(window), np.empty(window), np.empty(window))
+        self.ema = np.empty(window)
+        self.volume_ma = np.empty(window)
+
+    def __call__(self, close: np.ndarray, volume: np.ndarray) -> List[float]:
+        rsi = kernels.rsi(close, RSI_PERIOD, out=self.rsi, workspace=self.workspace)
+        histogram = kernels.macd(close, *MACD, out=self.macd, workspace=self.workspace)[2]
+        emas = [kernels.ema(close, span, out=self.ema, workspace=self.workspace)[-1] for span in EMAS]
+        volume_ma = kernels.rolling_mean(volume, VOLUME_WINDOW, out=self.volume_ma,
+                                         workspace=self.workspace)
+        return [rsi[-1], histogram[-1], *emas, volume_ma[-1]]
+
+
+def per_bar_benchmark(window: int, bars: int) -> Dict[str, float]:
+    """Mean microseconds per bar for a sliding-window replay"""
+    close, volume = synthetic_bars(window + bars)
+    kernel_window = KernelWindow(window)
+    for end in range(window, window + bars, max(1, bars // 20)):
+        expected = pandas_window(close[end - window:end], volume[end - window:end])
+        actual = kernel_window(close[end - window:end], volume[end - window:end])
+        if not np.allclose(expected, actual, rtol=1e-9, equal_nan=True):
+            raise AssertionError(f"kernel window disagrees with pandas at bar {end}: {actual} vs {expected}")
+
+    timings = {}
+    for name, analyze in (('pandas', pandas_window), ('kernels', kernel_window)):
+        started = time.perf_counter()
+        for end in range(window, window + bars):
+            analyze(close[end - window:end], volume[end - window:end])
+        timings[name] = (time.perf_counter() - started) / bars * 1e6
+    return timings
+
+
+def kernel_cases() -> Dict[str, Tuple[Callable, Callable]]:
+    """(kernel, pandas) callables per indicator, both taking a float64 array"""
+    def pandas_rsi(values: np.ndarray) -> np.ndarray:
+        delta = pd.Series(values).diff()
+        gain = delta.where(delta > 0, 0).rolling(window=RSI_PERIOD).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=RSI_PERIOD).mean()
+        return (100 - (100 / (1 + gain / loss))).to_numpy()
+
+    def pandas_wilder_rsi(values: np.ndarray) -> np.ndarray:
+        delta = pd.Series(values).diff().fillna(0.0)
+        averages = []
+        for side in (delta.clip(lower=0), (-delta).clip(lower=0)):
+            # Seed with the first window's mean, then smooth with alpha = 1/period
+            seeded = side.copy()
+            seeded.iloc[:RSI_PERIOD] = np.nan
+            seeded.iloc[RSI_PERIOD - 1] = side.iloc[:RSI_PERIOD].mean()
+            averages.append(seeded.ewm(alpha=1 / RSI_PERIOD, adjust=False).mean())
+        return (100 - (100 / (1 + averages[0] / averages[1]))).to_numpy()
+
+    def pandas_macd(values: np.ndarray) -> np.ndarray:
+        prices = pd.Series(values)
+        macd_line = prices.ewm(span=MACD[0]).mean() - prices.ewm(span=MACD[1]).mean()
+        return (macd_line - macd_line.ewm(span=MACD[2]).mean()).to_numpy()
+
+    return {
+        'ema(21)': (lambda values: kernels.ema(values, 21),
+                    lambda values: pd.Series(values).ewm(span=21).mean().to_numpy()),
+        'rsi(14)': (lambda values: kernels.rsi(values, RSI_PERIOD), pandas_rsi),
+        'wilder rsi(14)': (lambda values: kernels.rsi(values, RSI_PERIOD, 'wilder'), pandas_wilder_rsi),
+        'macd histogram': (lambda values: kernels.macd(values, *MACD)[2], pandas_macd),
+        'rolling mean(20)': (lambda values: kernels.rolling_mean(values, BB_PERIOD),
+                             lambda values: pd.Series(values).rolling(BB_PERIOD).mean().to_numpy()),
+        'rolling max(14)': (lambda values: kernels.rolling_max(values, RSI_PERIOD),
+                            lambda values: pd.Series(values).rolling(RSI_PERIOD).max().to_numpy()),
+        'rolling min(14)': (lambda values: kernels.rolling_min(values, RSI_PERIOD),
+                            lambda values: pd.Series(values).rolling(RSI_PERIOD).min().to_numpy()),
+        'rolling std(20)': (lambda values: kernels.rolling_std(values, BB_PERIOD),
+                            lambda values: pd.Series(values).rolling(BB_PERIOD).std().to_numpy())
+    }
+
+
+def best_time(function: Callable, values: np.ndarray, repeat: int) -> float:
+    """Fastest of ``repeat`` runs, in seconds, with enough calls per run to time short inputs"""
+    calls = max(1, 20000 // len(values))
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            function(values)
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--window', type=int, default=100, help='Live-path analysis window in bars')
+    parser.add_argument('--bars', type=int, default=2000, help='Bars replayed through the window')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 10_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    timings = per_bar_benchmark(args.window, args.bars)
+    print(f"Live path, {args.window}-bar window, {args.bars} bars "
+          f"(RSI, MACD, {len(EMAS)} EMAs, volume average per bar)")
+    print(f"  pandas  {timings['pandas']:9.1f} us/bar")
+    print(f"  kernels {timings['kernels']:9.1f} us/bar   {timings['pandas'] / timings['kernels']:5.1f}x")
+
+    print(f"\n{'kernel':<18}{'bars':>10}{'numpy us':>12}{'pandas us':>12}{'speedup':>9}")
+    for size in args.sizes:
+        values, _ = synthetic_bars(size)
+        for name, (kernel, reference) in kernel_cases().items():
+            if not np.allclose(kernel(values), reference(values), rtol=1e-7, atol=1e-9, equal_nan=True):
+                raise AssertionError(f"{name} disagrees with pandas on {size} bars")
+            numpy_time = best_time(kernel, values, args.repeat)
+            pandas_time = best_time(reference, values, args.repeat)
+            print(f"{name:<18}{size:>10}{numpy_time * 1e6:>12.1f}{pandas_time * 1e6:>12.1f}"
+                  f"{pandas_time / numpy_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - asyncio Live Feed Driver and Local Replay Server
+Bar feed -> generate_trading_signal with backpressure and latency tracking
+
+Wire format: newline-delimited JSON, one completed bar per line:
+    {"timestamp": <ns>, "open": .., "high": .., "low": .., "close": ..,
+     "volume": .., "sent_at": <wall-clock ns when the bar was published>}
+
+The driver keeps a bounded window of recent bars and runs analysis in an
+executor so the event loop keeps reading the socket. When analysis falls
+behind it either applies backpressure (stop reading, letting TCP flow
+control throttle the sender) or drops to the latest bar. Latency is
+measured from the bar's ``sent_at`` stamp to the moment its analysis ends.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Callable, Deque, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from trading_log import TRADING_LOGGER
+
+logger = logging.getLogger(TRADING_LOGGER)
+
+OVERFLOW_POLICIES = ('block', 'latest')
+
+
+class LatencyRecorder:
+    """Bounded reservoir of recent latency samples in milliseconds"""
+
+    def __init__(self, max_samples: int = 100_000):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+
+    def record(self, latency_ms: float) -> None:
+        self._samples.append(latency_ms)
+        self.count += 1
+
+    def percentiles(self) -> Dict:
+        if not self._samples:
+            return {'count': 0}
+        samples = np.fromiter(self._samples, dtype=np.float64)
+        p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+        return {
+            'count': self.count,
+            'p50_ms': float(p50),
+            'p90_ms': float(p90),
+            'p99_ms': float(p99),
+            'max_ms': float(samples.max())
+        }
+
+
+def _bar_to_message(timestamp_ns: int, bar) -> bytes:
+    return (json.dumps({
+        'timestamp': int(timestamp_ns),
+        'open': float(bar.open),
+        'high': float(bar.high),
+        'low': float(bar.low),
+        'close': float(bar.close),
+        'volume': float(bar.volume),
+        'sent_at': time.time_ns()
+    }) + '\n').encode()
+
+
+class BarReplayServer:
+    """
+    Local TCP server that streams a recorded bar file to every client
+
+    Args:
+        source: BarStore directory, CSV file or OHLCV DataFrame
+        speed: Replay speed relative to the recorded bar spacing;
+            ``0`` streams as fast as clients will read
+    """
+
+    def __init__(self, source, host: str = '127.0.0.1', port: int = 0, speed: float = 0.0):
+        self.bars = self._load(source)
+        self.host = host
+        self.port = port
+        self.speed = speed
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @staticmethod
+    def _load(source) -> pd.DataFrame:
+        if isinstance(source, pd.DataFrame):
+            bars = source
+        elif os.path.isdir(source):
+            from bar_store import BarStore
+            bars = BarStore(source).read()
+        else:
+            bars = pd.read_csv(source, parse_dates=['timestamp'])
+        return bars.reset_index(drop=True)
+
+    async def start(self) -> int:
+        """Start listening; returns the bound port"""
+        self._server = await asyncio.start_server(self._stream, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("APEX Sniper replay server streaming %d bars on %s:%d at speed %s",
+                    len(self.bars), self.host, self.port, self.speed or 'max')
+        return self.port
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        stamps = pd.to_datetime(self.bars['timestamp']).to_numpy(dtype='datetime64[ns]').view(np.int64)
+        replay_start = time.monotonic()
+        try:
+            for i, bar in enumerate(self.bars.itertuples(index=False)):
+                if self.speed > 0:
+                    due = replay_start + (stamps[i] - stamps[0]) / 1e9 / self.speed
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                writer.write(_bar_to_message(stamps[i], bar))
+                # drain() blocks while the client is not reading: TCP backpressure
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            writer.close()
+
+
+class LiveFeedDriver:
+    """
+    Subscribe to a bar socket and run APEX Sniper analysis per bar
+
+    Args:
+        strategy: APEXSniperStrategy (anything with generate_trading_signal)
+        window: Number of recent bars handed to each analysis
+        min_bars: Bars to collect before the first analysis
+        overflow: 'block' to stop reading while ``queue_size`` bars await
+            analysis, or 'latest' to coalesce pending bars and analyze only
+            the newest one
+        executor: Where analysis runs; default is the loop's thread pool
+        on_signal: Called with (signal, latency_ms) when a signal fires
+    """
+
+    def __init__(self, strategy, host: str = '127.0.0.1', port: int = 9100,
+                 window: int = 500, min_bars: int = 50, overflow: str = 'latest',
+                 queue_size: int = 64,
+                 executor: Optional[Executor] = None,
+                 on_signal: Optional[Callable] = None):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.strategy = strategy
+        self.host = host
+        self.port = port
+        self.overflow = overflow
+        self.executor = executor
+        self.on_signal = on_signal
+        self.min_bars = min_bars
+
+        self._window: Deque[Dict] = deque(maxlen=window)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=1 if overflow == 'latest' else queue_size)
+
+        self.latency = LatencyRecorder()
+        self.bars_received = 0
+        self.bars_analyzed = 0
+        self.bars_coalesced = 0
+        self.signals_generated = 0
+        self.analysis_errors = 0
+        self.malformed_messages = 0
+
+    async def run(self, max_bars: Optional[int] = None) -> Dict:
+        """Consume the feed until it closes (or ``max_bars``); returns stats"""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        worker = asyncio.create_task(self._analyze_loop())
+        try:
+            while max_bars is None or self.bars_received < max_bars:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    bar = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partial or corrupt line loses that bar only
+                    self.malformed_messages += 1
+                    logger.warning("APEX Sniper live feed: skipping malformed message %r", line[:200])
+                    continue
+                await self._on_message(bar)
+        finally:
+            writer.close()
+            if not worker.done():
+                await self._queue.put(None)
+            await worker
+        return self.stats()
+
+    async def _on_message(self, bar: Dict) -> None:
+        bar['received_at'] = time.time_ns()
+        self._window.append(bar)
+        self.bars_received += 1
+        if len(self._window) < self.min_bars:
+            return
+        # Each queue item is an immutable snapshot of the window at this bar
+        snapshot = (bar, list(self._window))
+
+        if self.overflow == 'block':
+            await self._queue.put(snapshot)
+            return
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.bars_coalesced += 1
+        self._queue.put_nowait(snapshot)
+        # Buffered lines are read without awaiting; yield so analysis can pick this bar up
+        await asyncio.sleep(0)
+
+    async def _analyze_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            bar, bars = item
+            try:
+                signal = await loop.run_in_executor(self.executor, self._analyze, bars)
+            except Exception:
+                # A bad bar must not take the feed down; count it and carry on
+                self.analysis_errors += 1
+                logger.exception("APEX Sniper live analysis failed")
+                continue
+            latency_ms = (time.time_ns() - bar.get('sent_at', bar['received_at'])) / 1e6
+            self.latency.record(latency_ms)
+            self.bars_analyzed += 1
+            if signal is not None:
+                self.signals_generated += 1
+                if self.on_signal:
+                    self.on_signal(signal, latency_ms)
+
+    def _analyze(self, bars) -> Optional[object]:
+        frame = pd.DataFrame.from_records(bars, columns=['timestamp', 'open', 'high', 'low',
+                                                         'close', 'volume'])
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+        return self.strategy.generate_trading_signal(frame)
+
+    def stats(self) -> Dict:
+        return {
+            'bars_received': self.bars_received,
+            'bars_analyzed': self.bars_analyzed,
+            'bars_coalesced': self.bars_coalesced,
+            'signals_generated': self.signals_generated,
+            'analysis_errors': self.analysis_errors,
+            'malformed_messages': self.malformed_messages,
+            'latency': self.latency.percentiles()
+        }
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    from strategy_loader import load_strategy_module
+
+    async def replay_demo() -> None:
+        bars = 2_000
+        rng = np.random.default_rng(21)
+        close = 70 + np.cumsum(rng.standard_normal(bars) * 0.05)
+        recorded = pd.DataFrame({
+            'timestamp': pd.date_range(start='2024-03-01', periods=bars, freq='1min'),
+            'open': close + rng.standard_normal(bars) * 0.01,
+            'high': close + np.abs(rng.standard_normal(bars)) * 0.06,
+            'low': close - np.abs(rng.standard_normal(bars)) * 0.06,
+            'close': close,
+            'volume': rng.integers(1000, 10000, bars)
+        })
+
+        server = BarReplayServer(recorded, speed=0)
+        port = await server.start()
+        strategy = load_strategy_module().APEXSniperStrategy(capital=1000000)
+        for policy in OVERFLOW_POLICIES:
+            driver = LiveFeedDriver(strategy, port=port, window=300, overflow=policy)
+            print(policy, await driver.run())
+        await server.stop()
+
+    asyncio.run(replay_demo())
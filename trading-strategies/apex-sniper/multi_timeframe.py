@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Multi-Timeframe Bar Rollup
+Higher-timeframe bars and indicators derived from one base bar series
+
+Base bars (e.g. 1-hour) are bucketed by timestamp into each higher
+timeframe (e.g. 4-hour, daily). Only the forming bar of each timeframe is
+kept; completed bars go straight into that timeframe's own
+StreamingIndicatorEngine, so nothing is copied or recomputed and a new base
+bar costs O(1) per timeframe. A higher-timeframe bar completes when the
+first base bar of a later bucket arrives, so its indicators never see the
+future. Buckets are aligned to the Unix epoch (UTC).
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from streaming_indicators import StreamingIndicatorEngine
+
+DEFAULT_TIMEFRAMES = {'4h': 4 * 3600, '1d': 24 * 3600}
+
+
+def _to_ns(timestamps: np.ndarray) -> np.ndarray:
+    """datetime64 (any unit) or int64 nanoseconds to int64 nanoseconds"""
+    timestamps = np.asarray(timestamps)
+    if timestamps.dtype.kind == 'M':
+        return timestamps.astype('datetime64[ns]').view(np.int64)
+    return timestamps.astype(np.int64, copy=False)
+
+
+class TimeframeRollup:
+    """
+    One higher timeframe: the forming bar plus indicator state over completed bars
+
+    Args:
+        seconds: Bar length of this timeframe
+        indicators: APEX Sniper indicator parameters for the timeframe's engine
+        rsi_method: RSI smoothing passed to StreamingIndicatorEngine
+    """
+
+    def __init__(self, seconds: float, indicators: Dict, rsi_method: str = 'sma'):
+        if seconds <= 0:
+            raise ValueError("Timeframe length must be positive")
+        self.seconds = seconds
+        self._interval_ns = int(seconds * 1_000_000_000)
+        self.engine = StreamingIndicatorEngine(indicators, rsi_method=rsi_method)
+        self.bars_completed = 0
+
+        self._key: Optional[int] = None
+        self._open = self._high = self._low = self._close = self._volume = np.nan
+
+    def update(self, timestamps: np.ndarray, open: np.ndarray, high: np.ndarray,
+               low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> int:
+        """
+        Fold base bars (int64 ns timestamps, oldest first) into this timeframe
+
+        Returns:
+            int: Higher-timeframe bars completed by these base bars
+        """
+        if len(timestamps) == 0:
+            return 0
+        if len(timestamps) == 1:
+            return self._update_one(int(timestamps[0]) // self._interval_ns, float(open[0]),
+                                    float(high[0]), float(low[0]), float(close[0]), float(volume[0]))
+        keys = timestamps // self._interval_ns
+        starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+        ends = np.concatenate((starts[1:], [len(keys)])) - 1
+        segment_keys = keys[starts]
+        opens = open[starts]
+        highs = np.maximum.reduceat(high, starts)
+        lows = np.minimum.reduceat(low, starts)
+        closes = close[ends]
+        volumes = np.add.reduceat(volume, starts)
+
+        completed = 0
+        if self._key is not None:
+            if segment_keys[0] == self._key:
+                # The first segment continues the forming bar
+                highs[0] = max(highs[0], self._high)
+                lows[0] = min(lows[0], self._low)
+                volumes[0] += self._volume
+                opens[0] = self._open
+            else:
+                self._complete(self._open, self._high, self._low, self._close, self._volume)
+                completed += 1
+
+        # Every segment but the last is complete; the last keeps forming
+        for index in range(len(starts) - 1):
+            self._complete(opens[index], highs[index], lows[index], closes[index], volumes[index])
+            completed += 1
+        self._key = int(segment_keys[-1])
+        self._open, self._high, self._low = float(opens[-1]), float(highs[-1]), float(lows[-1])
+        self._close, self._volume = float(closes[-1]), float(volumes[-1])
+        return completed
+
+    def _update_one(self, key: int, open: float, high: float, low: float, close: float,
+                    volume: float) -> int:
+        """Scalar form of update for the live one-bar-at-a-time case"""
+        if key == self._key:
+            self._high = max(self._high, high)
+            self._low = min(self._low, low)
+            self._close = close
+            self._volume += volume
+            return 0
+        completed = 0
+        if self._key is not None:
+            self._complete(self._open, self._high, self._low, self._close, self._volume)
+            completed = 1
+        self._key = key
+        self._open, self._high, self._low, self._close, self._volume = open, high, low, close, volume
+        return completed
+
+    def _complete(self, open: float, high: float, low: float, close: float, volume: float) -> None:
+        self.engine.on_bar(float(open), float(high), float(low), float(close), float(volume))
+        self.bars_completed += 1
+
+
+class MultiTimeframeRollup:
+    """
+    Higher timeframes rolled up from one base bar stream
+
+    Args:
+        indicators: APEX Sniper indicator parameters, shared by every timeframe
+        timeframes: Timeframe name -> bar length in seconds
+        rsi_method: RSI smoothing for the timeframe engines
+
+    ``update`` may be handed the full base history on every call: only bars
+    newer than the last one seen are consumed, located by binary search.
+    """
+
+    def __init__(self, indicators: Dict, timeframes: Optional[Dict[str, float]] = None,
+                 rsi_method: str = 'sma'):
+        timeframes = DEFAULT_TIMEFRAMES if timeframes is None else timeframes
+        self.timeframes = {name: TimeframeRollup(seconds, indicators, rsi_method)
+                           for name, seconds in timeframes.items()}
+        self.last_timestamp: Optional[int] = None
+        self.base_bars = 0
+
+    def new_bars_start(self, timestamps: np.ndarray) -> int:
+        """Index of the first bar in a sorted history that has not been consumed yet"""
+        if self.last_timestamp is None:
+            return 0
+        timestamps = np.asarray(timestamps)
+        last = self.last_timestamp
+        if timestamps.dtype.kind == 'M':
+            last = np.datetime64(last, 'ns')
+        return int(np.searchsorted(timestamps, last, side='right'))
+
+    def update(self, timestamps: np.ndarray, open: np.ndarray, high: np.ndarray,
+               low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> int:
+        """
+        Consume base bars not seen before
+
+        Args:
+            timestamps: datetime64 or int64 ns bar timestamps, sorted
+            open, high, low, close, volume: Base bar arrays aligned with timestamps
+
+        Returns:
+            int: Number of new base bars consumed
+        """
+        start = self.new_bars_start(timestamps)
+        timestamps = _to_ns(timestamps[start:])
+        if len(timestamps) == 0:
+            return 0
+        arrays = [np.asarray(values[start:], dtype=np.float64) for values in (open, high, low, close, volume)]
+        for rollup in self.timeframes.values():
+            rollup.update(timestamps, *arrays)
+        self.last_timestamp = int(timestamps[-1])
+        self.base_bars += len(timestamps)
+        return len(timestamps)
+
+    def engines(self) -> Dict[str, StreamingIndicatorEngine]:
+        """Indicator engine per timeframe, current as of the last completed bar"""
+        return {name: rollup.engine for name, rollup in self.timeframes.items()}
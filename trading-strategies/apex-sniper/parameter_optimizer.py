@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Parallel Parameter Optimizer
+Grid and random search over indicators / entry_criteria on a process pool
+
+The OHLCV history is published once into shared memory; each worker attaches
+to it in its initializer, so tasks only carry a small parameter dict instead
+of a pickled DataFrame. Results stream back as they complete and are ranked
+by the chosen backtest metric.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import itertools
+import logging
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backtester import APEXSniperStrategy, VectorizedBacktester
+from trading_log import TRADING_LOGGER, configure_worker_logging
+
+logger = logging.getLogger(TRADING_LOGGER)
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Worker-process state, populated once by _init_worker
+_worker_data: Optional[pd.DataFrame] = None
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+
+class SharedOHLCV:
+    """
+    OHLCV columns published into POSIX shared memory
+
+    One float64 block holds the five price/volume columns and a second int64
+    block holds timestamps as nanoseconds. ``handle`` is the small picklable
+    descriptor passed to workers.
+    """
+
+    def __init__(self, ohlcv_data: pd.DataFrame):
+        bars = len(ohlcv_data)
+        values = np.column_stack([ohlcv_data[c].to_numpy(dtype=np.float64) for c in OHLCV_COLUMNS])
+        self._values = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=np.float64, buffer=self._values.buf)[:] = values
+
+        self._timestamps = None
+        if 'timestamp' in ohlcv_data:
+            stamps = pd.to_datetime(ohlcv_data['timestamp']).to_numpy(dtype='datetime64[ns]').view(np.int64)
+            self._timestamps = shared_memory.SharedMemory(create=True, size=max(stamps.nbytes, 1))
+            np.ndarray(stamps.shape, dtype=np.int64, buffer=self._timestamps.buf)[:] = stamps
+
+        self.handle = {
+            'bars': bars,
+            'values': self._values.name,
+            'timestamps': self._timestamps.name if self._timestamps else None
+        }
+
+    def close(self) -> None:
+        for block in (self._values, self._timestamps):
+            if block is not None:
+                block.close()
+                block.unlink()
+
+    def __enter__(self) -> 'SharedOHLCV':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_ohlcv(handle: Dict) -> Tuple[pd.DataFrame, List[shared_memory.SharedMemory]]:
+    """Rebuild an OHLCV DataFrame over shared memory published by SharedOHLCV"""
+    bars = handle['bars']
+    values_block = shared_memory.SharedMemory(name=handle['values'])
+    blocks = [values_block]
+    values = np.ndarray((bars, len(OHLCV_COLUMNS)), dtype=np.float64, buffer=values_block.buf)
+    columns = {name: values[:, i] for i, name in enumerate(OHLCV_COLUMNS)}
+
+    if handle['timestamps']:
+        stamps_block = shared_memory.SharedMemory(name=handle['timestamps'])
+        blocks.append(stamps_block)
+        stamps = np.ndarray((bars,), dtype=np.int64, buffer=stamps_block.buf)
+        columns = {'timestamp': stamps.view('datetime64[ns]'), **columns}
+
+    return pd.DataFrame(columns, copy=False), blocks
+
+
+def _init_worker(handle: Dict) -> None:
+    """Attach to the shared history once per worker process"""
+    global _worker_data, _worker_blocks
+    _worker_data, _worker_blocks = attach_ohlcv(handle)
+    # Per-trade sizing logs would swamp the parent's console
+    configure_worker_logging(logging.WARNING)
+
+
+def apply_parameters(params: Dict) -> Tuple[Dict, Dict]:
+    """
+    Split dotted parameter keys into strategy overrides
+
+    ``indicators.<group>.<name>`` keys become indicator overrides and
+    ``entry_criteria.<name>`` keys become entry criteria overrides.
+    """
+    indicators: Dict[str, Dict] = {}
+    entry_criteria: Dict = {}
+    for key, value in params.items():
+        parts = key.split('.')
+        if parts[0] == 'indicators' and len(parts) == 3:
+            indicators.setdefault(parts[1], {})[parts[2]] = value
+        elif parts[0] == 'entry_criteria' and len(parts) == 2:
+            entry_criteria[parts[1]] = value
+        else:
+            raise ValueError(f"Unknown strategy parameter: {key}")
+    return indicators, entry_criteria
+
+
+def _evaluate(task_id: int, params: Dict, capital: float, seed: int,
+              backtest_options: Dict) -> Dict:
+    """Backtest one parameter set against the worker's shared history"""
+    started = time.perf_counter()
+    indicators, entry_criteria = apply_parameters(params)
+    # One seed for every parameter set: candidates are ranked on the same draws
+    strategy = APEXSniperStrategy(capital=capital, indicators=indicators,
+                                  entry_criteria=entry_criteria, random_seed=seed)
+    result = VectorizedBacktester(strategy, **backtest_options).run(_worker_data)
+
+    return {
+        'task_id': task_id,
+        'params': params,
+        'seed': seed,
+        'worker_pid': os.getpid(),
+        'task_seconds': time.perf_counter() - started,
+        **result.summary()
+    }
+
+
+def grid_search_space(grid: Dict[str, Sequence]) -> List[Dict]:
+    """Cartesian product of candidate values per dotted parameter key"""
+    keys = list(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+def random_search_space(space: Dict[str, object], samples: int, seed: int = 0) -> List[Dict]:
+    """
+    Random parameter sets
+
+    Each entry in ``space`` is a list of choices, an ``(low, high)`` int tuple
+    (inclusive) or an ``(low, high)`` float tuple (uniform).
+    """
+    rng = random.Random(seed)
+    parameter_sets = []
+    for _ in range(samples):
+        params = {}
+        for key, spec in space.items():
+            if isinstance(spec, tuple):
+                low, high = spec
+                if isinstance(low, int) and isinstance(high, int):
+                    params[key] = rng.randint(low, high)
+                else:
+                    params[key] = rng.uniform(low, high)
+            else:
+                params[key] = rng.choice(list(spec))
+        parameter_sets.append(params)
+    return parameter_sets
+
+
+class ParameterOptimizer:
+    """
+    Fan APEX Sniper parameter sets out across a ProcessPoolExecutor
+
+    Args:
+        ohlcv_data: History to backtest every parameter set against
+        metric: BacktestResult.summary() key to rank by (higher is better)
+        max_workers: Pool size, defaults to the CPU count
+        backtest_options: Keyword arguments for VectorizedBacktester
+        seed: Quantum probability seed shared by every parameter set, so
+            candidates are compared on the same random draws
+    """
+
+    def __init__(self, ohlcv_data: pd.DataFrame, metric: str = 'total_pnl',
+                 capital: float = 1000000, max_workers: Optional[int] = None,
+                 backtest_options: Optional[Dict] = None, seed: int = 0):
+        self.ohlcv_data = ohlcv_data
+        self.metric = metric
+        self.capital = capital
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backtest_options = backtest_options or {}
+        self.seed = seed
+
+    def iter_results(self, parameter_sets: Sequence[Dict]) -> Iterator[Dict]:
+        """Yield each parameter set's backtest summary as soon as it completes"""
+        with SharedOHLCV(self.ohlcv_data) as shared, ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker,
+                initargs=(shared.handle,)) as pool:
+            futures = [
+                pool.submit(_evaluate, task_id, params, self.capital,
+                            self.seed, self.backtest_options)
+                for task_id, params in enumerate(parameter_sets)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def run(self, parameter_sets: Sequence[Dict],
+            on_result: Optional[Callable[[Dict], None]] = None) -> pd.DataFrame:
+        """
+        Evaluate every parameter set and return the ranked results table
+
+        ``on_result`` is called with each result as it streams in.
+        """
+        started = time.perf_counter()
+        rows = []
+        for result in self.iter_results(parameter_sets):
+            if on_result:
+                on_result(result)
+            rows.append({**result.pop('params'), **result})
+
+        elapsed = time.perf_counter() - started
+        table = pd.DataFrame(rows)
+        if not table.empty:
+            table = table.sort_values(self.metric, ascending=False, kind='stable').reset_index(drop=True)
+            table.insert(0, 'rank', np.arange(1, len(table) + 1))
+            busy = table['task_seconds'].sum()
+            logger.info("APEX Sniper optimizer: %d parameter sets in %.2fs on %d workers "
+                        "(%.1fx parallel speedup)", len(table), elapsed, self.max_workers, busy / elapsed)
+        return table
+
+    def grid_search(self, grid: Dict[str, Sequence], **kwargs) -> pd.DataFrame:
+        return self.run(grid_search_space(grid), **kwargs)
+
+    def random_search(self, space: Dict[str, object], samples: int, **kwargs) -> pd.DataFrame:
+        return self.run(random_search_space(space, samples, seed=self.seed), **kwargs)
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    bars = 100_000
+    rng = np.random.default_rng(7)
+    close = 70 + np.cumsum(rng.standard_normal(bars) * 0.02)
+    sample_data = pd.DataFrame({
+        'timestamp': pd.date_range(start='2022-01-01', periods=bars, freq='1min'),
+        'open': close + rng.standard_normal(bars) * 0.005,
+        'high': close + np.abs(rng.standard_normal(bars)) * 0.03,
+        'low': close - np.abs(rng.standard_normal(bars)) * 0.03,
+        'close': close,
+        'volume': rng.integers(1000, 10000, bars)
+    })
+
+    optimizer = ParameterOptimizer(sample_data)
+    ranked = optimizer.grid_search({
+        'indicators.momentum.rsi_period': [10, 14, 21],
+        'indicators.trend.ema_fast': [5, 9, 13],
+        'entry_criteria.min_confluence_signals': [2, 3],
+        'entry_criteria.min_risk_reward_ratio': [1.3]
+    })
+    print(ranked.head(10).to_string())
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Indexed Open-Position Book
+Array-backed positions with incremental exposure, margin and risk aggregates
+
+Each working position occupies a slot in a set of parallel NumPy arrays;
+closed slots go on a free list and are reused. Positions are indexed by
+symbol, direction and regime, and every fill or close adjusts the per-symbol,
+per-direction, per-regime and book-wide aggregates by the fill's delta.
+Limit checks read those aggregates and never scan the book.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+from typing import Dict, Hashable, List, Optional, Set
+
+import numpy as np
+
+LONG = 1
+SHORT = -1
+
+
+def _direction_index(direction: int) -> int:
+    if direction not in (LONG, SHORT):
+        raise ValueError(f"Direction must be {LONG} (long) or {SHORT} (short), got {direction}")
+    return 0 if direction == LONG else 1
+
+
+class PositionBook:
+    """
+    Open positions across symbols and strategies
+
+    Args:
+        capacity: Initial slot count; arrays double when full
+
+    Dollar figures use each symbol's point value (dollars per 1.0 price
+    move per contract), supplied with the first fill for that symbol.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._capacity = capacity
+        self.symbol_code = np.zeros(capacity, dtype=np.int32)
+        self.regime_code = np.zeros(capacity, dtype=np.int32)
+        self.direction = np.zeros(capacity, dtype=np.int8)
+        self.contracts = np.zeros(capacity, dtype=np.int64)
+        self.entry_price = np.zeros(capacity, dtype=np.float64)
+        self.stop_loss = np.zeros(capacity, dtype=np.float64)
+        self.margin_per_contract = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.strategy: List[Optional[str]] = [None] * capacity
+
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._next_id = 0
+        self._slot_by_id: Dict[int, int] = {}
+        self._id_by_slot: Dict[int, int] = {}
+
+        # Code tables; per-code aggregate arrays grow alongside them
+        self._symbols: Dict[str, int] = {}
+        self._regimes: Dict[Hashable, int] = {}
+        self._by_symbol: List[Set[int]] = []
+        self._by_regime: List[Set[int]] = []
+        self._by_direction = (set(), set())
+
+        self.point_value = np.zeros(0)
+        self.mark_price = np.zeros(0)
+        self.symbol_long = np.zeros(0, dtype=np.int64)
+        self.symbol_short = np.zeros(0, dtype=np.int64)
+        self.symbol_margin = np.zeros(0)
+        self.symbol_risk = np.zeros(0)
+        self.regime_contracts = np.zeros(0, dtype=np.int64)
+        self.regime_notional = np.zeros(0)
+        self.regime_risk = np.zeros(0)
+
+        self.direction_contracts = np.zeros(2, dtype=np.int64)
+        self.direction_notional = np.zeros(2)  # at mark
+        self.total_margin = 0.0
+        self.total_risk_at_stop = 0.0
+        self.realized_pnl = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    # ------------------------------------------------------------------ codes
+
+    def _symbol(self, symbol: str, point_value: Optional[float] = None) -> int:
+        code = self._symbols.get(symbol)
+        if code is None:
+            if point_value is None:
+                raise KeyError(f"Unknown symbol {symbol}; the first fill must supply its point value")
+            code = len(self._symbols)
+            self._symbols[symbol] = code
+            self._by_symbol.append(set())
+            self.point_value = np.append(self.point_value, point_value)
+            self.mark_price = np.append(self.mark_price, 0.0)
+            self.symbol_long = np.append(self.symbol_long, 0)
+            self.symbol_short = np.append(self.symbol_short, 0)
+            self.symbol_margin = np.append(self.symbol_margin, 0.0)
+            self.symbol_risk = np.append(self.symbol_risk, 0.0)
+        return code
+
+    def _regime(self, regime: Hashable) -> int:
+        code = self._regimes.get(regime)
+        if code is None:
+            code = len(self._regimes)
+            self._regimes[regime] = code
+            self._by_regime.append(set())
+            self.regime_contracts = np.append(self.regime_contracts, 0)
+            self.regime_notional = np.append(self.regime_notional, 0.0)
+            self.regime_risk = np.append(self.regime_risk, 0.0)
+        return code
+
+    def _grow(self) -> None:
+        old = self._capacity
+        self._capacity *= 2
+        for name in ('symbol_code', 'regime_code', 'direction', 'contracts', 'entry_price',
+                     'stop_loss', 'margin_per_contract', 'active'):
+            array = getattr(self, name)
+            grown = np.zeros(self._capacity, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        self.strategy.extend([None] * old)
+        self._free.extend(range(self._capacity - 1, old - 1, -1))
+
+    # ---------------------------------------------------------------- updates
+
+    def _apply(self, slot: int, contracts: int, sign: int) -> None:
+        """Add (sign=+1) or remove (sign=-1) ``contracts`` of a slot from every aggregate"""
+        symbol = self.symbol_code[slot]
+        regime = self.regime_code[slot]
+        side = _direction_index(int(self.direction[slot]))
+        point_value = self.point_value[symbol]
+        delta = sign * contracts
+        margin = delta * self.margin_per_contract[slot]
+        risk = delta * abs(self.entry_price[slot] - self.stop_loss[slot]) * point_value
+
+        if side == 0:
+            self.symbol_long[symbol] += delta
+        else:
+            self.symbol_short[symbol] += delta
+        self.symbol_margin[symbol] += margin
+        self.symbol_risk[symbol] += risk
+        self.regime_contracts[regime] += delta
+        self.regime_notional[regime] += delta * self.entry_price[slot] * point_value
+        self.regime_risk[regime] += risk
+        self.direction_contracts[side] += delta
+        self.direction_notional[side] += delta * self.mark_price[symbol] * point_value
+        self.total_margin += margin
+        self.total_risk_at_stop += risk
+
+    def fill(self, symbol: str, direction: int, contracts: int, price: float,
+             stop_loss: float, regime: Hashable = None, strategy: Optional[str] = None,
+             margin_per_contract: float = 0.0, point_value: Optional[float] = None) -> int:
+        """
+        Record an opening fill as a new working position
+
+        Args:
+            direction: LONG (+1) or SHORT (-1)
+            regime: Any hashable regime label, e.g. a MarketRegime
+            point_value: Dollars per 1.0 price move; required on a symbol's first fill
+
+        Returns:
+            int: Position id for later closes
+        """
+        if contracts <= 0:
+            raise ValueError("Fill size must be positive")
+        side = _direction_index(direction)
+        symbol_code = self._symbol(symbol, point_value)
+        regime_code = self._regime(regime)
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+
+        self.symbol_code[slot] = symbol_code
+        self.regime_code[slot] = regime_code
+        self.direction[slot] = direction
+        self.contracts[slot] = contracts
+        self.entry_price[slot] = price
+        self.stop_loss[slot] = stop_loss
+        self.margin_per_contract[slot] = margin_per_contract
+        self.active[slot] = True
+        self.strategy[slot] = strategy
+
+        position_id = self._next_id
+        self._next_id += 1
+        self._slot_by_id[position_id] = slot
+        self._id_by_slot[slot] = position_id
+        self._by_symbol[symbol_code].add(position_id)
+        self._by_regime[regime_code].add(position_id)
+        self._by_direction[side].add(position_id)
+
+        self.mark(symbol, price)
+        self._apply(slot, contracts, +1)
+        return position_id
+
+    def close(self, position_id: int, price: float, contracts: Optional[int] = None) -> float:
+        """
+        Close all or part of a position at ``price``
+
+        Returns:
+            float: Realized P&L of the closed contracts
+        """
+        slot = self._slot_by_id[position_id]
+        held = int(self.contracts[slot])
+        contracts = held if contracts is None else contracts
+        if not 0 < contracts <= held:
+            raise ValueError(f"Cannot close {contracts} of {held} contracts")
+
+        symbol = self.symbol_code[slot]
+        pnl = (contracts * self.direction[slot] * (price - self.entry_price[slot])
+               * self.point_value[symbol])
+        self._apply(slot, contracts, -1)
+        self.contracts[slot] = held - contracts
+        self.realized_pnl += pnl
+
+        if contracts == held:
+            side = _direction_index(int(self.direction[slot]))
+            self._by_symbol[symbol].discard(position_id)
+            self._by_regime[self.regime_code[slot]].discard(position_id)
+            self._by_direction[side].discard(position_id)
+            self.active[slot] = False
+            self.strategy[slot] = None
+            del self._slot_by_id[position_id]
+            del self._id_by_slot[slot]
+            self._free.append(slot)
+        return float(pnl)
+
+    def mark(self, symbol: str, price: float) -> None:
+        """Update a symbol's mark price and the mark-based direction notionals"""
+        code = self._symbols.get(symbol)
+        if code is None:
+            return
+        move = (price - self.mark_price[code]) * self.point_value[code]
+        self.direction_notional[0] += self.symbol_long[code] * move
+        self.direction_notional[1] += self.symbol_short[code] * move
+        self.mark_price[code] = price
+
+    # ---------------------------------------------------------------- queries
+
+    def net_contracts(self, symbol: str) -> int:
+        code = self._symbols.get(symbol)
+        return 0 if code is None else int(self.symbol_long[code] - self.symbol_short[code])
+
+    def exposure(self, symbol: str) -> float:
+        """Signed dollar exposure of a symbol at its mark"""
+        code = self._symbols.get(symbol)
+        if code is None:
+            return 0.0
+        net = self.symbol_long[code] - self.symbol_short[code]
+        return float(net * self.mark_price[code] * self.point_value[code])
+
+    def symbol_exposures(self) -> Dict[str, float]:
+        """Signed dollar exposure per symbol with a non-zero net position"""
+        net = self.symbol_long - self.symbol_short
+        notional = net * self.mark_price * self.point_value
+        return {symbol: float(notional[code]) for symbol, code in self._symbols.items() if net[code]}
+
+    def net_positions(self) -> Dict[str, Dict]:
+        """Net contracts and mark price per symbol with a non-zero net position"""
+        net = self.symbol_long - self.symbol_short
+        return {symbol: {'contracts': int(net[code]), 'price': float(self.mark_price[code])}
+                for symbol, code in self._symbols.items() if net[code]}
+
+    def direction_exposure(self, direction: int) -> float:
+        """Gross dollar notional at mark of all long (+1) or short (-1) positions"""
+        return float(self.direction_notional[_direction_index(direction)])
+
+    def regime_exposure(self, regime: Hashable) -> Dict:
+        """Contracts, entry notional and risk-at-stop of positions opened in a regime"""
+        code = self._regimes.get(regime)
+        if code is None:
+            return {'contracts': 0, 'notional': 0.0, 'risk_at_stop': 0.0}
+        return {'contracts': int(self.regime_contracts[code]),
+                'notional': float(self.regime_notional[code]),
+                'risk_at_stop': float(self.regime_risk[code])}
+
+    def symbol_risk_at_stop(self, symbol: str) -> float:
+        code = self._symbols.get(symbol)
+        return 0.0 if code is None else float(self.symbol_risk[code])
+
+    def position_ids(self, symbol: Optional[str] = None, direction: Optional[int] = None,
+                     regime: Hashable = None) -> Set[int]:
+        """Ids of working positions matching every given index"""
+        selections = []
+        if symbol is not None:
+            code = self._symbols.get(symbol)
+            selections.append(self._by_symbol[code] if code is not None else set())
+        if direction is not None:
+            selections.append(self._by_direction[_direction_index(direction)])
+        if regime is not None:
+            code = self._regimes.get(regime)
+            selections.append(self._by_regime[code] if code is not None else set())
+        if not selections:
+            return set(self._slot_by_id)
+        selections.sort(key=len)
+        return set(selections[0]).intersection(*selections[1:])
+
+    def position(self, position_id: int) -> Dict:
+        slot = self._slot_by_id[position_id]
+        symbols = list(self._symbols)
+        regimes = list(self._regimes)
+        return {
+            'position_id': position_id,
+            'symbol': symbols[self.symbol_code[slot]],
+            'direction': int(self.direction[slot]),
+            'contracts': int(self.contracts[slot]),
+            'entry_price': float(self.entry_price[slot]),
+            'stop_loss': float(self.stop_loss[slot]),
+            'regime': regimes[self.regime_code[slot]],
+            'strategy': self.strategy[slot]
+        }
+
+    def headroom(self, symbol: str, direction: int, price: float, stop_loss: float,
+                 margin_per_contract: float, point_value: float,
+                 max_margin: float, max_risk_at_stop: float,
+                 max_net_contracts: Optional[int] = None) -> int:
+        """
+        Contracts that can be added without breaching book-wide limits
+
+        Reads only the running aggregates, so the cost does not depend on the
+        number of working positions.
+        """
+        limits = []
+        if margin_per_contract > 0:
+            limits.append((max_margin - self.total_margin) // margin_per_contract)
+        risk_per_contract = abs(price - stop_loss) * point_value
+        if risk_per_contract > 0:
+            limits.append((max_risk_at_stop - self.total_risk_at_stop) // risk_per_contract)
+        if max_net_contracts is not None:
+            limits.append(max_net_contracts - direction * self.net_contracts(symbol))
+        if not limits:
+            return np.iinfo(np.int64).max
+        return max(int(min(limits)), 0)
+
+    def headrooms(self, price: np.ndarray, stop_loss: np.ndarray, margin_per_contract: np.ndarray,
+                  point_value: np.ndarray, max_margin: float, max_risk_at_stop: float) -> np.ndarray:
+        """headroom for many candidate entries at once (no net-contract limit)"""
+        risk_per_contract = np.abs(price - stop_loss) * point_value
+        with np.errstate(divide='ignore', invalid='ignore'):
+            margin_limit = np.where(margin_per_contract > 0,
+                                    (max_margin - self.total_margin) // margin_per_contract, np.inf)
+            risk_limit = np.where(risk_per_contract > 0,
+                                  (max_risk_at_stop - self.total_risk_at_stop) // risk_per_contract, np.inf)
+        limit = np.minimum(margin_limit, risk_limit)
+        unlimited = np.isposinf(limit)
+        headroom = np.maximum(np.where(unlimited, 0.0, limit), 0.0).astype(np.int64)
+        headroom[unlimited] = np.iinfo(np.int64).max
+        return headroom
+
+    def recompute_aggregates(self) -> None:
+        """Rebuild every aggregate from the slot arrays, discarding float drift"""
+        for name in ('symbol_long', 'symbol_short', 'symbol_margin', 'symbol_risk',
+                     'regime_contracts', 'regime_notional', 'regime_risk',
+                     'direction_contracts', 'direction_notional'):
+            getattr(self, name)[:] = 0
+        self.total_margin = 0.0
+        self.total_risk_at_stop = 0.0
+        for slot in np.flatnonzero(self.active):
+            self._apply(slot, int(self.contracts[slot]), +1)
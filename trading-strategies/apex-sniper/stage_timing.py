@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Analysis Stage Timing
+Fixed-bucket latency histograms for the stages of a market analysis
+
+Each stage duration is read from the monotonic performance counter in
+nanoseconds and counted into one of a fixed set of power-of-two buckets
+(1 µs up to about 17 s, plus overflow), so recording is O(1) memory and
+never allocates. Percentiles are estimated from the bucket upper bounds
+and clamped to the largest observed duration. With ``dump_interval`` set,
+a summary is logged at most once per interval from the recording thread.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Optional, Sequence
+
+from trading_log import TRADING_LOGGER
+
+logger = logging.getLogger(TRADING_LOGGER)
+
+ANALYSIS_STAGES = ('momentum', 'trend', 'volume', 'volatility', 'regime', 'quantum')
+# Bucket upper bounds in ns: 1 µs, 2 µs, 4 µs, ... 2**24 µs; one more bucket above
+BUCKET_BOUNDS_NS = tuple(1000 << power for power in range(25))
+
+
+class StageHistogram:
+    """Duration histogram of one stage"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS_NS, duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def percentile(self, q: float) -> float:
+        """Upper bound in ns of the bucket holding the q-th percentile (0-100)"""
+        if self.count == 0:
+            return float('nan')
+        rank = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                bound = BUCKET_BOUNDS_NS[index] if index < len(BUCKET_BOUNDS_NS) else self.max_ns
+                return float(min(bound, self.max_ns))
+        return float(self.max_ns)
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_us': self.total_ns / self.count / 1e3 if self.count else float('nan'),
+            'min_us': self.min_ns / 1e3 if self.min_ns is not None else float('nan'),
+            'p50_us': self.percentile(50) / 1e3,
+            'p90_us': self.percentile(90) / 1e3,
+            'p99_us': self.percentile(99) / 1e3,
+            'max_us': self.max_ns / 1e3,
+            'buckets': {bound // 1000: count for bound, count in zip(BUCKET_BOUNDS_NS, self.counts)
+                        if count},
+            'overflow': self.counts[-1]
+        }
+
+
+class StageTimer:
+    """
+    Thread-safe per-stage latency histograms
+
+    Args:
+        stages: Stage names recorded up front; others are added on first use
+        dump_interval: Seconds between logged summaries, None to only dump on demand
+    """
+
+    def __init__(self, stages: Sequence[str] = ANALYSIS_STAGES,
+                 dump_interval: Optional[float] = None):
+        self.histograms: Dict[str, StageHistogram] = {stage: StageHistogram() for stage in stages}
+        self.dump_interval = dump_interval
+        self._lock = threading.Lock()
+        self._next_dump = time.monotonic() + dump_interval if dump_interval else None
+
+    def call(self, stage: str, function: Callable, *args):
+        """Run ``function(*args)`` and record its duration under ``stage``"""
+        started = time.perf_counter_ns()
+        result = function(*args)
+        self.record(stage, time.perf_counter_ns() - started)
+        return result
+
+    def record(self, stage: str, duration_ns: int) -> None:
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = StageHistogram()
+            histogram.record(duration_ns)
+            due = self._next_dump is not None and time.monotonic() >= self._next_dump
+            if due:
+                self._next_dump = time.monotonic() + self.dump_interval
+        if due:
+            self.dump()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Summary per stage: count, total, mean/min/max and p50/p90/p99 in µs, bucket counts"""
+        with self._lock:
+            return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def dump(self, level: int = logging.INFO) -> Dict[str, Dict]:
+        """Log one line per recorded stage and return the snapshot"""
+        snapshot = self.snapshot()
+        for stage, summary in snapshot.items():
+            if summary['count']:
+                logger.log(level, "APEX Sniper stage timing: %-10s n=%d mean=%.1fus p50<=%.0fus "
+                           "p99<=%.0fus max=%.1fus", stage, summary['count'], summary['mean_us'],
+                           summary['p50_us'], summary['p99_us'], summary['max_us'])
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            for stage in self.histograms:
+                self.histograms[stage] = StageHistogram()
+
+
+def call_untimed(stage: str, function: Callable, *args):
+    """Stand-in for StageTimer.call when timing is off"""
+    return function(*args)
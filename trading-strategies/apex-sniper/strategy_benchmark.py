@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Strategy Benchmark Suite
+Throughput, latency percentiles and peak memory from 1e2 to 1e7 bars
+
+For each history size a synthetic /CL series is generated and
+analyze_market_data, generate_trading_signal and
+QuantumRiskManager.calculate_position_size are called repeatedly within a
+time budget. Per-call latencies give p50/p99 and throughput; one extra call
+per stage under tracemalloc gives its peak allocation. The indicator cache
+is disabled so every call pays the full computation.
+
+Results are written as JSON. Given a baseline file from an earlier version,
+the run exits non-zero when any stage's p50 latency regressed by more than
+the tolerance, so it can run as a CI gate.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from indicator_cache import IndicatorCache
+from strategy_loader import load_strategy_module
+from trading_log import configure_trading_logging
+
+_strategy = load_strategy_module()
+APEXSniperStrategy = _strategy.APEXSniperStrategy
+TradingSignal = _strategy.TradingSignal
+
+STRATEGY_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [10 ** power for power in range(2, 8)]
+RESULTS_VERSION = 1
+
+
+def synthetic_cl_bars(bars: int, seed: int = 42) -> pd.DataFrame:
+    """Minute /CL bars: a random walk around $70 with intrabar ranges and volume"""
+    rng = np.random.default_rng(seed)
+    close = 70 + np.cumsum(rng.standard_normal(bars) * 0.02)
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2015-01-01', periods=bars, freq='1min'),
+        'open': close + rng.standard_normal(bars) * 0.005,
+        'high': close + np.abs(rng.standard_normal(bars)) * 0.03,
+        'low': close - np.abs(rng.standard_normal(bars)) * 0.03,
+        'close': close,
+        'volume': rng.integers(1000, 10000, bars).astype(np.float64)
+    })
+
+
+def time_calls(function: Callable[[], object], min_calls: int, max_calls: int,
+               budget_seconds: float) -> np.ndarray:
+    """Per-call durations in seconds: at least ``min_calls``, then until the budget runs out"""
+    durations = []
+    deadline = time.perf_counter() + budget_seconds
+    while len(durations) < max_calls:
+        started = time.perf_counter()
+        function()
+        finished = time.perf_counter()
+        durations.append(finished - started)
+        if len(durations) >= min_calls and finished >= deadline:
+            break
+    return np.array(durations)
+
+
+def peak_allocation(function: Callable[[], object]) -> int:
+    """Peak bytes allocated (Python and NumPy) during one call, above what was live before it"""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        function()
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def _stage_result(stage: str, bars: int, durations: np.ndarray, peak_bytes: int,
+                  per_bar: bool) -> Dict:
+    mean = float(durations.mean())
+    return {
+        'stage': stage,
+        'bars': bars,
+        'calls': len(durations),
+        'p50_ms': float(np.percentile(durations, 50) * 1e3),
+        'p99_ms': float(np.percentile(durations, 99) * 1e3),
+        'mean_ms': mean * 1e3,
+        'calls_per_second': 1 / mean if mean > 0 else None,
+        'bars_per_second': bars / mean if per_bar and mean > 0 else None,
+        'peak_memory_bytes': peak_bytes
+    }
+
+
+def benchmark_size(bars: int, args: argparse.Namespace) -> List[Dict]:
+    """Benchmark every stage on one synthetic history"""
+    data = synthetic_cl_bars(bars, seed=args.seed)
+    strategy = APEXSniperStrategy(
+        capital=1000000, random_seed=args.seed,
+        indicator_cache=IndicatorCache(maxsize=0),
+        # Relaxed as in the backtester demo so signals (and sizing) actually occur
+        entry_criteria={'min_risk_reward_ratio': 1.3, 'min_confluence_signals': 2},
+        lookback={'trim': args.lookback_trim}
+    )
+
+    stages = [
+        ('analyze_market_data', lambda: strategy.analyze_market_data(data), True),
+        ('generate_trading_signal', lambda: strategy.generate_trading_signal(data), True)
+    ]
+
+    # Size a BUY at the latest bar with that bar's regime and ATR-style range
+    analysis = strategy.analyze_market_data(data)
+    price = float(data['close'].iloc[-1])
+    stop_loss, profit_targets = strategy._calculate_stops_and_targets(
+        price, analysis['volatility_signals']['price_range'], 'BUY')
+    signal = TradingSignal(
+        symbol='/CL', timestamp=datetime.now(), signal_type='BUY', signal_strength=0.8,
+        quantum_probability=0.8, technical_confluence=3, entry_price=price,
+        stop_loss=stop_loss, profit_targets=profit_targets, position_size=0, risk_amount=0,
+        confidence_level=0.8, market_regime=analysis['market_regime']
+    )
+    stages.append(('calculate_position_size',
+                   lambda: strategy.risk_manager.calculate_position_size(signal), False))
+
+    results = []
+    for stage, function, per_bar in stages:
+        durations = time_calls(function, args.min_calls, args.max_calls, args.budget)
+        results.append(_stage_result(stage, bars, durations, peak_allocation(function), per_bar))
+    return results
+
+
+def _environment() -> Dict:
+    try:
+        revision = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=STRATEGY_DIR, check=True,
+                                  capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'git_revision': revision,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """Stages whose p50 latency grew by more than ``tolerance`` against the baseline"""
+    previous = {(row['stage'], row['bars']): row for row in baseline['results']}
+    regressions = []
+    for row in results:
+        before = previous.get((row['stage'], row['bars']))
+        if before is None or before['p50_ms'] <= 0:
+            continue
+        ratio = row['p50_ms'] / before['p50_ms']
+        if ratio > 1 + tolerance:
+            regressions.append(f"{row['stage']} at {row['bars']} bars: p50 {before['p50_ms']:.3f} -> "
+                               f"{row['p50_ms']:.3f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='History lengths in bars')
+    parser.add_argument('--budget', type=float, default=2.0, help='Seconds of calls per stage and size')
+    parser.add_argument('--min-calls', type=int, default=3)
+    parser.add_argument('--max-calls', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--lookback-trim', action='store_true',
+                        help='Benchmark with warm-up lookback trimming enabled')
+    parser.add_argument('--output', default='strategy_benchmark.json')
+    parser.add_argument('--baseline', help='Earlier results file to compare p50 latencies against')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed fractional p50 slowdown against the baseline')
+    args = parser.parse_args()
+
+    # Sizing and signal logs would dominate the timings
+    configure_trading_logging(console=False, level=logging.WARNING)
+
+    results: List[Dict] = []
+    print(f"{'stage':<26}{'bars':>10}{'calls':>7}{'p50 ms':>11}{'p99 ms':>11}"
+          f"{'bars/s':>14}{'calls/s':>11}{'peak MB':>9}")
+    for bars in sorted(args.sizes):
+        for row in benchmark_size(bars, args):
+            results.append(row)
+            bars_per_second = f"{row['bars_per_second']:.3e}" if row['bars_per_second'] else '-'
+            print(f"{row['stage']:<26}{row['bars']:>10}{row['calls']:>7}{row['p50_ms']:>11.3f}"
+                  f"{row['p99_ms']:>11.3f}{bars_per_second:>14}{row['calls_per_second']:>11.1f}"
+                  f"{row['peak_memory_bytes'] / 2 ** 20:>9.1f}")
+
+    report = {
+        'version': RESULTS_VERSION,
+        'environment': _environment(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+        # ru_maxrss is in KiB on Linux
+        'max_rss_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        'results': results
+    }
+    with open(args.output, 'w') as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Strategy Module Loader
+Imports cl-futures-strategy.py for the sibling tooling modules
+
+The strategy file name contains hyphens, so it cannot be imported with a
+plain import statement. This loader registers it once under an importable
+module name and hands the same module object to every caller.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+STRATEGY_DIR = os.path.dirname(os.path.abspath(__file__))
+STRATEGY_PATH = os.path.join(STRATEGY_DIR, 'cl-futures-strategy.py')
+STRATEGY_MODULE_NAME = 'cl_futures_strategy'
+
+
+def load_strategy_module() -> ModuleType:
+    """Return the loaded cl-futures-strategy module, importing it on first use"""
+    module = sys.modules.get(STRATEGY_MODULE_NAME)
+    if module is not None:
+        return module
+
+    if STRATEGY_DIR not in sys.path:
+        sys.path.insert(0, STRATEGY_DIR)
+
+    spec = importlib.util.spec_from_file_location(STRATEGY_MODULE_NAME, STRATEGY_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[STRATEGY_MODULE_NAME] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[STRATEGY_MODULE_NAME]
+        raise
+    return module
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Streaming Indicator Engine
+Constant-time per-bar indicator updates for the /CL live loop
+
+Mirrors the batch pandas calculations in cl-futures-strategy.py so the
+live path and the historical path produce the same numbers.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional
+
+
+class AdjustedEMA:
+    """
+    Incremental equivalent of pandas ``Series.ewm(span=n).mean()``
+
+    pandas defaults to ``adjust=True``, i.e. a weighted average whose weights
+    decay by (1 - alpha) per bar. Keeping the weighted numerator and the sum
+    of weights lets each update run in O(1).
+    """
+
+    def __init__(self, span: int):
+        self.span = span
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self._numerator = 0.0
+        self._denominator = 0.0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        self._numerator = x + self.decay * self._numerator
+        self._denominator = 1.0 + self.decay * self._denominator
+        self.value = self._numerator / self._denominator
+        return self.value
+
+
+# Running sums are rebuilt from the window this often to stop rounding drift
+RESYNC_INTERVAL = 4096
+
+
+class RollingSum:
+    """Fixed-window running sum backed by a ring buffer, NaN until full"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = deque(maxlen=window)
+        self._total = 0.0
+        self._updates = 0
+        self.value = math.nan
+
+    def _push(self, x: float) -> None:
+        if len(self._values) == self.window:
+            self._total -= self._values[0]
+        self._values.append(x)
+        self._total += x
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            self._total = math.fsum(self._values)
+
+    def update(self, x: float) -> float:
+        self._push(x)
+        self.value = self._total if len(self._values) == self.window else math.nan
+        return self.value
+
+
+class RollingMean(RollingSum):
+    """Fixed-window simple moving average backed by a ring buffer"""
+
+    def update(self, x: float) -> float:
+        self._push(x)
+        self.value = self._total / self.window if len(self._values) == self.window else math.nan
+        return self.value
+
+
+class RollingVariance:
+    """
+    Fixed-window mean and sample standard deviation (ddof=1)
+
+    Values are shifted by the first observation before accumulating, which
+    keeps the sum-of-squares formula well conditioned for price-level data.
+    NaN until the window is full, or with ``partial`` over the values seen
+    so far once there are two of them.
+    """
+
+    def __init__(self, window: int, partial: bool = False):
+        self.window = window
+        self.partial = partial
+        self._values = deque(maxlen=window)
+        self._shift: Optional[float] = None
+        self._sum = 0.0
+        self._sum_squares = 0.0
+        self._updates = 0
+        self.mean = math.nan
+        self.std = math.nan
+
+    def update(self, x: float) -> float:
+        if self._shift is None:
+            self._shift = x
+        shifted = x - self._shift
+        if len(self._values) == self.window:
+            oldest = self._values[0]
+            self._sum -= oldest
+            self._sum_squares -= oldest * oldest
+        self._values.append(shifted)
+        self._sum += shifted
+        self._sum_squares += shifted * shifted
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            self._sum = math.fsum(self._values)
+            self._sum_squares = math.fsum(v * v for v in self._values)
+
+        count = len(self._values)
+        if count < (2 if self.partial else self.window):
+            return self.std
+        mean = self._sum / count
+        variance = (self._sum_squares - self._sum * mean) / (count - 1)
+        self.mean = mean + self._shift
+        self.std = math.sqrt(max(variance, 0.0))
+        return self.std
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+
+class WelfordVariance:
+    """
+    Expanding mean and sample standard deviation by Welford's update
+
+    With ``decay`` below 1 every earlier observation's weight is multiplied
+    by ``decay`` per update (West's weighted form of the recurrence); the
+    standard deviation then uses reliability weights, matching pandas
+    ``ewm(alpha=1 - decay).std()``. ``decay=1`` gives the ordinary ddof=1
+    statistics. ``effective_count`` is the number of observations for
+    ``decay=1`` and Kish's effective sample size otherwise.
+    """
+
+    def __init__(self, decay: float = 1.0):
+        if not 0.0 < decay <= 1.0:
+            raise ValueError(f"Decay must be in (0, 1]: {decay}")
+        self.decay = decay
+        self.count = 0
+        self._weight = 0.0
+        self._weight_squares = 0.0
+        self._m2 = 0.0
+        self.mean = math.nan
+        self.std = math.nan
+        self.effective_count = 0.0
+
+    def update(self, x: float) -> float:
+        if self.count == 0:
+            self.mean = 0.0
+        decay = self.decay
+        self._weight = decay * self._weight + 1.0
+        self._weight_squares = decay * decay * self._weight_squares + 1.0
+        self._m2 *= decay
+        delta = x - self.mean
+        self.mean += delta / self._weight
+        self._m2 += delta * (x - self.mean)
+        self.count += 1
+
+        self.effective_count = self._weight * self._weight / self._weight_squares
+        normalizer = self._weight - self._weight_squares / self._weight
+        if self.count < 2 or normalizer <= 0.0:
+            return self.std
+        self.std = math.sqrt(max(self._m2 / normalizer, 0.0))
+        return self.std
+
+
+class DecayedRollingMean:
+    """
+    Fixed-window mean whose weights decay by ``decay`` per bar of age
+
+    The weighted sum drops the oldest value's weight (``decay ** window``)
+    as it leaves, so each update is O(1); ``decay=1`` is the simple moving
+    average. NaN until the window is full.
+    """
+
+    def __init__(self, window: int, decay: float = 1.0):
+        if not 0.0 < decay <= 1.0:
+            raise ValueError(f"Decay must be in (0, 1]: {decay}")
+        self.window = window
+        self.decay = decay
+        self._oldest_weight = decay ** window
+        self._total_weight = math.fsum(decay ** age for age in range(window))
+        self._values = deque(maxlen=window)
+        self._total = 0.0
+        self._updates = 0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        self._total *= self.decay
+        if len(self._values) == self.window:
+            self._total -= self._oldest_weight * self._values[0]
+        self._values.append(x)
+        self._total += x
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            last = len(self._values) - 1
+            self._total = math.fsum(self.decay ** (last - index) * value
+                                    for index, value in enumerate(self._values))
+        self.value = self._total / self._total_weight if len(self._values) == self.window else math.nan
+        return self.value
+
+
+class MonotonicExtreme:
+    """
+    Rolling max (or min) in amortized O(1) via a monotonic deque
+
+    The deque holds (bar index, value) pairs whose values are strictly
+    decreasing for a max (increasing for a min); the front is the extreme.
+    """
+
+    def __init__(self, window: int, mode: str = 'max'):
+        if mode not in ('max', 'min'):
+            raise ValueError(f"Unknown extreme mode: {mode}")
+        self.window = window
+        self._is_max = mode == 'max'
+        self._candidates = deque()
+        self._index = 0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        candidates = self._candidates
+        if self._is_max:
+            while candidates and candidates[-1][1] <= x:
+                candidates.pop()
+        else:
+            while candidates and candidates[-1][1] >= x:
+                candidates.pop()
+        candidates.append((self._index, x))
+        if candidates[0][0] <= self._index - self.window:
+            candidates.popleft()
+        self._index += 1
+        self.value = candidates[0][1] if self._index >= self.window else math.nan
+        return self.value
+
+
+class WilderAverage:
+    """Wilder's smoothing: SMA seed over ``period`` values, then alpha = 1/period"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self._seed = RollingMean(period)
+        self._count = 0
+        self.value = math.nan
+
+    def update(self, x: float) -> float:
+        self._count += 1
+        if self._count <= self.period:
+            self.value = self._seed.update(x)
+        else:
+            self.value += (x - self.value) / self.period
+        return self.value
+
+
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """RSI with the same division semantics as the pandas batch path"""
+    if math.isnan(avg_gain) or math.isnan(avg_loss):
+        return math.nan
+    if avg_loss == 0.0:
+        return math.nan if avg_gain == 0.0 else 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+class StreamingIndicatorEngine:
+    """
+    Stateful O(1)-per-bar indicators for APEX Sniper
+
+    Feed completed bars through ``on_bar``; the current RSI, MACD line,
+    signal, histogram, fast/medium/slow EMAs, VWAP, volume average, ATR,
+    Bollinger bands and rolling price range are then available as
+    attributes. The default ``rsi_method='sma'`` reproduces the rolling-mean
+    RSI used by ``APEXSniperStrategy._analyze_momentum``; ``'wilder'`` switches
+    to Wilder's smoothing.
+
+    The quantum inputs are kept online as well: ``return_std`` and
+    ``return_count`` are the standard deviation and count of every bar return
+    so far (the market entropy inputs), or of the last ``entropy_window``
+    returns, and ``coherence_volume_ma`` is the volume mean over
+    ``coherence_window`` bars. ``statistics_decay`` below 1 weights both
+    towards recent bars; the expanding return statistics then report Kish's
+    effective count.
+    """
+
+    def __init__(self, indicators: Dict, rsi_method: str = 'sma',
+                 statistics_decay: float = 1.0, entropy_window: Optional[int] = None,
+                 coherence_window: int = 10):
+        if rsi_method not in ('sma', 'wilder'):
+            raise ValueError(f"Unknown RSI method: {rsi_method}")
+        if entropy_window is not None and statistics_decay != 1.0:
+            raise ValueError("A windowed market entropy does not support decay weighting")
+
+        momentum = indicators['momentum']
+        trend = indicators['trend']
+        volume = indicators['volume']
+        volatility = indicators['volatility']
+        self.rsi_method = rsi_method
+
+        average = RollingMean if rsi_method == 'sma' else WilderAverage
+        self._avg_gain = average(momentum['rsi_period'])
+        self._avg_loss = average(momentum['rsi_period'])
+
+        self._macd_fast = AdjustedEMA(momentum['macd_fast'])
+        self._macd_slow = AdjustedEMA(momentum['macd_slow'])
+        self._macd_signal = AdjustedEMA(momentum['macd_signal'])
+
+        self._ema_fast = AdjustedEMA(trend['ema_fast'])
+        self._ema_medium = AdjustedEMA(trend['ema_medium'])
+        self._ema_slow = AdjustedEMA(trend['ema_slow'])
+
+        self._vwap_numerator = RollingSum(volume['vwap_period'])
+        self._vwap_denominator = RollingSum(volume['vwap_period'])
+        self._volume_ma = RollingMean(volume['volume_ma_period'])
+
+        self._atr = RollingMean(volatility['atr_period'])
+        self._bollinger = RollingVariance(volatility['bb_period'])
+        self._bb_std = volatility['bb_std']
+        self._range_high = MonotonicExtreme(volatility['atr_period'], 'max')
+        self._range_low = MonotonicExtreme(volatility['atr_period'], 'min')
+
+        if entropy_window is None:
+            self._returns = WelfordVariance(statistics_decay)
+        else:
+            self._returns = RollingVariance(entropy_window, partial=True)
+        self.entropy_window = entropy_window
+        if statistics_decay == 1.0:
+            self._coherence_volume = RollingMean(coherence_window)
+        else:
+            self._coherence_volume = DecayedRollingMean(coherence_window, statistics_decay)
+
+        self.bars_processed = 0
+        self.open = self.high = self.low = self.close = self.volume = math.nan
+        self.previous_close: Optional[float] = None
+
+        self.rsi = math.nan
+        self.macd_line = math.nan
+        self.macd_signal = math.nan
+        self.macd_histogram = math.nan
+        self.previous_macd_histogram = math.nan
+        self.ema_fast = math.nan
+        self.ema_medium = math.nan
+        self.ema_slow = math.nan
+        self.vwap = math.nan
+        self.volume_ma = math.nan
+        self.true_range = math.nan
+        self.atr = math.nan
+        self.bb_middle = math.nan
+        self.bb_upper = math.nan
+        self.bb_lower = math.nan
+        self.price_range = math.nan
+        self.return_std = math.nan
+        self.return_count = 0.0
+        self.coherence_volume_ma = math.nan
+
+    def on_bar(self, open: float, high: float, low: float, close: float, volume: float) -> None:
+        """Advance every indicator by one completed bar"""
+        # pandas fills the leading NaN diff with 0 in both gain and loss series
+        delta = 0.0 if self.previous_close is None else close - self.previous_close
+        self.rsi = _rsi_from_averages(
+            self._avg_gain.update(delta if delta > 0 else 0.0),
+            self._avg_loss.update(-delta if delta < 0 else 0.0)
+        )
+
+        self.macd_line = self._macd_fast.update(close) - self._macd_slow.update(close)
+        self.macd_signal = self._macd_signal.update(self.macd_line)
+        self.previous_macd_histogram = self.macd_histogram
+        self.macd_histogram = self.macd_line - self.macd_signal
+
+        self.ema_fast = self._ema_fast.update(close)
+        self.ema_medium = self._ema_medium.update(close)
+        self.ema_slow = self._ema_slow.update(close)
+
+        typical_price = (high + low + close) / 3
+        vwap_volume = self._vwap_denominator.update(volume)
+        vwap_value = self._vwap_numerator.update(typical_price * volume)
+        self.vwap = vwap_value / vwap_volume if vwap_volume else math.nan
+        self.volume_ma = self._volume_ma.update(volume)
+
+        if self.previous_close is None:
+            self.true_range = high - low
+        else:
+            self.true_range = max(high - low, abs(high - self.previous_close),
+                                  abs(low - self.previous_close))
+        self.atr = self._atr.update(self.true_range)
+
+        bb_std = self._bollinger.update(close)
+        self.bb_middle = self._bollinger.mean
+        self.bb_upper = self.bb_middle + self._bb_std * bb_std
+        self.bb_lower = self.bb_middle - self._bb_std * bb_std
+        self.price_range = self._range_high.update(high) - self._range_low.update(low)
+
+        # Like the batch path, returns that are NaN are left out
+        if self.previous_close is not None:
+            bar_return = close / self.previous_close - 1
+            if not math.isnan(bar_return):
+                self.return_std = self._returns.update(bar_return)
+                self.return_count = (float(self._returns.count) if self.entropy_window is not None
+                                     else self._returns.effective_count)
+        self.coherence_volume_ma = self._coherence_volume.update(volume)
+
+        self.open, self.high, self.low, self.close, self.volume = open, high, low, close, volume
+        self.previous_close = close
+        self.bars_processed += 1
+
+    def snapshot(self) -> Dict:
+        """Current indicator values as a plain dict"""
+        return {
+            'bars_processed': self.bars_processed,
+            'close': self.close,
+            'rsi': self.rsi,
+            'macd_line': self.macd_line,
+            'macd_signal': self.macd_signal,
+            'macd_histogram': self.macd_histogram,
+            'ema_fast': self.ema_fast,
+            'ema_medium': self.ema_medium,
+            'ema_slow': self.ema_slow,
+            'vwap': self.vwap,
+            'volume_ma': self.volume_ma,
+            'atr': self.atr,
+            'bb_middle': self.bb_middle,
+            'bb_upper': self.bb_upper,
+            'bb_lower': self.bb_lower,
+            'price_range': self.price_range,
+            'return_std': self.return_std,
+            'return_count': self.return_count,
+            'coherence_volume_ma': self.coherence_volume_ma
+        }
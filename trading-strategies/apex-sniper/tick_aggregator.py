@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Streaming Tick-to-Bar Aggregation
+Time, volume and tick bars from raw /CL trades in bounded memory
+
+Ticks arrive as batches of NumPy arrays (timestamps, prices, sizes). Each
+batch is assigned per-tick bar keys and reduced segment-wise with
+``ufunc.reduceat``, so there is no per-tick Python work or DataFrame
+allocation. Only the still-open bar is carried between batches. Completed
+bars can be pushed straight into APEXSniperStrategy.on_bar().
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+BAR_DTYPE = np.dtype([
+    ('timestamp', np.int64),   # bucket start for time bars, first tick otherwise (ns)
+    ('end_time', np.int64),    # last tick in the bar (ns)
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64),
+    ('ticks', np.int64)
+])
+
+BAR_MODES = ('time', 'volume', 'tick')
+
+TickBatch = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class TickBarAggregator:
+    """
+    Aggregate trade ticks into OHLCV bars
+
+    Args:
+        mode: 'time' (size = bar length in seconds), 'volume' (size = contracts
+            per bar) or 'tick' (size = trades per bar)
+        size: Bar size in the units of ``mode``
+
+    Volume bars close on the tick whose cumulative volume crosses the next
+    multiple of ``size``; that tick's full size stays in the closing bar.
+    Volume and tick bars are returned by the batch holding their closing
+    tick. Time bars close when the first tick of a later interval arrives,
+    or on ``flush``. Late ticks in time mode are folded into the current bar.
+    """
+
+    def __init__(self, mode: str = 'time', size: float = 60):
+        if mode not in BAR_MODES:
+            raise ValueError(f"Unknown bar mode: {mode}")
+        if size <= 0:
+            raise ValueError("Bar size must be positive")
+        self.mode = mode
+        self.size = size
+        self._interval_ns = int(size * 1_000_000_000)
+
+        self._cumulative_volume = 0.0
+        self._tick_count = 0
+        self._partial: Optional[np.ndarray] = None  # one BAR_DTYPE record
+        self._partial_key = 0
+
+        self.ticks_processed = 0
+        self.bars_emitted = 0
+
+    def _bar_keys(self, timestamps: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+        """Non-decreasing per-tick bar identifiers for this batch"""
+        if self.mode == 'time':
+            keys = timestamps // self._interval_ns
+            if self._partial is not None:
+                keys = np.maximum(keys, self._partial_key)
+            return np.maximum.accumulate(keys)
+
+        if self.mode == 'volume':
+            volume_before = self._cumulative_volume + np.cumsum(sizes) - sizes
+            self._cumulative_volume += float(sizes.sum())
+            return (volume_before // self.size).astype(np.int64)
+
+        keys = (self._tick_count + np.arange(len(timestamps), dtype=np.int64)) // int(self.size)
+        self._tick_count += len(timestamps)
+        return keys
+
+    def process(self, timestamps: np.ndarray, prices: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+        """
+        Consume one batch of ticks
+
+        Args:
+            timestamps: int64 nanoseconds since the epoch
+            prices: Trade prices
+            sizes: Trade sizes in contracts
+
+        Returns:
+            np.ndarray: Bars completed by this batch (BAR_DTYPE records)
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        count = len(timestamps)
+        if count == 0:
+            return np.empty(0, dtype=BAR_DTYPE)
+
+        keys = self._bar_keys(timestamps, sizes)
+        starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+        ends = np.concatenate((starts[1:], [count])) - 1
+
+        segments = np.empty(len(starts), dtype=BAR_DTYPE)
+        segment_keys = keys[starts]
+        if self.mode == 'time':
+            segments['timestamp'] = segment_keys * self._interval_ns
+        else:
+            segments['timestamp'] = timestamps[starts]
+        segments['end_time'] = timestamps[ends]
+        segments['open'] = prices[starts]
+        segments['high'] = np.maximum.reduceat(prices, starts)
+        segments['low'] = np.minimum.reduceat(prices, starts)
+        segments['close'] = prices[ends]
+        segments['volume'] = np.add.reduceat(sizes, starts)
+        segments['ticks'] = ends - starts + 1
+
+        completed = []
+        if self._partial is not None:
+            if segment_keys[0] == self._partial_key:
+                first = segments[0]
+                partial = self._partial
+                first['timestamp'] = partial['timestamp']
+                first['open'] = partial['open']
+                first['high'] = max(first['high'], partial['high'])
+                first['low'] = min(first['low'], partial['low'])
+                first['volume'] += partial['volume']
+                first['ticks'] += partial['ticks']
+            else:
+                completed.append(self._partial.reshape(1))
+
+        if self.mode == 'time':
+            # The last bucket may still receive ticks from the next batch
+            full = len(segments) - 1
+        else:
+            # Key the next tick would get: a volume or tick bar that has
+            # reached its size is complete now, not when the next batch comes
+            if self.mode == 'volume':
+                next_key = int(self._cumulative_volume // self.size)
+            else:
+                next_key = self._tick_count // int(self.size)
+            full = len(segments) - int(next_key == segment_keys[-1])
+        completed.append(segments[:full])
+        if full < len(segments):
+            self._partial = segments[-1].copy()
+            self._partial_key = int(segment_keys[-1])
+        else:
+            self._partial = None
+
+        bars = np.concatenate(completed) if len(completed) > 1 else completed[0].copy()
+        self.ticks_processed += count
+        self.bars_emitted += len(bars)
+        return bars
+
+    def flush(self) -> np.ndarray:
+        """Close and return the open bar, e.g. at session end"""
+        if self._partial is None:
+            return np.empty(0, dtype=BAR_DTYPE)
+        bars = self._partial.reshape(1).copy()
+        self._partial = None
+        self.bars_emitted += 1
+        return bars
+
+    def stats(self) -> Dict:
+        return {
+            'mode': self.mode,
+            'size': self.size,
+            'ticks_processed': self.ticks_processed,
+            'bars_emitted': self.bars_emitted,
+            'open_bar_ticks': int(self._partial['ticks']) if self._partial is not None else 0
+        }
+
+
+def aggregate_ticks(tick_batches: Iterable[TickBatch], aggregator: TickBarAggregator,
+                    flush: bool = True) -> Iterator[np.ndarray]:
+    """Generator stage: tick batches in, arrays of completed bars out"""
+    for timestamps, prices, sizes in tick_batches:
+        bars = aggregator.process(timestamps, prices, sizes)
+        if len(bars):
+            yield bars
+    if flush:
+        bars = aggregator.flush()
+        if len(bars):
+            yield bars
+
+
+async def aggregate_ticks_async(tick_batches: AsyncIterable[TickBatch],
+                                aggregator: TickBarAggregator,
+                                flush: bool = True) -> AsyncIterator[np.ndarray]:
+    """asyncio variant of aggregate_ticks for socket-fed tick streams"""
+    async for timestamps, prices, sizes in tick_batches:
+        bars = aggregator.process(timestamps, prices, sizes)
+        if len(bars):
+            yield bars
+    if flush:
+        bars = aggregator.flush()
+        if len(bars):
+            yield bars
+
+
+def feed_strategy(bar_batches: Iterable[np.ndarray], strategy) -> Iterator[Dict]:
+    """
+    Push completed bars into a strategy's per-bar update path
+
+    ``strategy`` is anything with ``on_bar(open, high, low, close, volume,
+    timestamp)``, normally APEXSniperStrategy. Each bar goes in with its
+    start time so multi-timeframe rollups see it. Yields the analysis for
+    each bar.
+    """
+    for bars in bar_batches:
+        for bar in bars.tolist():
+            yield strategy.on_bar(bar[2], bar[3], bar[4], bar[5], bar[6],
+                                  timestamp=np.datetime64(bar[0], 'ns'))
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    import time
+
+    total_ticks = 10_000_000
+    batch_size = 100_000
+    rng = np.random.default_rng(3)
+    start_ns = np.datetime64('2024-01-02T00:00:00', 'ns').astype(np.int64)
+
+    def synthetic_batches() -> Iterator[TickBatch]:
+        """Random-walk /CL trades, ~200 per second"""
+        price, clock = 72.0, start_ns
+        for _ in range(total_ticks // batch_size):
+            gaps = rng.exponential(5_000_000, batch_size).astype(np.int64)
+            stamps = clock + np.cumsum(gaps)
+            prices = price + np.cumsum(rng.choice((-0.01, 0.0, 0.01), batch_size))
+            sizes = rng.integers(1, 20, batch_size).astype(np.float64)
+            price, clock = prices[-1], stamps[-1]
+            yield stamps, prices, sizes
+
+    batches = list(synthetic_batches())
+    for mode, size in (('time', 60), ('volume', 5000), ('tick', 1000)):
+        aggregator = TickBarAggregator(mode, size)
+        started = time.perf_counter()
+        bar_count = sum(len(bars) for bars in aggregate_ticks(batches, aggregator))
+        elapsed = time.perf_counter() - started
+        print(f"{mode:>6} bars: {bar_count:,} from {total_ticks:,} ticks, "
+              f"{total_ticks / elapsed / 1e6:.1f}M ticks/sec")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Queued Trading Log and Binary Event Journal
+Disk I/O off the signal path
+
+Trading loggers hand records to an in-memory queue; a QueueListener thread
+formats them and writes the log file and console. Records are enqueued
+unformatted, so %-style arguments are only rendered on the writer thread
+(and not at all when the level is disabled).
+
+The event journal stores one fixed-size little-endian record per signal or
+sizing decision. Callers pack a record with struct and enqueue the bytes; a
+writer thread batches them to disk. ``read_journal`` memory-maps a journal
+as a NumPy structured array.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import atexit
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import util as multiprocessing_util
+from typing import Optional, Sequence
+
+import numpy as np
+
+TRADING_LOGGER = 'apex_sniper'
+LOG_FORMAT = '%(asctime)s - APEX_SNIPER - %(levelname)s - %(message)s'
+
+EVENT_SIGNAL = 1
+EVENT_SIZING = 2
+
+# (field, struct code, NumPy dtype); packed with no padding
+JOURNAL_FIELDS = (
+    ('event', 'B', '<u1'),
+    ('wall_time', 'q', '<i8'),       # ns since the epoch
+    ('symbol', '8s', 'S8'),
+    ('signal_type', 'b', '<i1'),     # +1 BUY / -1 SELL
+    ('market_regime', 'b', '<i1'),   # index into REGIME_CODES
+    ('technical_confluence', 'h', '<i2'),
+    ('quantum_probability', 'd', '<f8'),
+    ('entry_price', 'd', '<f8'),
+    ('stop_loss', 'd', '<f8'),
+    ('target_1', 'd', '<f8'),
+    ('target_2', 'd', '<f8'),
+    ('target_3', 'd', '<f8'),
+    ('contracts', 'i', '<i4'),
+    ('risk_amount', 'd', '<f8'),
+    ('stop_distance', 'd', '<f8')
+)
+JOURNAL_RECORD = struct.Struct('<' + ''.join(code for _, code, _ in JOURNAL_FIELDS))
+JOURNAL_DTYPE = np.dtype([(name, dtype) for name, _, dtype in JOURNAL_FIELDS])
+JOURNAL_MAGIC = b'APEXJRNL'
+JOURNAL_HEADER = struct.Struct('<8sII')  # magic, version, record size
+JOURNAL_VERSION = 1
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue records as-is so message formatting happens on the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_trading_logging(log_path: str = 'apex_sniper_trading.log',
+                              level: int = logging.INFO,
+                              console: bool = True) -> QueueListener:
+    """
+    Route the APEX Sniper loggers through a background writer
+
+    Idempotent: later calls return the running listener unchanged.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(log_path)]
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    _queue_handler = _DeferredQueueHandler(records)
+    logger = logging.getLogger(TRADING_LOGGER)
+    logger.addHandler(_queue_handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    atexit.register(shutdown_trading_logging)
+    return _listener
+
+
+def shutdown_trading_logging() -> None:
+    """Drain queued records to disk and detach the queue handler"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    logging.getLogger(TRADING_LOGGER).removeHandler(_queue_handler)
+    _listener = None
+    _queue_handler = None
+
+
+def configure_worker_logging(level: int = logging.WARNING) -> QueueListener:
+    """
+    Trading logging for a pool worker process, at ``level``
+
+    A forked worker inherits the parent's queue handler but not its listener
+    thread, so records would queue with nothing to write them. The queue and
+    listener are restarted over the inherited handlers (a spawned worker
+    configures its own), and the listener is drained when the worker exits.
+    """
+    global _listener, _queue_handler
+    logger = logging.getLogger(TRADING_LOGGER)
+    if _listener is None:
+        configure_trading_logging(level=level)
+    else:
+        logger.removeHandler(_queue_handler)
+        records = queue.SimpleQueue()
+        _listener = QueueListener(records, *_listener.handlers, respect_handler_level=True)
+        _listener.start()
+        _queue_handler = _DeferredQueueHandler(records)
+        logger.addHandler(_queue_handler)
+    logger.setLevel(level)
+    # Pool workers leave through os._exit, which skips atexit
+    multiprocessing_util.Finalize(None, shutdown_trading_logging, exitpriority=10)
+    return _listener
+
+
+class EventJournal:
+    """
+    Append-only binary journal of signal and sizing events
+
+    Args:
+        path: Journal file; new records are appended to an existing journal
+        max_batch: Most records written per write() call
+    """
+
+    _CLOSE = object()
+
+    def __init__(self, path: str, max_batch: int = 4096):
+        self.path = path
+        self.max_batch = max_batch
+        self.records_written = 0
+        self._queue = queue.SimpleQueue()
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            _check_header(path)
+        self._file = open(path, 'ab')
+        if not exists:
+            self._file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, JOURNAL_RECORD.size))
+
+        self._thread = threading.Thread(target=self._write_loop, name='apex-event-journal', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, event: int, symbol: str, signal_type: int, market_regime: int,
+               technical_confluence: int, quantum_probability: float, entry_price: float,
+               stop_loss: float, profit_targets: Sequence[float], contracts: int,
+               risk_amount: float, stop_distance: float) -> None:
+        """Pack one event and hand it to the writer thread"""
+        targets = (list(profit_targets) + [float('nan')] * 3)[:3]
+        self._queue.put(JOURNAL_RECORD.pack(
+            event, time.time_ns(), symbol.encode()[:8], signal_type, market_regime,
+            technical_confluence, quantum_probability, entry_price, stop_loss,
+            targets[0], targets[1], targets[2], contracts, risk_amount, stop_distance
+        ))
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = []
+            closing = item is self._CLOSE
+            if not closing:
+                batch.append(item)
+            while not closing and len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._CLOSE:
+                    closing = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._file.write(b''.join(batch))
+                self._file.flush()
+                self.records_written += len(batch)
+            if closing:
+                return
+
+    def close(self) -> None:
+        """Write everything queued so far and close the file"""
+        if self._file.closed:
+            return
+        self._queue.put(self._CLOSE)
+        self._thread.join()
+        self._file.close()
+
+
+def _check_header(path: str) -> None:
+    with open(path, 'rb') as handle:
+        magic, version, record_size = JOURNAL_HEADER.unpack(handle.read(JOURNAL_HEADER.size))
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION or record_size != JOURNAL_RECORD.size:
+        raise ValueError(f"{path} is not a version {JOURNAL_VERSION} APEX Sniper event journal")
+
+
+def read_journal(path: str) -> np.ndarray:
+    """Memory-map a journal as a structured array of JOURNAL_DTYPE records"""
+    _check_header(path)
+    records = (os.path.getsize(path) - JOURNAL_HEADER.size) // JOURNAL_RECORD.size
+    if records == 0:
+        return np.empty(0, dtype=JOURNAL_DTYPE)
+    return np.memmap(path, dtype=JOURNAL_DTYPE, mode='r', offset=JOURNAL_HEADER.size, shape=(records,))
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+PSYBERHERD™ APEX Sniper - Parallel Walk-Forward Optimization
+Rolling in-sample selection and out-of-sample validation on a process pool
+
+History is split into rolling (or anchored) folds of an in-sample window
+followed by an out-of-sample window. On every fold the parameter set with
+the best in-sample metric is chosen and judged on the next window only.
+
+Indicators and signals at a bar depend only on that bar and earlier ones,
+so a parameter set's signal pass over the full history is the same for
+every fold. Each pool task therefore runs one full-history pass per
+parameter set and backtests every fold's windows against slices of it;
+the folds of a task share that pass, and the worker's IndicatorCache
+shares EMAs, RSI and ranges between parameter sets that use the same
+periods. Total cost is one signal pass per parameter set plus
+folds x parameter sets window simulations, instead of a full backtest for
+each of them.
+
+Author: PSYBERHERD Brain Trust - Edgar Perez Strategic Advisory
+Version: 1.0.0
+Classification: Family Office Proprietary Trading Algorithm
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+import parameter_optimizer
+from backtester import APEXSniperStrategy, VectorizedBacktester
+from parameter_optimizer import SharedOHLCV, apply_parameters, grid_search_space
+from trading_log import TRADING_LOGGER
+
+logger = logging.getLogger(TRADING_LOGGER)
+
+FOLD_METRICS = ('num_trades', 'total_pnl', 'max_drawdown', 'max_drawdown_pct', 'win_rate')
+
+
+def walk_forward_folds(bars: int, in_sample_bars: int, out_of_sample_bars: int,
+                       step: Optional[int] = None, start: int = 0,
+                       anchored: bool = False) -> List[Dict]:
+    """
+    Fold boundaries as half-open bar ranges
+
+    Args:
+        bars: History length
+        in_sample_bars: Optimization window length (the first one when anchored)
+        out_of_sample_bars: Validation window length
+        step: Bars between fold starts, defaults to out_of_sample_bars
+        start: First in-sample bar
+        anchored: Grow the in-sample window from ``start`` instead of rolling it
+
+    Returns:
+        List[Dict]: 'fold', 'in_sample' and 'out_of_sample' (start, stop) per fold
+    """
+    if in_sample_bars <= 0 or out_of_sample_bars <= 0:
+        raise ValueError("Fold windows must be positive")
+    step = step or out_of_sample_bars
+    folds = []
+    in_sample_start = start
+    while True:
+        in_sample_stop = in_sample_start + in_sample_bars + (len(folds) * step if anchored else 0)
+        out_of_sample_stop = in_sample_stop + out_of_sample_bars
+        if out_of_sample_stop > bars:
+            return folds
+        folds.append({
+            'fold': len(folds),
+            'in_sample': (in_sample_start, in_sample_stop),
+            'out_of_sample': (in_sample_stop, out_of_sample_stop)
+        })
+        if not anchored:
+            in_sample_start += step
+
+
+def _evaluate_folds(task_id: int, params: Dict, folds: List[Dict], capital: float, seed: int,
+                    backtest_options: Dict) -> Dict:
+    """One full-history signal pass for ``params``, then every fold's windows against it"""
+    started = time.perf_counter()
+    data = parameter_optimizer._worker_data
+    indicators, entry_criteria = apply_parameters(params)
+    strategy = APEXSniperStrategy(capital=capital, indicators=indicators,
+                                  entry_criteria=entry_criteria, random_seed=seed)
+    signals = strategy.generate_signals(data)
+    signal_seconds = time.perf_counter() - started
+
+    backtester = VectorizedBacktester(strategy, **backtest_options)
+    windows = []
+    for fold in folds:
+        window = {'fold': fold['fold']}
+        for phase in ('in_sample', 'out_of_sample'):
+            first, last = fold[phase]
+            summary = backtester.run(data.iloc[first:last], signals.window(first, last)).summary()
+            window[phase] = {metric: summary[metric] for metric in FOLD_METRICS}
+        windows.append(window)
+
+    return {
+        'task_id': task_id,
+        'params': params,
+        'worker_pid': os.getpid(),
+        'signal_seconds': signal_seconds,
+        'task_seconds': time.perf_counter() - started,
+        'windows': windows
+    }
+
+
+@dataclass
+class WalkForwardResult:
+    """Per-fold selections, every candidate's window metrics and the out-of-sample totals"""
+    folds: pd.DataFrame
+    candidates: pd.DataFrame
+    out_of_sample_pnl: float
+    out_of_sample_trades: int
+    walk_forward_efficiency: float
+    elapsed_seconds: float
+
+
+class WalkForwardOptimizer:
+    """
+    Walk-forward optimization of indicators / entry_criteria on a process pool
+
+    Args:
+        ohlcv_data: Full history, published once to workers through shared memory
+        in_sample_bars, out_of_sample_bars, step, start, anchored: See walk_forward_folds
+        metric: In-sample FOLD_METRICS key to maximize
+        max_workers: Pool size, defaults to the CPU count
+        backtest_options: Keyword arguments for VectorizedBacktester
+        seed: Quantum probability seed shared by every parameter set, so
+            candidates are compared on the same random draws
+    """
+
+    def __init__(self, ohlcv_data: pd.DataFrame, in_sample_bars: int, out_of_sample_bars: int,
+                 step: Optional[int] = None, start: int = 0, anchored: bool = False,
+                 metric: str = 'total_pnl', capital: float = 1000000,
+                 max_workers: Optional[int] = None, backtest_options: Optional[Dict] = None,
+                 seed: int = 0):
+        if metric not in FOLD_METRICS:
+            raise ValueError(f"Unknown walk-forward metric: {metric}")
+        self.ohlcv_data = ohlcv_data
+        self.folds = walk_forward_folds(len(ohlcv_data), in_sample_bars, out_of_sample_bars,
+                                        step=step, start=start, anchored=anchored)
+        if not self.folds:
+            raise ValueError("History is too short for a single in-sample/out-of-sample fold")
+        self.metric = metric
+        self.capital = capital
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.backtest_options = backtest_options or {}
+        self.seed = seed
+
+    def run(self, parameter_sets: Sequence[Dict]) -> WalkForwardResult:
+        """Evaluate every parameter set on every fold, then select per fold in-sample"""
+        started = time.perf_counter()
+        results = []
+        with SharedOHLCV(self.ohlcv_data) as shared, ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=parameter_optimizer._init_worker,
+                initargs=(shared.handle,)) as pool:
+            futures = [
+                pool.submit(_evaluate_folds, task_id, params, self.folds, self.capital,
+                            self.seed, self.backtest_options)
+                for task_id, params in enumerate(parameter_sets)
+            ]
+            for future in as_completed(futures):
+                results.append(future.result())
+        results.sort(key=lambda result: result['task_id'])
+
+        rows = []
+        for result in results:
+            for window in result['windows']:
+                row = {'fold': window['fold'], 'task_id': result['task_id'], **result['params']}
+                for phase in ('in_sample', 'out_of_sample'):
+                    row.update({f"{phase}_{metric}": value for metric, value in window[phase].items()})
+                rows.append(row)
+        candidates = pd.DataFrame(rows)
+
+        # Ties go to the earliest parameter set
+        ranking = candidates.sort_values(['fold', f"in_sample_{self.metric}", 'task_id'],
+                                         ascending=[True, False, True], kind='stable')
+        selected = ranking.groupby('fold', sort=True).head(1).reset_index(drop=True)
+        bounds = pd.DataFrame([{
+            'fold': fold['fold'],
+            'in_sample_start': fold['in_sample'][0],
+            'in_sample_stop': fold['in_sample'][1],
+            'out_of_sample_start': fold['out_of_sample'][0],
+            'out_of_sample_stop': fold['out_of_sample'][1]
+        } for fold in self.folds])
+        folds = bounds.merge(selected, on='fold')
+
+        in_sample_total = folds['in_sample_total_pnl'].sum()
+        out_of_sample_total = float(folds['out_of_sample_total_pnl'].sum())
+        # Out-of-sample P&L per bar against in-sample P&L per bar
+        in_sample_rate = in_sample_total / (bounds['in_sample_stop'] - bounds['in_sample_start']).sum()
+        out_of_sample_rate = out_of_sample_total / (
+            bounds['out_of_sample_stop'] - bounds['out_of_sample_start']).sum()
+        efficiency = float(out_of_sample_rate / in_sample_rate) if in_sample_rate > 0 else float('nan')
+
+        elapsed = time.perf_counter() - started
+        signal_seconds = sum(result['signal_seconds'] for result in results)
+        busy = sum(result['task_seconds'] for result in results)
+        logger.info("APEX Sniper walk-forward: %d parameter sets x %d folds in %.2fs on %d workers "
+                    "(%.2fs in full-history signal passes, %.2fs in fold backtests)",
+                    len(results), len(self.folds), elapsed, self.max_workers,
+                    signal_seconds, busy - signal_seconds)
+
+        return WalkForwardResult(
+            folds=folds,
+            candidates=candidates,
+            out_of_sample_pnl=out_of_sample_total,
+            out_of_sample_trades=int(folds['out_of_sample_num_trades'].sum()),
+            walk_forward_efficiency=efficiency,
+            elapsed_seconds=elapsed
+        )
+
+    def grid_search(self, grid: Dict[str, Sequence]) -> WalkForwardResult:
+        return self.run(grid_search_space(grid))
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    bars = 100_000
+    rng = np.random.default_rng(7)
+    close = 70 + np.cumsum(rng.standard_normal(bars) * 0.02)
+    sample_data = pd.DataFrame({
+        'timestamp': pd.date_range(start='2022-01-01', periods=bars, freq='1min'),
+        'open': close + rng.standard_normal(bars) * 0.005,
+        'high': close + np.abs(rng.standard_normal(bars)) * 0.03,
+        'low': close - np.abs(rng.standard_normal(bars)) * 0.03,
+        'close': close,
+        'volume': rng.integers(1000, 10000, bars)
+    })
+
+    optimizer = WalkForwardOptimizer(sample_data, in_sample_bars=20_000, out_of_sample_bars=10_000)
+    result = optimizer.grid_search({
+        'indicators.momentum.rsi_period': [10, 14, 21],
+        'indicators.trend.ema_fast': [5, 9, 13],
+        'entry_criteria.min_confluence_signals': [2, 3],
+        'entry_criteria.min_risk_reward_ratio': [1.3]
+    })
+    print(result.folds.to_string())
+    print(f"Out-of-sample P&L: ${result.out_of_sample_pnl:,.2f} over {result.out_of_sample_trades} trades, "
+          f"walk-forward efficiency {result.walk_forward_efficiency:.2f}")